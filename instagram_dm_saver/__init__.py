@@ -8,7 +8,6 @@ multiple export formats, secure credential storage, and robust error handling.
 __version__ = "2.0.0"
 __author__ = "Instagram DM Saver Team"
 
-from .core import InstagramAuthenticator, MessageManager
 from .storage import AppConfig, get_config, CredentialManager, MessageExporter
 from .utils import (
     InstagramDMError,
@@ -39,3 +38,11 @@ __all__ = [
     "__version__",
     "__author__",
 ]
+
+
+def __getattr__(name):
+    """Import the core classes on first use, since they pull in instagrapi."""
+    if name in ("InstagramAuthenticator", "MessageManager"):
+        from . import core
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,17 +5,20 @@ Instagram DM Fetcher - Command Line Interface
 A professional CLI tool for fetching and saving Instagram direct messages.
 """
 
+import argparse
+import os
+import re
 import sys
-import logging
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
 from rich.panel import Panel
-from rich.table import Table
+from rich.style import Style
+from rich.text import Text
 
-from instagram_dm_saver.core import InstagramAuthenticator, MessageManager
 from instagram_dm_saver.storage import AppConfig, get_config, CredentialManager, MessageExporter
 from instagram_dm_saver.utils import (
     InstagramDMError,
@@ -23,12 +26,29 @@ from instagram_dm_saver.utils import (
     TwoFactorRequired,
     MessageFetchError,
     ConversationError,
+    LOG_LEVELS,
     setup_logger,
     get_logger,
+    tail_log,
+    build_username_map,
 )
 
+if TYPE_CHECKING:
+    from instagram_dm_saver.core import InstagramAuthenticator, MessageManager
+
 console = Console()
 
+# Log level names as they appear in log lines
+LOG_LEVEL_PATTERN = re.compile(r"\b(ERROR|CRITICAL|WARNING|INFO)\b")
+
+# Log viewer style per level; other lines are printed unstyled
+LOG_LEVEL_STYLES = {
+    "ERROR": Style(color="red"),
+    "CRITICAL": Style(color="red"),
+    "WARNING": Style(color="yellow"),
+    "INFO": Style(color="green"),
+}
+
 
 class InstagramDMCLI:
     """Command-line interface for Instagram DM Fetcher."""
@@ -37,18 +57,29 @@ class InstagramDMCLI:
         """Initialize CLI application."""
         self.config: AppConfig = get_config()
 
-        # Setup logging
-        log_level = getattr(logging, self.config.log_level)
+        # Setup logging (handlers are only attached the first time)
         self.logger = setup_logger(
             "instagram_dm_saver",
-            log_level=log_level,
+            log_level=LOG_LEVELS[self.config.log_level],
             log_dir=self.config.log_dir,
             console_output=False  # We use Rich for console output
         )
 
-        self.authenticator: Optional[InstagramAuthenticator] = None
-        self.message_manager: Optional[MessageManager] = None
+        self.authenticator: Optional["InstagramAuthenticator"] = None
+        self.message_manager: Optional["MessageManager"] = None
         self.credential_manager = CredentialManager(self.config.credential_storage)
+        # (message count, future) for each background export not yet reported
+        self._pending_exports: List[Tuple[int, Future]] = []
+
+        # Main menu choice -> handler; any other choice exits
+        self._actions: Dict[str, Callable[[], None]] = {
+            "1": self._fetch_messages_flow,
+            "2": self._configure_save_directory,
+            "3": self._configure_credentials,
+            "4": self._manage_credentials,
+            "5": self._configure_settings,
+            "6": self._view_logs,
+        }
 
     def run(self) -> None:
         """Run the CLI application."""
@@ -56,23 +87,12 @@ class InstagramDMCLI:
 
         try:
             while True:
-                choice = self._display_main_menu()
-
-                if choice == "1":
-                    self._fetch_messages_flow()
-                elif choice == "2":
-                    self._configure_save_directory()
-                elif choice == "3":
-                    self._configure_credentials()
-                elif choice == "4":
-                    self._manage_credentials()
-                elif choice == "5":
-                    self._configure_settings()
-                elif choice == "6":
-                    self._view_logs()
-                elif choice == "7":
+                self._report_finished_exports()
+                action = self._actions.get(self._display_main_menu())
+                if action is None:
                     break
 
+                action()
                 console.print()  # Add spacing
 
         except KeyboardInterrupt:
@@ -82,6 +102,7 @@ class InstagramDMCLI:
             console.print(f"[bold red]Unexpected error: {e}[/bold red]")
             console.print("[yellow]Check logs for details[/yellow]")
         finally:
+            self._wait_for_exports()
             console.print("[bold green]Thank you for using Instagram DM Fetcher![/bold green]")
 
     def _display_welcome(self) -> None:
@@ -105,8 +126,6 @@ Fetch and save your Instagram DMs with:
         Returns:
             User's menu choice
         """
-        console.print("\n[bold]Main Menu:[/bold]")
-
         options = [
             "1. Fetch direct messages",
             "2. Configure save directory",
@@ -117,8 +136,7 @@ Fetch and save your Instagram DMs with:
             "7. Exit"
         ]
 
-        for option in options:
-            console.print(option)
+        console.print("\n[bold]Main Menu:[/bold]\n" + "\n".join(options))
 
         return Prompt.ask(
             "\nSelect an option",
@@ -128,15 +146,27 @@ Fetch and save your Instagram DMs with:
 
     def _fetch_messages_flow(self) -> None:
         """Main flow for fetching messages."""
+        # instagrapi is only loaded once the user actually fetches, so the
+        # menu and settings screens start without it
+        from instagram_dm_saver.core import InstagramAuthenticator, MessageManager
+
+        # Runs lookups that overlap with the requests and prompts of this flow
+        prefetch = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+
         try:
             # Authenticate
             if not self.authenticator:
-                self.authenticator = InstagramAuthenticator(self.config)
+                self.authenticator = InstagramAuthenticator(
+                    self.config, self.credential_manager
+                )
 
             client = self.authenticator.login()
 
             self.message_manager = MessageManager(client)
 
+            # Overlap resolving our own username with fetching conversations
+            username_future = self._lookup_current_username(prefetch, client)
+
             # Fetch and display conversations
             while True:
                 try:
@@ -167,12 +197,20 @@ Fetch and save your Instagram DMs with:
                     messages = self.message_manager.fetch_messages(thread, count)
 
                     if messages:
+                        # One username mapping for both display and export
+                        current_username = username_future.result()
+                        usernames = build_username_map(
+                            thread.users, client.user_id, current_username
+                        )
+
                         # Display messages
-                        self.message_manager.display_messages(thread, messages, client)
+                        self.message_manager.display_messages(
+                            thread, messages, client, usernames=usernames
+                        )
 
                         # Save to file
                         if Confirm.ask("\nDo you want to save these messages to a file?", default=True):
-                            self._save_messages(thread, messages, client)
+                            self._save_messages(thread, messages, client, current_username, usernames)
                     else:
                         console.print("[yellow]No messages were retrieved.[/yellow]")
 
@@ -181,6 +219,8 @@ Fetch and save your Instagram DMs with:
                         break
 
                 except (MessageFetchError, ConversationError) as e:
+                    # The session may have expired; check it on the next start
+                    self.authenticator.invalidate_session_validation()
                     console.print(f"[red]Error: {e}[/red]")
                     if not Confirm.ask("Do you want to try again?", default=True):
                         break
@@ -191,8 +231,42 @@ Fetch and save your Instagram DMs with:
         except Exception as e:
             console.print(f"[bold red]Error: {e}[/bold red]")
             self.logger.error(f"Error in fetch flow: {e}", exc_info=True)
+        finally:
+            prefetch.shutdown(wait=False, cancel_futures=True)
 
-    def _save_messages(self, thread, messages, client) -> None:
+    @staticmethod
+    def _lookup_current_username(executor: ThreadPoolExecutor, client) -> Future:
+        """
+        Resolve the logged-in account's username without blocking.
+
+        When the client doesn't know its username (e.g. a resumed session), the
+        profile request runs on the executor with a cloned client, since an
+        instagrapi client can't serve two requests at once.
+
+        Args:
+            executor: Executor for the profile request
+            client: Authenticated Instagram client
+
+        Returns:
+            Future resolving to the username
+        """
+        from instagram_dm_saver.core import MessageManager, clone_client
+
+        if username := getattr(client, "username", None):
+            future: Future = Future()
+            future.set_result(username)
+            return future
+
+        return executor.submit(MessageManager.get_current_username, clone_client(client))
+
+    def _save_messages(
+        self,
+        thread,
+        messages,
+        client,
+        current_username: str = "You",
+        usernames: Optional[Dict] = None
+    ) -> None:
         """
         Save messages to file.
 
@@ -200,6 +274,8 @@ Fetch and save your Instagram DMs with:
             thread: DirectThread object
             messages: List of DirectMessage objects
             client: Instagram client
+            current_username: Username of the logged-in account
+            usernames: User ID to username mapping already built for display
         """
         # Choose format
         format_options = {
@@ -208,30 +284,64 @@ Fetch and save your Instagram DMs with:
             "3": "CSV - Spreadsheet compatible format"
         }
 
-        console.print("\n[bold]Choose file format:[/bold]")
-        for key, value in format_options.items():
-            console.print(f"{key}. {value}")
+        console.print("\n[bold]Choose file format:[/bold]\n" + "\n".join(
+            f"{key}. {value}" for key, value in format_options.items()
+        ))
 
         format_choice = Prompt.ask("Select format", choices=["1", "2", "3"], default="1")
         format_map = {"1": "txt", "2": "json", "3": "csv"}
         file_format = format_map[format_choice]
 
-        try:
-            exporter = MessageExporter(self.config.save_dir)
-            output_path = exporter.export(
-                thread,
-                messages,
-                format=file_format,
-                current_user_id=client.user_id,
-                current_username=client.username if hasattr(client, 'username') else "You"
-            )
-
-            console.print(f"[green]Messages saved to:[/green] {output_path}")
-            self.logger.info(f"Saved {len(messages)} messages to {output_path}")
+        exporter = MessageExporter(self.config.save_dir)
+        future = exporter.export_in_background(
+            thread,
+            messages,
+            format=file_format,
+            current_user_id=client.user_id,
+            current_username=current_username,
+            username_map=usernames
+        )
+        # Reported from the main loop; printing from the export thread would
+        # interleave with whatever prompt is showing
+        self._pending_exports.append((len(messages), future))
+
+        console.print("[cyan]Saving messages in the background...[/cyan]")
+
+    def _report_finished_exports(self) -> None:
+        """Report background exports that have finished since the last check."""
+        still_running = []
+        for message_count, future in self._pending_exports:
+            if future.done():
+                self._report_export(message_count, future)
+            else:
+                still_running.append((message_count, future))
+        self._pending_exports = still_running
+
+    def _report_export(self, message_count: int, future: Future) -> None:
+        """
+        Report the result of a background export.
 
+        Args:
+            message_count: Number of messages exported
+            future: Completed export future
+        """
+        try:
+            output_path = future.result()
         except Exception as e:
             console.print(f"[red]Failed to save messages: {e}[/red]")
             self.logger.error(f"Failed to save messages: {e}", exc_info=True)
+            return
+
+        console.print(f"[green]Messages saved to:[/green] {output_path}")
+        self.logger.info(f"Saved {message_count} messages to {output_path}")
+
+    def _wait_for_exports(self) -> None:
+        """Block until all queued background exports have finished."""
+        pending = [future for _, future in self._pending_exports if not future.done()]
+        if pending:
+            with console.status("[cyan]Finishing pending saves...[/cyan]"):
+                wait(pending)
+        self._report_finished_exports()
 
     def _configure_save_directory(self) -> None:
         """Configure save directory."""
@@ -240,14 +350,17 @@ Fetch and save your Instagram DMs with:
         if Confirm.ask("Do you want to change the save directory?"):
             new_dir = Prompt.ask("Enter new save directory path", default=str(self.config.save_dir))
 
+            new_path = Path(new_dir)
+            if new_path == self.config.save_dir:
+                console.print("[yellow]Save directory unchanged[/yellow]")
+                return
+
             try:
-                new_path = Path(new_dir)
                 new_path.mkdir(parents=True, exist_ok=True)
 
                 # Test write permissions
-                test_file = new_path / ".test_write"
-                test_file.touch()
-                test_file.unlink()
+                if not os.access(new_path, os.W_OK | os.X_OK):
+                    raise PermissionError(f"{new_path} is not writable")
 
                 self.config.save_dir = new_path
                 self.config.save()
@@ -272,11 +385,13 @@ Fetch and save your Instagram DMs with:
         console.print(f"\n[bold]Current method:[/bold] [cyan]{method_names[current]}[/cyan]")
 
         if Confirm.ask("Do you want to change the credential storage method?"):
-            console.print("\n[bold]Available methods:[/bold]")
-            console.print("1. System Keyring (Recommended - Most Secure)")
-            console.print("2. Encrypted File Storage (Portable)")
-            console.print("3. Environment Variables Only")
-            console.print("4. No Storage (Always Ask)")
+            console.print(
+                "\n[bold]Available methods:[/bold]\n"
+                "1. System Keyring (Recommended - Most Secure)\n"
+                "2. Encrypted File Storage (Portable)\n"
+                "3. Environment Variables Only\n"
+                "4. No Storage (Always Ask)"
+            )
 
             choice = Prompt.ask("Select method", choices=["1", "2", "3", "4"], default="1")
 
@@ -291,6 +406,11 @@ Fetch and save your Instagram DMs with:
             self.config.credential_storage = new_method
             self.config.save()
 
+            # The authenticator shares this manager, so swap it in both places
+            self.credential_manager = CredentialManager(new_method)
+            if self.authenticator:
+                self.authenticator.credential_manager = self.credential_manager
+
             console.print(f"[green]Credential storage method updated to: {method_names[new_method]}[/green]")
             self.logger.info(f"Credential storage changed to {new_method}")
 
@@ -314,6 +434,8 @@ Fetch and save your Instagram DMs with:
         """Configure application settings."""
         console.print("\n[bold cyan]Application Settings[/bold cyan]\n")
 
+        from rich.table import Table
+
         # Display current settings
         table = Table(title="Current Settings")
         table.add_column("Setting", style="cyan")
@@ -345,10 +467,11 @@ Fetch and save your Instagram DMs with:
             console.print("\nLog levels: DEBUG, INFO, WARNING, ERROR, CRITICAL")
             new_level = Prompt.ask(
                 "Log level",
-                choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+                choices=list(LOG_LEVELS),
                 default=self.config.log_level
             )
             self.config.log_level = new_level
+            self.logger.setLevel(LOG_LEVELS[new_level])
 
             # Save
             self.config.save()
@@ -367,22 +490,20 @@ Fetch and save your Instagram DMs with:
             # Read last N lines
             num_lines = int(Prompt.ask("How many log lines to display?", default="50"))
 
-            with open(log_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                recent_lines = lines[-num_lines:]
+            recent_lines = tail_log(log_file, num_lines)
 
             console.print(f"\n[bold]Last {len(recent_lines)} log entries:[/bold]\n")
 
+            # Color code by log level, building styled text directly so Rich
+            # neither parses markup nor runs its highlighter on every line
+            output = Text()
             for line in recent_lines:
-                # Color code by log level
-                if "ERROR" in line or "CRITICAL" in line:
-                    console.print(f"[red]{line.strip()}[/red]")
-                elif "WARNING" in line:
-                    console.print(f"[yellow]{line.strip()}[/yellow]")
-                elif "INFO" in line:
-                    console.print(f"[green]{line.strip()}[/green]")
-                else:
-                    console.print(line.strip())
+                match = LOG_LEVEL_PATTERN.search(line)
+                style = LOG_LEVEL_STYLES[match.group(1)] if match else ""
+                output.append(line.strip() + "\n", style=style)
+            output.rstrip()
+
+            console.print(output, highlight=False)
 
             console.print(f"\n[cyan]Full log file: {log_file}[/cyan]")
 
@@ -390,11 +511,176 @@ Fetch and save your Instagram DMs with:
             console.print(f"[red]Error reading log file: {e}[/red]")
 
 
-def main() -> None:
-    """Main entry point for CLI application."""
+    def list_conversations(self) -> None:
+        """Print thread IDs and participants, one conversation per line."""
+        from instagram_dm_saver.core import MessageManager
+
+        client = self._login_non_interactive()
+        threads = MessageManager(client).get_conversations()
+
+        console.print(
+            "\n".join(
+                f"{thread.id}\t{', '.join([user.username for user in thread.users])}"
+                for thread in threads
+            ),
+            markup=False,
+            highlight=False
+        )
+
+    def fetch_to_file(
+        self,
+        thread_ids: List[str],
+        count: Optional[int] = None,
+        file_format: Optional[str] = None,
+        output_dir: Optional[Path] = None
+    ) -> List[Path]:
+        """
+        Fetch messages from conversations and export each one without prompts.
+
+        Several conversations are fetched concurrently; each is saved to its
+        own file.
+
+        Args:
+            thread_ids: Instagram thread IDs
+            count: Number of messages to fetch per conversation (config default if None)
+            file_format: Export format (config default if None)
+            output_dir: Directory to save to (config save_dir if None)
+
+        Returns:
+            Paths to the exported files
+
+        Raises:
+            MessageFetchError: If any conversation could not be fetched; the
+                others are still saved
+        """
+        from instagram_dm_saver.core import MessageManager
+
+        client = self._login_non_interactive()
+        manager = MessageManager(client)
+        count = count or self.config.default_message_count
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch") as prefetch:
+            username_future = self._lookup_current_username(prefetch, client)
+
+            threads = [manager.get_conversation(thread_id) for thread_id in thread_ids]
+            if len(threads) == 1:
+                messages_by_thread = {threads[0].id: manager.fetch_messages(threads[0], count)}
+            else:
+                messages_by_thread = manager.fetch_messages_for_threads(threads, count)
+            current_username = username_future.result()
+
+        exporter = MessageExporter(output_dir or self.config.save_dir)
+        output_paths = []
+        for thread in threads:
+            messages = messages_by_thread.get(thread.id)
+            if messages is None:
+                console.print(f"[red]Failed to fetch messages from {thread.id}[/red]")
+                continue
+
+            output_path = exporter.export(
+                thread,
+                messages,
+                format=file_format or self.config.default_export_format,
+                current_user_id=client.user_id,
+                current_username=current_username
+            )
+            output_paths.append(output_path)
+
+            console.print(f"[green]Saved {len(messages)} messages to:[/green] {output_path}")
+            self.logger.info(f"Saved {len(messages)} messages to {output_path}")
+
+        if len(output_paths) < len(threads):
+            failed = len(threads) - len(output_paths)
+            raise MessageFetchError(f"Failed to fetch {failed} of {len(threads)} conversations")
+        return output_paths
+
+    def _login_non_interactive(self):
+        """
+        Log in for a scripted command.
+
+        Returns:
+            Authenticated Instagram client
+
+        Raises:
+            TwoFactorRequired: If the account needs a verification code
+        """
+        from instagram_dm_saver.core import InstagramAuthenticator
+
+        self.authenticator = InstagramAuthenticator(self.config, self.credential_manager)
+        # Never stop a scripted run to ask for a 2FA code or about saving credentials
+        try:
+            return self.authenticator.login(save_credentials=False, prompt=False)
+        except TwoFactorRequired as e:
+            raise TwoFactorRequired(
+                "Two-factor authentication required; log in once with the interactive "
+                "menu to save a session, then run this command again"
+            ) from e
+
+
+def _positive_int(value: str) -> int:
+    """Parse a strictly positive integer command-line argument."""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be positive, got {number}")
+    return number
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser for scripted runs.
+
+    Returns:
+        Parser whose subcommands skip the interactive menu
+    """
+    parser = argparse.ArgumentParser(
+        prog="instagram-dm-saver",
+        description="Fetch and save Instagram direct messages. "
+                    "Run without a command for the interactive menu."
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    subparsers.add_parser("conversations", help="list conversations with their thread IDs")
+
+    fetch = subparsers.add_parser("fetch", help="fetch messages from conversations and save them")
+    fetch.add_argument(
+        "--thread",
+        dest="threads",
+        action="append",
+        required=True,
+        help="thread ID (see the conversations command); repeat to fetch several at once"
+    )
+    fetch.add_argument(
+        "--count", type=_positive_int, help="number of messages to fetch per conversation"
+    )
+    fetch.add_argument("--format", choices=["txt", "json", "csv"], help="export format")
+    fetch.add_argument("--output", type=Path, help="directory to save the export to")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for CLI application.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    """
+    args = _build_parser().parse_args(argv)
+
     try:
         cli = InstagramDMCLI()
-        cli.run()
+
+        if args.command == "conversations":
+            cli.list_conversations()
+        elif args.command == "fetch":
+            thread_ids = list(dict.fromkeys(args.threads))
+            cli.fetch_to_file(thread_ids, args.count, args.format, args.output)
+        else:
+            cli.run()
+    except InstagramDMError as e:
+        # Expected failures of a scripted command (login, fetch, export)
+        console.print(f"[bold red]Error: {e}[/bold red]")
+        sys.exit(1)
     except Exception as e:
         console.print(f"[bold red]Fatal error: {e}[/bold red]")
         console.print("[yellow]Please report this issue on GitHub[/yellow]")
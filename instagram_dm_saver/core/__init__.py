@@ -1,9 +1,10 @@
 """Core modules for Instagram authentication and message management."""
 
-from .auth import InstagramAuthenticator
+from .auth import InstagramAuthenticator, clone_client
 from .messages import MessageManager
 
 __all__ = [
     "InstagramAuthenticator",
+    "clone_client",
     "MessageManager",
 ]
@@ -1,36 +1,86 @@
 """Authentication and session management for Instagram."""
 
+from copy import deepcopy
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, Optional, Dict, Tuple
+import asyncio
 import getpass
+import mmap
+import time
 
 from instagrapi import Client
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
-from rich.progress import Progress
 
 from ..storage.config import AppConfig
 from ..storage.credentials import CredentialManager
 from ..utils.exceptions import AuthenticationError, TwoFactorRequired
 from ..utils.logger import get_logger
 from ..utils.rate_limiter import instagram_rate_limiter
+from ..utils.serialization import dumps, loads
 
 logger = get_logger(__name__)
 console = Console()
 
+# Session files at least this large are memory-mapped instead of read
+SESSION_MMAP_THRESHOLD = 64 * 1024
+
+# A saved session validated this recently (seconds) is trusted without a
+# timeline request
+SESSION_VALIDATION_TTL = 3600
+
+# Parsed session settings per session file, with the (mtime_ns, size) they
+# were read or written at, so an unchanged file isn't read and parsed again
+_SESSION_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def clone_client(client: Client) -> Client:
+    """
+    Create a separate client that shares another client's session.
+
+    instagrapi keeps the last response on the client instance (``last_json``),
+    so a client must never serve two requests at once. Work that runs in
+    parallel with other requests gets its own clone instead.
+
+    Args:
+        client: Authenticated Instagram client
+
+    Returns:
+        New client logged in with the same session settings
+    """
+    clone = Client()
+    clone.set_settings(client.get_settings())
+    if client.proxy:
+        clone.set_proxy(client.proxy)
+    return clone
+
+
+def _session_stamp(session_file: Path) -> Tuple[int, int]:
+    """Get the (mtime_ns, size) pair that identifies a session file's contents."""
+    stat = session_file.stat()
+    return stat.st_mtime_ns, stat.st_size
+
 
 class InstagramAuthenticator:
     """Handle Instagram authentication and session management."""
 
-    def __init__(self, config: AppConfig):
+    def __init__(
+        self,
+        config: AppConfig,
+        credential_manager: Optional[CredentialManager] = None
+    ):
         """
         Initialize authenticator.
 
         Args:
             config: Application configuration
+            credential_manager: Credential manager to share with the caller;
+                one is created from the config if not given
         """
         self.config = config
-        self.credential_manager = CredentialManager(config.credential_storage)
+        self.credential_manager = credential_manager or CredentialManager(
+            config.credential_storage
+        )
         self.client: Optional[Client] = None
 
     @instagram_rate_limiter
@@ -39,7 +89,8 @@ class InstagramAuthenticator:
         username: Optional[str] = None,
         password: Optional[str] = None,
         verification_code: Optional[str] = None,
-        save_credentials: bool = True
+        save_credentials: bool = True,
+        prompt: bool = True
     ) -> Client:
         """
         Login to Instagram with session persistence.
@@ -49,15 +100,23 @@ class InstagramAuthenticator:
             password: Instagram password (optional, will load from storage or prompt)
             verification_code: 2FA verification code (if required)
             save_credentials: Whether to save credentials after successful login
+            prompt: Whether to ask on the console for a 2FA code and before
+                saving credentials; without prompting, TwoFactorRequired is
+                raised and credentials are saved if save_credentials is set
 
         Returns:
             Authenticated Instagram client
 
         Raises:
+            TwoFactorRequired: If a 2FA code is needed and prompt is False
             AuthenticationError: If login fails
         """
         self.client = Client()
 
+        # Set once stored credentials were looked up, so a failed session
+        # doesn't make the fresh login ask the keyring a second time
+        checked_stored_credentials = False
+
         # Try to load existing session
         session_file = self.config.get_session_file()
         if session_file.exists():
@@ -65,85 +124,59 @@ class InstagramAuthenticator:
                 # We use a simple status spinner here to avoid blocking UI perception
                 with console.status("[cyan]Loading saved session...[/cyan]"):
                     logger.info("Attempting to load saved session...")
-                    self.client.load_settings(session_file)
 
-                    # Get credentials for session validation
-                    if not username or not password:
-                        creds = self.credential_manager.load_credentials()
-                        if creds:
-                            username = creds.get("username")
-                            password = creds.get("password")
+                    # Get credentials for session validation while the session loads
+                    need_credentials = not (username and password)
+                    creds = asyncio.run(
+                        self._load_session_and_credentials(session_file, need_credentials)
+                    )
+                    checked_stored_credentials = need_credentials
+                    if creds:
+                        username, password = creds.get("username"), creds.get("password")
 
                     if username and password:
                         self.client.login(username, password)
                         logger.info("Successfully loaded existing session")
                         console.print("[green]Successfully loaded session.[/green]")
                         return self.client
+                    elif self._session_recently_validated(session_file):
+                        logger.info("Session was validated recently, skipping check")
+                        console.print("[green]Session loaded.[/green]")
+                        return self.client
                     else:
                         # Try to verify session without login
                         self.client.get_timeline_feed()
+                        self._mark_session_validated(session_file)
                         logger.info("Session is still valid")
                         console.print("[green]Session is still valid.[/green]")
                         return self.client
 
             except Exception as e:
+                self.invalidate_session_validation()
                 logger.warning(f"Failed to load saved session: {e}")
                 console.print(f"[yellow]Failed to load saved session (will try fresh login): {e}[/yellow]")
                 # Continue with fresh login
 
         # Get credentials if not provided
-        if not username or not password:
-            creds = self._get_credentials()
-            username = creds["username"]
-            password = creds["password"]
-        
-        # Helper to perform the actual login call
-        def attempt_login(u, p, code=None):
-             with console.status("[cyan]Logging in to Instagram... (this may take a minute)[/cyan]", spinner="dots"):
-                if code:
-                    self.client.login(u, p, verification_code=code)
-                else:
-                    self.client.login(u, p)
+        if not (username and password):
+            creds = self._get_credentials(use_saved=not checked_stored_credentials)
+            username, password = creds["username"], creds["password"]
 
         # Perform login
         try:
             try:
-                attempt_login(username, password, verification_code)
-            except Exception as e:
-                error_msg = str(e)
-                if "two-factor authentication" in error_msg.lower() or "2fa" in error_msg.lower():
-                    logger.warning("Two-factor authentication required")
-                    console.print("[yellow]Two-factor authentication required[/yellow]")
-                    
-                    # Ask for code immediately
-                    code = Prompt.ask("Enter the verification code from your authenticator app")
-                    
-                    # Retry login with code
-                    attempt_login(username, password, code)
-                else:
-                    raise e
-            
-            logger.info(f"Successfully logged in as {username}")
-            console.print("[green]Login successful![/green]")
-
-            # Save session
-            try:
-                self.client.dump_settings(session_file)
-                logger.info(f"Session saved to {session_file}")
-            except Exception as e:
-                logger.warning(f"Failed to save session file: {e}")
-
-            # Save credentials if requested
-            if save_credentials:
-                # auto-save if we looked them up, or ask?
-                # The original logic asked. Let's keep asking but maybe smarter.
-                # If we loaded from cred manager, no need to ask again unless changed?
-                # Simplifying: just ask if the user hasn't saved them before / manual entry
-                if Confirm.ask("Save credentials for future use?", default=True):
-                    self.credential_manager.save_credentials(username, password)
+                self._do_login_call(username, password, verification_code)
+            except TwoFactorRequired:
+                if not prompt:
+                    raise
+                console.print("[yellow]Two-factor authentication required[/yellow]")
+                code = Prompt.ask("Enter the verification code from your authenticator app")
+                self._do_login_call(username, password, code)
 
-            return self.client
+            return self._complete_login(username, password, save_credentials, prompt)
 
+        except TwoFactorRequired:
+            raise
         except Exception as e:
             logger.error(f"Login failed: {e}")
             raise AuthenticationError(f"Login failed: {e}")
@@ -157,6 +190,9 @@ class InstagramAuthenticator:
         """
         Login with 2FA support (prompts for code).
 
+        When a code is needed only the login request is repeated; the saved
+        session and stored credentials are not loaded a second time.
+
         Args:
             username: Instagram username
             password: Instagram password
@@ -169,30 +205,231 @@ class InstagramAuthenticator:
             AuthenticationError: If login fails
         """
         try:
-            # First try without 2FA
-            return self.login(username, password, save_credentials=save_credentials)
+            # First try without 2FA; login() must raise instead of prompting
+            # for the code, so the credentials question is asked here
+            client = self.login(username, password, save_credentials=False, prompt=False)
+            self._offer_to_save_credentials(username, password, save_credentials, prompt=True)
+            return client
 
         except TwoFactorRequired:
             console.print("[yellow]Two-factor authentication required[/yellow]")
             verification_code = Prompt.ask("Enter the verification code from your authenticator app")
 
-            return self.login(
-                username,
-                password,
-                verification_code=verification_code,
-                save_credentials=save_credentials
-            )
+            try:
+                self._do_login_call(username, password, verification_code)
+                return self._complete_login(username, password, save_credentials, prompt=True)
+            except Exception as e:
+                logger.error(f"Login failed: {e}")
+                raise AuthenticationError(f"Login failed: {e}")
+
+    def _do_login_call(
+        self,
+        username: str,
+        password: str,
+        verification_code: Optional[str] = None
+    ) -> None:
+        """
+        Make the Instagram login request, and nothing else.
+
+        Args:
+            username: Instagram username
+            password: Instagram password
+            verification_code: 2FA verification code, if one was requested
+
+        Raises:
+            TwoFactorRequired: If Instagram asks for a verification code
+        """
+        try:
+            with console.status(
+                "[cyan]Logging in to Instagram... (this may take a minute)[/cyan]", spinner="dots"
+            ):
+                if verification_code:
+                    self.client.login(username, password, verification_code=verification_code)
+                else:
+                    self.client.login(username, password)
+        except Exception as e:
+            error_msg = str(e).lower()
+            if "two-factor authentication" in error_msg or "2fa" in error_msg:
+                logger.warning("Two-factor authentication required")
+                raise TwoFactorRequired(str(e)) from e
+            raise
+
+    def _complete_login(
+        self,
+        username: str,
+        password: str,
+        save_credentials: bool,
+        prompt: bool
+    ) -> Client:
+        """
+        Save the session and, if requested, the credentials after a successful login.
+
+        Args:
+            username: Instagram username
+            password: Instagram password
+            save_credentials: Whether to save credentials
+            prompt: Whether to ask before saving credentials
+
+        Returns:
+            Authenticated Instagram client
+        """
+        logger.info(f"Successfully logged in as {username}")
+        console.print("[green]Login successful![/green]")
+
+        session_file = self.config.get_session_file()
+        try:
+            self._save_session(session_file)
+            logger.info(f"Session saved to {session_file}")
+        except Exception as e:
+            logger.warning(f"Failed to save session file: {e}")
+
+        self._offer_to_save_credentials(username, password, save_credentials, prompt)
+        return self.client
+
+    def _offer_to_save_credentials(
+        self,
+        username: str,
+        password: str,
+        save_credentials: bool,
+        prompt: bool
+    ) -> None:
+        """
+        Save credentials after a successful login, asking first when prompting.
+
+        Args:
+            username: Instagram username
+            password: Instagram password
+            save_credentials: Whether to save credentials
+            prompt: Whether to ask before saving credentials
+        """
+        if save_credentials and (
+            not prompt or Confirm.ask("Save credentials for future use?", default=True)
+        ):
+            self.credential_manager.save_credentials(username, password)
+
+    def _load_session(self, session_file: Path) -> None:
+        """
+        Load saved session settings into the client.
+
+        Settings already parsed from an unchanged file are reused. Otherwise
+        large session files are parsed straight from a read-only memory map
+        and small ones are read in one call.
+
+        Args:
+            session_file: Path to session file
+        """
+        stamp = _session_stamp(session_file)
+        cached = _SESSION_CACHE.get(session_file)
+        if cached and cached[0] == stamp:
+            settings = cached[1]
+        else:
+            if stamp[1] < SESSION_MMAP_THRESHOLD:
+                settings = loads(session_file.read_bytes())
+            else:
+                with open(session_file, "rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        with memoryview(mm) as view:
+                            settings = loads(view)
+            _SESSION_CACHE[session_file] = (stamp, settings)
+
+        # set_settings keeps its own deep copy, so the cached dict stays intact
+        self.client.set_settings(settings)
+
+    async def _load_session_and_credentials(
+        self,
+        session_file: Path,
+        need_credentials: bool
+    ) -> Optional[Dict[str, str]]:
+        """
+        Load the saved session, looking up stored credentials at the same time.
+
+        Reading the session file and a keyring round-trip are both blocking,
+        so they run in worker threads and overlap.
+
+        Args:
+            session_file: Path to session file
+            need_credentials: Whether to look up stored credentials
+
+        Returns:
+            Stored credentials, or None if not needed or not found
+        """
+        load = asyncio.to_thread(self._load_session, session_file)
+        if not need_credentials:
+            await load
+            return None
+
+        _, creds = await asyncio.gather(
+            load, asyncio.to_thread(self.credential_manager.load_credentials)
+        )
+        return creds
+
+    def _save_session(self, session_file: Path) -> None:
+        """
+        Save current client session settings.
+
+        Args:
+            session_file: Path to session file
+        """
+        settings = self.client.get_settings()
+        session_file.parent.mkdir(parents=True, exist_ok=True)
+        session_file.write_bytes(dumps(settings, indent=True))
+
+        # get_settings shares some nested dicts with the client, so cache a copy
+        _SESSION_CACHE[session_file] = (_session_stamp(session_file), deepcopy(settings))
+
+    @staticmethod
+    def _validation_marker(session_file: Path) -> Path:
+        """Get the sidecar file whose mtime records the last session validation."""
+        return session_file.with_suffix(".validated")
+
+    def _session_recently_validated(self, session_file: Path) -> bool:
+        """
+        Check whether the saved session was validated within the TTL.
+
+        Args:
+            session_file: Path to session file
 
-    def _get_credentials(self) -> Dict[str, str]:
+        Returns:
+            True if the validation marker is newer than SESSION_VALIDATION_TTL
+        """
+        try:
+            validated_at = self._validation_marker(session_file).stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return time.time() - validated_at < SESSION_VALIDATION_TTL
+
+    def _mark_session_validated(self, session_file: Path) -> None:
+        """
+        Record that the saved session was just validated.
+
+        Args:
+            session_file: Path to session file
+        """
+        try:
+            self._validation_marker(session_file).touch()
+        except OSError as e:
+            logger.debug(f"Could not write session validation marker: {e}")
+
+    def invalidate_session_validation(self) -> None:
+        """Forget the last session validation so the next login checks the session again."""
+        try:
+            self._validation_marker(self.config.get_session_file()).unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"Could not remove session validation marker: {e}")
+
+    def _get_credentials(self, use_saved: bool = True) -> Dict[str, str]:
         """
         Get credentials from storage or user input.
 
+        Args:
+            use_saved: Whether to look up stored credentials before prompting;
+                False when the caller already found none
+
         Returns:
             Dict with username and password
         """
         # Try to load saved credentials
-        creds = self.credential_manager.load_credentials()
-        if creds:
+        if use_saved and (creds := self.credential_manager.load_credentials()):
             console.print(f"[cyan]Using saved credentials for {creds['username']}[/cyan]")
             return creds
 
@@ -213,11 +450,14 @@ class InstagramAuthenticator:
         """
         try:
             if delete_session:
-                session_file = self.config.get_session_file()
-                if session_file.exists():
-                    session_file.unlink()
+                self.invalidate_session_validation()
+                _SESSION_CACHE.pop(self.config.get_session_file(), None)
+                try:
+                    self.config.get_session_file().unlink()
                     logger.info("Session file deleted")
                     console.print("[green]Session deleted.[/green]")
+                except FileNotFoundError:
+                    pass
 
             if delete_credentials:
                 # Need username for keyring deletion
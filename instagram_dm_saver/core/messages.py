@@ -1,24 +1,167 @@
 """Message fetching and conversation management."""
 
-import copy
-from typing import List, Optional, Dict, Any
+import asyncio
+import random
+import re
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import attrgetter, ge
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 
 from instagrapi import Client
 from instagrapi.types import DirectThread, DirectMessage
+from instagrapi.exceptions import ClientThrottledError, PleaseWaitFewMinutes, RateLimitError
 from instagrapi.extractors import extract_direct_thread, extract_direct_message
 from rich.console import Console
-from rich.progress import Progress
 from rich.table import Table
 from rich.prompt import Prompt
 from rich.panel import Panel
-
-from ..utils.exceptions import MessageFetchError, ConversationError, MediaValidationError
+from rich.text import Text
+
+from .auth import clone_client
+from ..utils.circuit_breaker import CircuitBreaker
+from ..utils.exceptions import (
+    MessageFetchError, ConversationError, MediaValidationError, CircuitOpenError
+)
+from ..utils.formatting import build_username_map, format_datetime, media_info, media_label
 from ..utils.logger import get_logger
 from ..utils.rate_limiter import instagram_rate_limiter
 
 logger = get_logger(__name__)
 console = Console()
 
+# Defaults for clip sound metadata that instagrapi requires but Instagram omits
+DEFAULT_SOUND_INFO: Dict[str, Any] = {
+    "audio_id": "",
+    "original_audio_title": "",
+    "progressive_download_url": "",
+    "dash_manifest": "",
+    "duration_in_ms": 0,
+    "is_explicit": False,
+}
+DEFAULT_IG_ARTIST: Dict[str, Any] = {"username": "", "pk": 0}
+
+# Error fragments indicating instagrapi choked on media while parsing the inbox
+CONVERSATION_MEDIA_ERROR_RE = re.compile(
+    "clips_metadata|original_sound_info|validationerror|model_type"
+    "|input should be a valid dictionary"
+)
+
+# Error fragments indicating instagrapi choked on a message item while fetching
+MESSAGE_MEDIA_ERROR_RE = re.compile("|".join(map(re.escape, (
+    "clips_metadata", "original_sound_info", "validationerror",
+    "validation errors", "replymessage", "timestamp_us",
+    "model_type", "unexpected keyword argument",
+))))
+
+# Worker threads used to clean and extract inbox threads in the safe API fallback
+EXTRACT_WORKERS = 8
+
+# Sort key for chronological message order
+BY_TIMESTAMP = attrgetter("timestamp")
+
+# Errors meaning Instagram wants us to slow down
+THROTTLE_ERRORS = (ClientThrottledError, PleaseWaitFewMinutes, RateLimitError)
+THROTTLE_MESSAGE_RE = re.compile("429|please wait|rate limit|throttl")
+
+# Decorrelated-jitter backoff between failed batch requests (seconds)
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+THROTTLED_BACKOFF_CAP = 120.0
+
+# Independent random stream so concurrent fetches do not retry in lockstep
+_jitter = random.Random()
+
+# Fetches up to this size skip the probe request and go out in one call
+SMALL_FETCH_COUNT = 20
+PROBE_FETCH_COUNT = 10
+
+# Query parameters instagrapi's direct_thread sends for each page of a thread,
+# copied from instagrapi 3.0.21 (mixins/direct.py); recheck when upgrading
+THREAD_PAGE_PARAMS = {
+    "visual_message_return_type": "unseen",
+    "direction": "older",
+    "seq_id": "40065",
+    "limit": "20",
+}
+
+# Number of recent messages kept when cleaning conversation previews
+THREAD_PREVIEW_ITEMS = 20
+
+# Last-message previews longer than this are truncated with "..."
+PREVIEW_MAX_CHARS = 50
+
+# Plain item types built without pydantic validation (no nested media models)
+FAST_PATH_ITEM_TYPES = frozenset({"text", "like"})
+
+# Item keys that may carry nested media needing cleanup; items without any of
+# them (plain text, likes, links) are passed through untouched
+MEDIA_ITEM_KEYS = frozenset({
+    "clip", "media", "media_share", "visual_media", "voice_media", "animated_media",
+    "reel_share", "story_share", "felix_share", "xma_clip", "xma_media_share",
+    "generic_xma", "replied_to_message",
+})
+
+# Number of skip reasons included in each per-batch log summary
+SKIP_LOG_SAMPLE = 5
+
+
+def _backoff_delay(previous: float, throttled: bool = False) -> float:
+    """
+    Compute the next retry delay using decorrelated jitter.
+
+    Args:
+        previous: Previous delay in seconds
+        throttled: Whether Instagram asked us to slow down, allowing longer waits
+
+    Returns:
+        Delay in seconds
+    """
+    cap = THROTTLED_BACKOFF_CAP if throttled else BACKOFF_CAP
+    return min(cap, _jitter.uniform(BACKOFF_BASE, max(BACKOFF_BASE, previous * 3)))
+
+
+def _sort_oldest_first(messages: List[DirectMessage]) -> None:
+    """
+    Put messages in chronological order, in place.
+
+    Instagram returns messages newest first, so the usual case is a single
+    reverse; a full sort only happens if the order is not monotonic.
+
+    Args:
+        messages: Messages to reorder
+    """
+    timestamps = list(map(BY_TIMESTAMP, messages))
+    if all(map(ge, timestamps, islice(timestamps, 1, None))):
+        messages.reverse()
+    else:
+        messages.sort(key=BY_TIMESTAMP)
+
+
+def _thread_preview(thread: DirectThread) -> str:
+    """
+    Describe a conversation's most recent message for the conversation list.
+
+    Args:
+        thread: Conversation thread
+
+    Returns:
+        Message text, a media/empty placeholder, truncated to PREVIEW_MAX_CHARS
+    """
+    try:
+        first_msg = thread.messages[0]
+        preview = getattr(first_msg, "text", None) or (
+            "[Media message]" if getattr(first_msg, "media", None) else "[No messages]"
+        )
+    except (IndexError, TypeError):
+        return "[No messages]"
+
+    if preview[PREVIEW_MAX_CHARS:]:
+        return preview[:PREVIEW_MAX_CHARS - 3] + "..."
+    return preview
+
 
 class MessageManager:
     """Manage Instagram direct messages and conversations."""
@@ -31,6 +174,8 @@ class MessageManager:
             client: Authenticated Instagram client
         """
         self.client = client
+        # Fail fast on message requests once Instagram keeps erroring
+        self.circuit_breaker = CircuitBreaker()
 
     @instagram_rate_limiter
     def get_conversations(self, thread_message_limit: int = 5) -> List[DirectThread]:
@@ -46,43 +191,55 @@ class MessageManager:
         Raises:
             ConversationError: If fetching conversations fails
         """
-        with Progress() as progress:
-            task = progress.add_task("[cyan]Fetching conversations...", total=1)
-
-            try:
-                # Try standard method first
+        try:
+            # Try standard method first
+            with console.status("[cyan]Fetching conversations...[/cyan]"):
                 threads = self.client.direct_threads(thread_message_limit=thread_message_limit)
-                progress.update(task, advance=1)
-                logger.info(f"Successfully fetched {len(threads)} conversations")
-                return threads
-
-            except Exception as e:
-                progress.stop()
-
-                error_str = str(e).lower()
-                is_media_error = any(keyword in error_str for keyword in [
-                    "clips_metadata", "original_sound_info", "validationerror",
-                    "model_type", "input should be a valid dictionary"
-                ])
-
-                if is_media_error:
-                    logger.warning("Encountered problematic media, trying fallback methods")
-                    console.print("[yellow]Encountered problematic media in conversations.[/yellow]")
-
-                    # Try fallback methods
-                    threads = self._get_conversations_fallback()
-                    if threads:
-                        return threads
-
-                    # If all methods fail
-                    logger.error("All conversation fetching methods failed")
-                    raise ConversationError(
-                        "Could not fetch conversations due to problematic media. "
-                        "Try updating instagrapi or clearing problematic conversations."
-                    )
-                else:
-                    logger.error(f"Failed to fetch conversations: {e}")
-                    raise ConversationError(f"Failed to fetch conversations: {e}")
+            logger.info(f"Successfully fetched {len(threads)} conversations")
+            return threads
+
+        except Exception as e:
+            is_media_error = bool(CONVERSATION_MEDIA_ERROR_RE.search(str(e).lower()))
+
+            if is_media_error:
+                logger.warning("Encountered problematic media, trying fallback methods")
+                console.print("[yellow]Encountered problematic media in conversations.[/yellow]")
+
+                # Try fallback methods
+                threads = self._get_conversations_fallback()
+                if threads:
+                    return threads
+
+                # If all methods fail
+                logger.error("All conversation fetching methods failed")
+                raise ConversationError(
+                    "Could not fetch conversations due to problematic media. "
+                    "Try updating instagrapi or clearing problematic conversations."
+                )
+            else:
+                logger.error(f"Failed to fetch conversations: {e}")
+                raise ConversationError(f"Failed to fetch conversations: {e}")
+
+    @instagram_rate_limiter
+    def get_conversation(self, thread_id: str) -> DirectThread:
+        """
+        Get a single conversation by its thread ID.
+
+        Args:
+            thread_id: Instagram thread ID
+
+        Returns:
+            DirectThread object
+
+        Raises:
+            ConversationError: If the conversation can't be fetched
+        """
+        try:
+            # Messages are fetched separately, so only ask for the newest one
+            return self.client.direct_thread(thread_id, amount=1)
+        except Exception as e:
+            logger.error(f"Failed to fetch conversation {thread_id}: {e}")
+            raise ConversationError(f"Failed to fetch conversation {thread_id}: {e}")
 
     def _get_conversations_fallback(self) -> List[DirectThread]:
         """
@@ -144,18 +301,24 @@ class MessageManager:
             logger.info(f"Processing {len(threads_data)} conversations from API")
 
             safe_threads = []
-            skipped_count = 0
 
-            for i, thread_data in enumerate(threads_data):
-                try:
-                    # Clean thread data
-                    cleaned_data = self._clean_thread_data(thread_data)
-                    thread = extract_direct_thread(cleaned_data)
-                    safe_threads.append(thread)
+            # Clean and extract threads concurrently; map() preserves inbox order
+            workers = max(1, min(EXTRACT_WORKERS, len(threads_data)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(self._process_thread_data, threads_data)
 
-                except Exception as e:
-                    skipped_count += 1
-                    logger.debug(f"Skipped thread {i+1}: {e}")
+                skip_reasons = []
+                for i, (thread, error) in enumerate(results):
+                    if thread is not None:
+                        safe_threads.append(thread)
+                    else:
+                        skip_reasons.append(f"thread {i+1}: {error}")
+
+            skipped_count = len(skip_reasons)
+            if skip_reasons:
+                logger.debug(
+                    f"Skipped {skipped_count} threads: " + "; ".join(skip_reasons[-SKIP_LOG_SAMPLE:])
+                )
 
             logger.info(f"Successfully processed {len(safe_threads)} conversations, skipped {skipped_count}")
 
@@ -172,31 +335,96 @@ class MessageManager:
             raise ConversationError(f"Safe API method failed: {e}")
 
     @staticmethod
-    def _clean_thread_data(thread_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _process_thread_data(
+        thread_data: Dict[str, Any]
+    ) -> Tuple[Optional[DirectThread], Optional[Exception]]:
+        """
+        Clean and extract a single thread.
+
+        Args:
+            thread_data: Raw thread data from API
+
+        Returns:
+            Tuple of (thread, None) on success or (None, error) on failure
+        """
+        try:
+            return extract_direct_thread(MessageManager._clean_thread_data(thread_data)), None
+        except Exception as e:
+            return None, e
+
+    @staticmethod
+    def _clean_thread_data(
+        thread_data: Dict[str, Any],
+        limit: int = THREAD_PREVIEW_ITEMS
+    ) -> Dict[str, Any]:
         """
         Clean problematic data from thread.
 
+        The thread data is modified in place; callers should not rely on the
+        raw API payload after cleaning. Only the first ``limit`` items are
+        kept, and the list is sliced before cleaning so the dropped items are
+        never touched.
+
         Args:
             thread_data: Raw thread data from API
+            limit: Maximum number of recent messages to keep
 
         Returns:
-            Cleaned thread data
+            Cleaned thread data (the same object)
         """
         if not isinstance(thread_data, dict):
             return thread_data
 
-        cleaned = copy.deepcopy(thread_data)
-
         # Clean message items
-        if "items" in cleaned and isinstance(cleaned["items"], list):
-            safe_items = []
-            for item in cleaned["items"][:20]:  # Limit to 20 recent messages
-                cleaned_item = MessageManager._clean_media_item(item)
-                if cleaned_item:
-                    safe_items.append(cleaned_item)
-            cleaned["items"] = safe_items
+        items = thread_data.get("items")
+        if isinstance(items, list):
+            thread_data["items"] = [
+                cleaned_item
+                for cleaned_item in (
+                    MessageManager._clean_media_item(item)
+                    for item in items[:limit]
+                    if type(item) is dict
+                )
+                if cleaned_item
+            ]
 
-        return cleaned
+        return thread_data
+
+    @staticmethod
+    def _extract_message(item: Dict[str, Any]) -> DirectMessage:
+        """
+        Build a DirectMessage from a cleaned item.
+
+        Plain text and like items carry no nested media models, so they are
+        constructed directly without pydantic validation. Everything else goes
+        through instagrapi's extractor.
+
+        Args:
+            item: Cleaned message item
+
+        Returns:
+            DirectMessage object
+        """
+        if (
+            item.get("item_type") not in FAST_PATH_ITEM_TYPES
+            or "reactions" in item
+            or "replied_to_message" in item
+        ):
+            return extract_direct_message(item)
+
+        # Mirror extract_direct_message's field conversions
+        thread_id = item.get("thread_id")
+        return DirectMessage.model_construct(
+            id=item.get("item_id"),
+            user_id=str(item.get("user_id", "")),
+            thread_id=int(thread_id) if thread_id is not None else None,
+            timestamp=datetime.fromtimestamp(int(item["timestamp"]) // 1_000_000),
+            item_type=item["item_type"],
+            is_sent_by_viewer=item.get("is_sent_by_viewer"),
+            is_shh_mode=item.get("is_shh_mode"),
+            text=item.get("text"),
+            client_context=item.get("client_context", ""),
+        )
 
     @staticmethod
     def _normalize_timestamp_value(value: Any) -> Any:
@@ -253,65 +481,48 @@ class MessageManager:
         """
         Clean problematic media data from message item.
 
+        The item is modified in place; callers should not rely on the raw
+        API payload after cleaning.
+
         Args:
             item: Message item with potentially problematic media
 
         Returns:
-            Cleaned item or None if cleaning fails
+            Cleaned item (the same object) or None if cleaning fails
         """
-        if not isinstance(item, dict):
+        if type(item) is not dict or MEDIA_ITEM_KEYS.isdisjoint(item):
             return item
 
         try:
-            cleaned = copy.deepcopy(item)
-
             # Normalize timestamps early to prevent Pydantic overflow errors
-            cleaned = MessageManager._normalize_timestamps(cleaned)
-
-            # Handle clips/reels metadata
-            if "clip" in cleaned:
-                clip_data = cleaned["clip"]
-
-                if isinstance(clip_data, dict) and "clip" in clip_data:
-                    clip_data = clip_data["clip"]
-
-                if isinstance(clip_data, dict) and "clips_metadata" in clip_data:
-                    metadata = clip_data["clips_metadata"]
-
-                    if isinstance(metadata, dict):
-                        # Fix original_sound_info
-                        if "original_sound_info" in metadata:
-                            sound_info = metadata["original_sound_info"]
-
-                            if sound_info is None or not isinstance(sound_info, dict):
-                                metadata["original_sound_info"] = {
-                                    "audio_id": "",
-                                    "original_audio_title": "",
-                                    "progressive_download_url": "",
-                                    "dash_manifest": "",
-                                    "ig_artist": {"username": "", "pk": 0},
-                                    "duration_in_ms": 0,
-                                    "is_explicit": False
-                                }
-                            else:
-                                # Ensure required fields
-                                sound_info.setdefault("audio_id", "")
-                                sound_info.setdefault("original_audio_title", "")
-                                sound_info.setdefault("progressive_download_url", "")
-                                sound_info.setdefault("dash_manifest", "")
-                                sound_info.setdefault("duration_in_ms", 0)
-                                sound_info.setdefault("is_explicit", False)
-
-                                if "ig_artist" not in sound_info or not isinstance(sound_info["ig_artist"], dict):
-                                    sound_info["ig_artist"] = {"username": "", "pk": 0}
-                                else:
-                                    sound_info["ig_artist"].setdefault("username", "")
-                                    sound_info["ig_artist"].setdefault("pk", 0)
-
-                        # Remove problematic fields
-                        for field in ["music_info", "template_info"]:
-                            if field in metadata and metadata[field] is None:
-                                del metadata[field]
+            cleaned = MessageManager._normalize_timestamps(item)
+
+            # Handle clips/reels metadata (the clip may be nested one level deeper)
+            clip_data = cleaned.get("clip")
+            if type(clip_data) is dict:
+                clip_data = clip_data.get("clip", clip_data)
+            metadata = clip_data.get("clips_metadata") if type(clip_data) is dict else None
+
+            if type(metadata) is dict:
+                # Fix original_sound_info
+                if "original_sound_info" in metadata:
+                    sound_info = metadata["original_sound_info"]
+                    if type(sound_info) is not dict:
+                        sound_info = {}
+
+                    artist = sound_info.get("ig_artist")
+                    if type(artist) is not dict:
+                        artist = {}
+
+                    # Fill in required fields without overwriting existing values
+                    sound_info = {**DEFAULT_SOUND_INFO, **sound_info}
+                    sound_info["ig_artist"] = {**DEFAULT_IG_ARTIST, **artist}
+                    metadata["original_sound_info"] = sound_info
+
+                # Remove problematic fields
+                for field in ("music_info", "template_info"):
+                    if field in metadata and metadata[field] is None:
+                        del metadata[field]
 
             return cleaned
 
@@ -333,57 +544,288 @@ class MessageManager:
             count: Number of messages to fetch
 
         Returns:
-            List of DirectMessage objects
+            List of DirectMessage objects, oldest first
 
         Raises:
             MessageFetchError: If fetching messages fails
         """
-        with Progress() as progress:
-            task = progress.add_task(f"[cyan]Fetching {count} messages...", total=1)
-
-            try:
-                # Try standard method with small test first
-                test_messages = self.client.direct_messages(thread.id, min(10, count))
-
-                if test_messages:
-                    if count <= 10:
-                        progress.update(task, advance=1)
-                        logger.info(f"Successfully fetched {len(test_messages)} messages")
-                        return test_messages
-                    else:
-                        # Fetch all requested messages
-                        messages = self.client.direct_messages(thread.id, count)
-                        progress.update(task, advance=1)
-                        logger.info(f"Successfully fetched {len(messages)} messages")
-                        return messages
+        try:
+            with console.status(f"[cyan]Fetching {count} messages...[/cyan]"):
+                if count <= SMALL_FETCH_COUNT:
+                    # One request is as cheap as a test fetch, so skip the probe
+                    messages = self.circuit_breaker.call(
+                        self.client.direct_messages, thread.id, count
+                    )
+                    if not messages:
+                        raise MessageFetchError("No messages returned")
                 else:
-                    raise MessageFetchError("No messages returned from test fetch")
+                    # Probe with a small fetch so media errors surface before
+                    # the full download
+                    test_messages = self.circuit_breaker.call(
+                        self.client.direct_messages, thread.id, PROBE_FETCH_COUNT
+                    )
+                    if not test_messages:
+                        raise MessageFetchError("No messages returned from test fetch")
+
+                    messages = self._fetch_messages_pipelined(thread.id, count)
 
-            except Exception as e:
-                progress.stop()
+            logger.info(f"Successfully fetched {len(messages)} messages")
+            _sort_oldest_first(messages)
+            return messages
 
-                error_str = str(e).lower()
-                is_media_error = any(keyword in error_str for keyword in [
-                    "clips_metadata", "original_sound_info", "validationerror",
-                    "validation errors", "replymessage", "timestamp_us",
-                    "model_type", "unexpected keyword argument"
-                ])
+        except Exception as e:
+            error_str = str(e).lower()
+            is_media_error = bool(MESSAGE_MEDIA_ERROR_RE.search(error_str))
 
-                if is_media_error:
-                    logger.warning("Encountered problematic media, using safe batch method")
-                    console.print("[yellow]Encountered problematic media.[/yellow]")
+            if is_media_error:
+                logger.warning("Encountered problematic media, using safe batch method")
+                console.print("[yellow]Encountered problematic media.[/yellow]")
 
-                    messages = self._fetch_messages_safe_batch(thread.id, count)
+                messages = self._fetch_messages_safe_batch(thread.id, count)
 
-                    if messages:
-                        logger.info(f"Successfully fetched {len(messages)} messages using safe method")
-                        return messages
-                    else:
-                        logger.warning("No messages could be retrieved")
-                        return []
+                if messages:
+                    logger.info(f"Successfully fetched {len(messages)} messages using safe method")
+                    _sort_oldest_first(messages)
+                    return messages
                 else:
-                    logger.error(f"Failed to fetch messages: {e}")
-                    raise MessageFetchError(f"Failed to fetch messages: {e}")
+                    logger.warning("No messages could be retrieved")
+                    return []
+            else:
+                logger.error(f"Failed to fetch messages: {e}")
+                raise MessageFetchError(f"Failed to fetch messages: {e}")
+
+    def fetch_messages_for_threads(
+        self,
+        threads: List[DirectThread],
+        count: int = 1000,
+        max_concurrency: int = 8
+    ) -> Dict[str, List[DirectMessage]]:
+        """
+        Fetch messages from several conversations concurrently.
+
+        Each conversation is fetched in a worker thread so network latency
+        overlaps; the global rate limiter still applies to every request.
+        Every worker uses its own clone of the client, since an instagrapi
+        client can't serve concurrent requests.
+        Once Instagram throttles a request, the throttled conversation and all
+        that follow are fetched one at a time.
+
+        Args:
+            threads: Conversations to fetch
+            count: Number of messages to fetch per conversation
+            max_concurrency: Maximum number of conversations fetched at once
+
+        Returns:
+            Dict mapping thread ID to its messages, oldest first. Conversations
+            that failed to fetch are logged and omitted.
+        """
+        return asyncio.run(self._fetch_threads_async(threads, count, max_concurrency))
+
+    async def _fetch_threads_async(
+        self,
+        threads: List[DirectThread],
+        count: int,
+        max_concurrency: int
+    ) -> Dict[str, List[DirectMessage]]:
+        """Gather per-thread fetches with bounded concurrency."""
+        # One manager per concurrent fetch, each with its own client; taking
+        # a worker from the queue bounds the concurrency
+        workers: asyncio.Queue = asyncio.Queue()
+        for _ in range(min(max_concurrency, len(threads))):
+            workers.put_nowait(self._worker_manager())
+        sequential = asyncio.Lock()
+        throttled = False
+
+        async def fetch_one(thread: DirectThread) -> List[DirectMessage]:
+            nonlocal throttled
+            worker = await workers.get()
+            try:
+                if not throttled:
+                    try:
+                        return await asyncio.to_thread(
+                            worker._fetch_thread_messages, thread.id, count
+                        )
+                    except THROTTLE_ERRORS as e:
+                        if not throttled:
+                            throttled = True
+                            logger.warning(f"Throttled by Instagram, fetching sequentially: {e}")
+
+                async with sequential:
+                    return await asyncio.to_thread(worker._fetch_thread_messages, thread.id, count)
+            finally:
+                workers.put_nowait(worker)
+
+        results = await asyncio.gather(
+            *(fetch_one(thread) for thread in threads),
+            return_exceptions=True
+        )
+
+        messages_by_thread = {}
+        for thread, result in zip(threads, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to fetch messages for thread {thread.id}: {result}")
+                continue
+            messages_by_thread[thread.id] = result
+
+        logger.info(f"Fetched messages for {len(messages_by_thread)}/{len(threads)} conversations")
+        return messages_by_thread
+
+    @instagram_rate_limiter
+    def iter_message_batches(
+        self,
+        thread: DirectThread,
+        count: int = 1000,
+        batch_size: int = 20
+    ) -> Iterator[List[DirectMessage]]:
+        """
+        Yield a conversation's messages page by page as they arrive.
+
+        Unlike fetch_messages this does not wait for the whole conversation,
+        so callers can show messages while the rest are still downloading.
+        If a page fails on problematic media, the remaining messages are
+        fetched in safe batches, skipping any already yielded.
+
+        Args:
+            thread: Direct message thread
+            count: Number of messages to fetch
+            batch_size: Messages per batch in the safe batch fallback
+
+        Yields:
+            Lists of DirectMessage objects, each sorted oldest first. Each
+            list is older than the one before it.
+
+        Raises:
+            MessageFetchError: If fetching messages fails
+        """
+        seen_ids = set()
+        try:
+            for page in self._iter_pages_pipelined(thread.id, count):
+                seen_ids.update(message.id for message in page)
+                _sort_oldest_first(page)
+                yield page
+            return
+
+        except Exception as e:
+            if not MESSAGE_MEDIA_ERROR_RE.search(str(e).lower()):
+                logger.error(f"Failed to fetch messages: {e}")
+                raise MessageFetchError(f"Failed to fetch messages: {e}")
+            logger.warning("Encountered problematic media, using safe batch method")
+
+        remaining = count - len(seen_ids)
+        messages = (
+            message
+            for message in self.iter_messages_safe_batch(thread.id, count, batch_size)
+            if message.id not in seen_ids
+        )
+        while remaining > 0:
+            batch = list(islice(messages, min(batch_size, remaining)))
+            if not batch:
+                break
+            remaining -= len(batch)
+            _sort_oldest_first(batch)
+            yield batch
+
+    def _fetch_messages_pipelined(self, thread_id: str, count: int) -> List[DirectMessage]:
+        """
+        Fetch messages page by page, requesting each page while the previous
+        one is parsed.
+
+        Args:
+            thread_id: Thread ID
+            count: Number of messages to fetch
+
+        Returns:
+            DirectMessage objects in the order returned by the API
+        """
+        return [
+            message
+            for page in self._iter_pages_pipelined(thread_id, count)
+            for message in page
+        ]
+
+    def _iter_pages_pipelined(self, thread_id: str, count: int) -> Iterator[List[DirectMessage]]:
+        """
+        Yield pages of messages, requesting each page while the previous one
+        is parsed.
+
+        Equivalent to client.direct_messages, which waits for every page to
+        arrive before parsing any of them. Here the next cursor is taken from
+        each response and its request is sent on a worker thread before the
+        current page's items are extracted, so network round trips overlap
+        with parsing.
+
+        Args:
+            thread_id: Thread ID
+            count: Number of messages to fetch in total
+
+        Yields:
+            Lists of DirectMessage objects in the order returned by the API
+        """
+        endpoint = f"direct_v2/threads/{thread_id}/"
+
+        def request_page(cursor: Optional[str]) -> Dict[str, Any]:
+            params = dict(THREAD_PAGE_PARAMS, cursor=cursor) if cursor else THREAD_PAGE_PARAMS
+            return self.circuit_breaker.call(self.client.private_request, endpoint, params=params)
+
+        fetched = 0
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            result = request_page(None)
+            while True:
+                # Tolerate a response without a thread or items rather than
+                # failing the whole fetch on a KeyError
+                page = result.get("thread") or {}
+                items = page.get("items", [])[:count - fetched]
+
+                cursor = page.get("oldest_cursor")
+                next_page = None
+                if cursor and fetched + len(items) < count:
+                    next_page = executor.submit(request_page, cursor)
+
+                page_thread_id = page.get("thread_id", thread_id)
+                messages = []
+                for item in items:
+                    item["thread_id"] = page_thread_id
+                    messages.append(self._extract_message(item))
+                fetched += len(messages)
+                yield messages
+
+                if next_page is None:
+                    return
+                result = next_page.result()
+
+    def _worker_manager(self) -> "MessageManager":
+        """
+        Create a manager for one concurrent fetch worker.
+
+        Returns:
+            MessageManager on a cloned client, sharing this manager's circuit breaker
+        """
+        worker = MessageManager(clone_client(self.client))
+        worker.circuit_breaker = self.circuit_breaker
+        return worker
+
+    @instagram_rate_limiter
+    def _fetch_thread_messages(self, thread_id: str, count: int) -> List[DirectMessage]:
+        """
+        Fetch messages for one thread without interactive output.
+
+        Args:
+            thread_id: Thread ID
+            count: Number of messages to fetch
+
+        Returns:
+            List of DirectMessage objects, oldest first
+        """
+        try:
+            messages = self.client.direct_messages(thread_id, count)
+        except THROTTLE_ERRORS:
+            raise
+        except Exception as e:
+            logger.debug(f"Standard fetch failed for thread {thread_id}, using safe batches: {e}")
+            messages = list(self.iter_messages_safe_batch(thread_id, count))
+
+        _sort_oldest_first(messages)
+        return messages
 
     def _fetch_messages_safe_batch(
         self,
@@ -402,65 +844,158 @@ class MessageManager:
         Returns:
             List of DirectMessage objects
         """
-        all_messages = []
+        console.print("[cyan]Fetching messages in safe batches...[/cyan]")
+
+        all_messages = list(self.iter_messages_safe_batch(thread_id, count, batch_size))
+
+        console.print(f"[green]Fetched {len(all_messages)} messages using safe method.[/green]")
+        return all_messages
+
+    def iter_messages_safe_batch(
+        self,
+        thread_id: str,
+        count: int,
+        batch_size: int = 20
+    ) -> Iterator[DirectMessage]:
+        """
+        Yield messages fetched in safe batches with error handling.
+
+        Args:
+            thread_id: Thread ID
+            count: Total messages to fetch
+            batch_size: Messages per batch
+
+        Yields:
+            DirectMessage objects in the order returned by the API
+
+        Note:
+            The request for the next page is sent as soon as the current page
+            arrives, so the network round trip overlaps with parsing. The
+            prefetched page is only used if the cursor it was requested with
+            is still the one we need; otherwise it is discarded.
+        """
         cursor = None
         remaining = count
         consecutive_failures = 0
         max_consecutive_failures = 3
+        retry_delay = BACKOFF_BASE
+        seen_ids = set()
+        endpoint = f"direct_v2/threads/{thread_id}/"
 
-        console.print("[cyan]Fetching messages in safe batches...[/cyan]")
+        def request_batch(limit: int, batch_cursor: Optional[str]) -> Dict[str, Any]:
+            params = {"limit": limit}
+            if batch_cursor:
+                params["cursor"] = batch_cursor
+            return self.circuit_breaker.call(self.client.private_request, endpoint, params=params)
 
-        while remaining > 0 and len(all_messages) < count and consecutive_failures < max_consecutive_failures:
-            current_batch_size = min(batch_size, remaining)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            prefetch = None  # (future, cursor) of the request sent ahead
 
-            try:
-                params = {"limit": current_batch_size}
-                if cursor:
-                    params["cursor"] = cursor
+            while remaining > 0 and consecutive_failures < max_consecutive_failures:
+                current_batch_size = min(batch_size, remaining)
 
-                result = self.client.private_request(f"direct_v2/threads/{thread_id}/", params=params)
+                try:
+                    if prefetch is not None and prefetch[1] == cursor:
+                        future, prefetch = prefetch[0], None
+                        result = future.result()
+                    else:
+                        prefetch = None
+                        result = request_batch(current_batch_size, cursor)
 
-                if not result or "thread" not in result:
-                    break
+                    if not result or "thread" not in result:
+                        break
+
+                    items = result["thread"].get("items", [])
+                    if not items:
+                        break
 
-                items = result["thread"].get("items", [])
-                if not items:
+                    # Send the next request before parsing this batch
+                    next_cursor = items[-1].get("item_id")
+                    next_batch_size = min(batch_size, remaining - len(items))
+                    if next_cursor and next_batch_size > 0:
+                        prefetch = (
+                            executor.submit(request_batch, next_batch_size, next_cursor),
+                            next_cursor,
+                        )
+
+                    # Drop messages already yielded from an overlapping page
+                    batch_messages = []
+                    for message in self._parse_batch(items, limit=remaining):
+                        if message.id in seen_ids:
+                            continue
+                        seen_ids.add(message.id)
+                        batch_messages.append(message)
+
+                except CircuitOpenError:
+                    logger.warning("Message requests failing repeatedly, stopping batch fetch")
                     break
 
-                # Process items safely
-                batch_messages = []
-                for item in items:
-                    try:
-                        cleaned_item = self._clean_media_item(item)
-                        if cleaned_item:
-                            message = extract_direct_message(cleaned_item)
-                            batch_messages.append(message)
-                    except Exception as msg_error:
-                        logger.debug(f"Skipped problematic message: {msg_error}")
-                        continue
+                except Exception as batch_error:
+                    consecutive_failures += 1
+                    logger.debug(f"Batch failed: {batch_error}")
+                    if batch_size > 5:
+                        batch_size = max(5, batch_size // 2)
+
+                    if consecutive_failures >= max_consecutive_failures:
+                        break
+
+                    throttled = isinstance(batch_error, THROTTLE_ERRORS) or bool(
+                        THROTTLE_MESSAGE_RE.search(str(batch_error).lower())
+                    )
+                    retry_delay = _backoff_delay(retry_delay, throttled)
+                    logger.debug(f"Retrying batch in {retry_delay:.1f}s")
+                    time.sleep(retry_delay)
+                    continue
 
                 if batch_messages:
-                    all_messages.extend(batch_messages)
                     remaining -= len(batch_messages)
-                    cursor = items[-1].get("item_id")
+                    cursor = next_cursor
                     consecutive_failures = 0
+                    retry_delay = BACKOFF_BASE
                     logger.debug(f"Fetched batch of {len(batch_messages)} messages")
+                    yield from batch_messages
                 else:
                     consecutive_failures += 1
                     if batch_size > 5:
                         batch_size = max(5, batch_size // 2)
 
-            except Exception as batch_error:
-                consecutive_failures += 1
-                logger.debug(f"Batch failed: {batch_error}")
-                if batch_size > 5:
-                    batch_size = max(5, batch_size // 2)
+    @staticmethod
+    def _parse_batch(
+        items: List[Dict[str, Any]],
+        limit: Optional[int] = None
+    ) -> List[DirectMessage]:
+        """
+        Clean and extract a page of raw message items.
 
-                if consecutive_failures >= max_consecutive_failures:
-                    break
+        Items that fail to parse are skipped and summarized in a single
+        debug record.
 
-        console.print(f"[green]Fetched {len(all_messages)} messages using safe method.[/green]")
-        return all_messages
+        Args:
+            items: Raw message items from the API
+            limit: Stop once this many messages have been parsed
+
+        Returns:
+            DirectMessage objects in input order
+        """
+        messages = []
+        skip_reasons = []
+        for item in items:
+            if limit is not None and len(messages) >= limit:
+                break
+            try:
+                cleaned_item = MessageManager._clean_media_item(item)
+                if cleaned_item:
+                    messages.append(MessageManager._extract_message(cleaned_item))
+            except Exception as msg_error:
+                skip_reasons.append(str(msg_error))
+
+        if skip_reasons:
+            logger.debug(
+                f"Skipped {len(skip_reasons)} problematic messages: "
+                + "; ".join(skip_reasons[-SKIP_LOG_SAMPLE:])
+            )
+
+        return messages
 
     @staticmethod
     def display_conversations(threads: List[DirectThread]) -> None:
@@ -476,26 +1011,20 @@ class MessageManager:
         table.add_column("User(s)", style="green")
         table.add_column("Last Message", style="white")
 
-        for i, thread in enumerate(threads, 1):
-            users = ", ".join([user.username for user in thread.users])
-
-            # Get last message preview
-            last_msg = "[No messages]"
-            try:
-                if thread.messages and len(thread.messages) > 0:
-                    first_msg = thread.messages[0]
-                    if hasattr(first_msg, 'text') and first_msg.text:
-                        last_msg = first_msg.text
-                    elif hasattr(first_msg, 'media') and first_msg.media:
-                        last_msg = "[Media message]"
-            except Exception:
-                pass
-
-            # Truncate long messages
-            if last_msg and len(last_msg) > 50:
-                last_msg = last_msg[:47] + "..."
+        # Do all string work first, then hand the finished rows to Rich;
+        # plain Text cells skip markup parsing of user-provided strings
+        rows = [
+            (
+                str(i),
+                Text(", ".join([user.username for user in thread.users])),
+                Text(_thread_preview(thread)),
+            )
+            for i, thread in enumerate(threads, 1)
+        ]
 
-            table.add_row(str(i), users, last_msg)
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
 
         console.print(table)
 
@@ -515,6 +1044,17 @@ class MessageManager:
         """
         MessageManager.display_conversations(threads)
 
+        # Lowercase usernames once instead of on every search attempt, and
+        # index them so an exact username is a single dict lookup
+        user_index = [
+            (thread, user.username, user.username.lower())
+            for thread in threads
+            for user in thread.users
+        ]
+        exact_index: Dict[str, List[Tuple[DirectThread, str]]] = {}
+        for thread, username, username_lower in user_index:
+            exact_index.setdefault(username_lower, []).append((thread, username))
+
         while True:
             choice = Prompt.ask(
                 "Select a conversation by number or enter a username to search",
@@ -530,83 +1070,132 @@ class MessageManager:
             else:
                 # Search by username
                 search_term = choice.lower()
-                matches = []
-
-                for i, thread in enumerate(threads):
-                    for user in thread.users:
-                        if search_term in user.username.lower():
-                            matches.append((i, thread, user.username))
+                matches = exact_index.get(search_term)
+                if matches is None or len(matches) > 1:
+                    matches = [
+                        (thread, username)
+                        for thread, username, username_lower in user_index
+                        if search_term in username_lower
+                    ]
 
                 if matches:
                     if len(matches) == 1:
-                        _, thread, username = matches[0]
+                        thread, username = matches[0]
                         console.print(f"[green]Found conversation with {username}.[/green]")
                         return thread
                     else:
                         console.print(f"[yellow]Found {len(matches)} matching conversations:[/yellow]")
-                        for i, (_, _, username) in enumerate(matches, 1):
+                        for i, (_, username) in enumerate(matches, 1):
                             console.print(f"{i}. {username}")
 
                         sub_choice = Prompt.ask("Select a conversation by number", default="1")
                         if sub_choice.isdigit() and 1 <= int(sub_choice) <= len(matches):
-                            _, thread, _ = matches[int(sub_choice) - 1]
+                            thread, _ = matches[int(sub_choice) - 1]
                             return thread
                 else:
                     console.print("[red]No conversations found matching that username.[/red]")
 
+    @staticmethod
+    def get_current_username(client: Client) -> str:
+        """
+        Get the username of the logged-in account.
+
+        Uses the username instagrapi stores at login and only falls back to
+        a profile lookup when it is missing.
+
+        Args:
+            client: Authenticated Instagram client
+
+        Returns:
+            Username, or "You" if it cannot be determined
+        """
+        username = getattr(client, "username", None)
+        if username:
+            return username
+
+        try:
+            return client.user_info(client.user_id).username
+        except Exception:
+            return "You"
+
     @staticmethod
     def display_messages(
         thread: DirectThread,
         messages: List[DirectMessage],
-        client: Client
+        client: Client,
+        current_username: Optional[str] = None,
+        usernames: Optional[Dict] = None
     ) -> None:
         """
         Display messages in a readable format.
 
         Args:
             thread: Direct message thread
-            messages: List of messages to display
+            messages: Messages in chronological order, as returned by
+                fetch_messages
             client: Instagram client (for user info)
+            current_username: Username of the logged-in account; resolved
+                from the client if not given
+            usernames: Prebuilt user ID to username mapping, so callers that
+                also export can build it once; built here if not given
         """
-        # Get current username
-        try:
-            current_user = client.user_info(client.user_id)
-            current_username = current_user.username
-        except:
-            current_username = "You"
-
-        usernames = {user.pk: user.username for user in thread.users}
-        usernames[client.user_id] = current_username
-
-        sorted_messages = sorted(messages, key=lambda m: m.timestamp)
+        if usernames is None:
+            if current_username is None:
+                current_username = MessageManager.get_current_username(client)
+            usernames = build_username_map(thread.users, client.user_id, current_username)
 
         console.print(Panel(
             f"[bold]Conversation with {', '.join(u.username for u in thread.users)}[/bold]"
         ))
 
-        for msg in sorted_messages:
-            sender = usernames.get(msg.user_id, f"Unknown ({msg.user_id})")
-            timestamp = msg.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-            message_text = msg.text if msg.text is not None else "[No text content]"
-
-            if msg.user_id == client.user_id:
-                console.print(
-                    f"[cyan]{timestamp}[/cyan] [bold blue]{sender}:[/bold blue] {message_text}"
-                )
-            else:
-                console.print(
-                    f"[cyan]{timestamp}[/cyan] [bold green]{sender}:[/bold green] {message_text}"
-                )
+        own_id = client.user_id
+        get_sender = usernames.get
+        rows = []
+        for msg in messages:
+            user_id = msg.user_id
+            text = msg.text
+
+            sender = get_sender(user_id)
+            if sender is None:
+                sender = f"Unknown ({user_id})"
+
+            rows.append((
+                format_datetime(msg.timestamp),
+                sender,
+                user_id == own_id,
+                text if text is not None else "[No text content]",
+                media_label(media_info(msg)),
+            ))
+
+        if not console.is_terminal:
+            # Piped or redirected output has no use for styling or column
+            # layout, so write plain lines in a single call
+            console.out(
+                "\n".join(
+                    f"{timestamp} {sender}: {text}  {label}" if label
+                    else f"{timestamp} {sender}: {text}"
+                    for timestamp, sender, _, text, label in rows
+                ),
+                highlight=False
+            )
+            return
+
+        # Build every row first and render once; plain Text cells skip markup parsing
+        table = Table(show_header=True, box=None, pad_edge=False)
+        table.add_column("Time", style="cyan", no_wrap=True)
+        table.add_column("Sender", no_wrap=True)
+        table.add_column("Message")
+        table.add_column("Media", style="italic")
+
+        own_style = "bold blue"
+        other_style = "bold green"
+        add_row = table.add_row
+        for timestamp, sender, is_own, text, label in rows:
+            add_row(
+                timestamp,
+                Text(f"{sender}:", style=own_style if is_own else other_style),
+                Text(text),
+                label,
+            )
 
-            # Display media if present
-            try:
-                if hasattr(msg, 'media') and msg.media:
-                    if hasattr(msg.media, 'media_type'):
-                        if msg.media.media_type == 1:
-                            url = getattr(msg.media, 'thumbnail_url', 'No URL')
-                            console.print(f"[italic]  [Image: {url}][/italic]")
-                        elif msg.media.media_type == 2:
-                            url = getattr(msg.media, 'video_url', 'No URL')
-                            console.print(f"[italic]  [Video: {url}][/italic]")
-            except Exception:
-                pass
+        console.print(table)
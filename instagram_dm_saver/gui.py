@@ -5,15 +5,19 @@ Instagram DM Saver - Modern GUI Application
 A beautiful, modern GUI for fetching and saving Instagram DMs with all v2.0 features.
 """
 
+import gc
 import tkinter as tk
 from tkinter import messagebox, filedialog
 import customtkinter as ctk
 from pathlib import Path
-import threading
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
+from functools import lru_cache, partial
+from itertools import groupby
+from operator import attrgetter, itemgetter
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from datetime import datetime
 
-from instagram_dm_saver.core import InstagramAuthenticator, MessageManager
 from instagram_dm_saver.storage import AppConfig, get_config, CredentialManager, MessageExporter
 from instagram_dm_saver.utils import (
     InstagramDMError,
@@ -21,9 +25,15 @@ from instagram_dm_saver.utils import (
     TwoFactorRequired,
     MessageFetchError,
     ConversationError,
+    SearchIndex,
+    format_date,
+    format_time,
     get_logger,
 )
-from instagrapi.types import DirectThread, DirectMessage
+
+if TYPE_CHECKING:
+    from instagrapi.types import DirectThread, DirectMessage
+    from instagram_dm_saver.core import InstagramAuthenticator, MessageManager
 
 # Configure CustomTkinter
 ctk.set_appearance_mode("dark")
@@ -31,6 +41,85 @@ ctk.set_default_color_theme("blue")
 
 logger = get_logger(__name__)
 
+# Height in pixels of one conversation list row, including the gap below it
+CONVERSATION_ROW_HEIGHT = 100
+
+# Longest last-message preview shown in a conversation row
+CONVERSATION_PREVIEW_CHARS = 60
+
+# Rows kept rendered above and below the visible part of the conversation list
+CONVERSATION_OVERSCAN = 2
+
+# Milliseconds without typing before the conversation search runs
+SEARCH_DEBOUNCE_MS = 150
+
+# Messages packed per main loop turn when rendering a conversation
+MESSAGE_RENDER_BATCH = 50
+
+# strftime format of the date headings between messages
+DATE_SEPARATOR_FORMAT = "%B %d, %Y"
+
+# Mouse wheel events (Windows/macOS, then X11 up/down)
+MOUSE_WHEEL_EVENTS = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+
+@lru_cache(maxsize=None)
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """
+    Return a shared font, creating it on first use.
+
+    The window only uses a handful of sizes, so widgets share these instead
+    of each constructing its own Tk font. Must be called after the root
+    window exists.
+
+    Args:
+        size: Font size
+        weight: "normal" or "bold"
+
+    Returns:
+        Cached CTkFont
+    """
+    return ctk.CTkFont(size=size, weight=weight)
+
+
+def _message_date(msg: "DirectMessage"):
+    """Calendar day a message was sent on."""
+    return msg.timestamp.date()
+
+
+def _merge_pages(pages: List[List["DirectMessage"]]) -> List["DirectMessage"]:
+    """
+    Combine fetched pages into one list, oldest first.
+
+    Args:
+        pages: Pages in fetch order (newest page first), each sorted oldest first
+
+    Returns:
+        All messages, oldest first
+    """
+    # The pages are already in order, so the sort is a single linear pass
+    messages = [msg for page in reversed(pages) for msg in page]
+    messages.sort(key=attrgetter("timestamp"))
+    return messages
+
+
+def _conversation_preview(thread: "DirectThread") -> str:
+    """
+    Describe a conversation's last message for the conversation list.
+
+    Args:
+        thread: Conversation thread
+
+    Returns:
+        Message text truncated to CONVERSATION_PREVIEW_CHARS, or "[No messages]"
+    """
+    last_msg = thread.messages[0].text if thread.messages else None
+    if not last_msg:
+        return "[No messages]"
+    if len(last_msg) > CONVERSATION_PREVIEW_CHARS:
+        return last_msg[:CONVERSATION_PREVIEW_CHARS - 3] + "..."
+    return last_msg
+
 
 class LoadingSpinner(ctk.CTkFrame):
     """Animated loading spinner widget."""
@@ -50,7 +139,7 @@ class LoadingSpinner(ctk.CTkFrame):
         )
         self.canvas.pack()
 
-        self.label = ctk.CTkLabel(self, text=text, font=ctk.CTkFont(size=14))
+        self.label = ctk.CTkLabel(self, text=text, font=_font(14))
         self.label.pack(pady=(5, 0))
 
         self.angle = 0
@@ -82,6 +171,117 @@ class LoadingSpinner(ctk.CTkFrame):
             self.job = None
 
 
+class ConversationRow(ctk.CTkFrame):
+    """Conversation list row that is reused for whichever thread scrolls into view."""
+
+    def __init__(self, master):
+        super().__init__(
+            master,
+            height=CONVERSATION_ROW_HEIGHT - 10,
+            cursor="hand2",
+            fg_color="#2b2b2b",
+            border_width=2,
+            border_color="#3b3b3b"
+        )
+        self.pack_propagate(False)
+        self.thread: Optional["DirectThread"] = None
+
+        # Username
+        self.name_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=_font(16, "bold"),
+            anchor="w"
+        )
+        self.name_label.place(x=20, y=20)
+
+        # Last message preview
+        self.msg_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=_font(12),
+            text_color="gray",
+            anchor="w"
+        )
+        self.msg_label.place(x=20, y=53)
+
+        # Hover effect
+        self.bind("<Enter>", self._on_enter)
+        self.bind("<Leave>", self._on_leave)
+
+    def _on_enter(self, event):
+        """Highlight the row under the pointer."""
+        self.configure(border_color="#1f538d")
+
+    def _on_leave(self, event):
+        """Remove the hover highlight."""
+        self.configure(border_color="#3b3b3b")
+
+    def show(self, thread: "DirectThread", users: str, preview: str):
+        """Fill the row with a thread's participants and last message preview."""
+        self.thread = thread
+        self.name_label.configure(text=users)
+        self.msg_label.configure(text=preview)
+
+
+class DateSeparator(ctk.CTkFrame):
+    """Date heading between messages from different days."""
+
+    def __init__(self, master):
+        super().__init__(master, height=40, fg_color="transparent")
+
+        self.label = ctk.CTkLabel(
+            self,
+            text="",
+            font=_font(12, "bold"),
+            text_color="gray"
+        )
+        self.label.pack()
+
+    def show(self, text: str):
+        """Set the date text."""
+        self.label.configure(text=text)
+
+
+class MessageBubble(ctk.CTkFrame):
+    """Message bubble for one side of the conversation, refilled for each message shown."""
+
+    def __init__(self, master, is_me: bool):
+        super().__init__(master, fg_color="transparent")
+
+        bubble = ctk.CTkFrame(
+            self,
+            corner_radius=15,
+            fg_color="#1f538d" if is_me else "#3b3b3b"
+        )
+        bubble.pack(side="right" if is_me else "left", padx=10, fill="x")
+
+        # Message content
+        self.text_label = ctk.CTkLabel(
+            bubble,
+            text="",
+            font=_font(14),
+            wraplength=500,
+            anchor="w",
+            justify="left"
+        )
+        self.text_label.pack(padx=15, pady=(12, 5), anchor="w")
+
+        # Timestamp
+        self.time_label = ctk.CTkLabel(
+            bubble,
+            text="",
+            font=_font(10),
+            text_color="gray"
+        )
+        self.time_label.pack(padx=15, pady=(0, 10), anchor="e" if is_me else "w")
+
+    def show(self, text: str, time_text: str):
+        """Fill the bubble with a message's text and time."""
+        self.text_label.configure(text=text)
+        self.time_label.configure(text=time_text)
+
+
 class InstagramDMSaverGUI:
     """Modern GUI application for Instagram DM Saver."""
 
@@ -92,35 +292,76 @@ class InstagramDMSaverGUI:
         self.logger = get_logger(__name__)
 
         # Initialize components
-        self.authenticator: Optional[InstagramAuthenticator] = None
-        self.message_manager: Optional[MessageManager] = None
+        self.authenticator: Optional["InstagramAuthenticator"] = None
+        self.message_manager: Optional["MessageManager"] = None
         self.credential_manager = CredentialManager(self.config.credential_storage)
 
         # Data
-        self.threads: List[DirectThread] = []
-        self.current_thread: Optional[DirectThread] = None
-        self.messages: List[DirectMessage] = []
+        self.threads: List["DirectThread"] = []
+        self._users_display: Dict[str, str] = {}
+        self._previews: Dict[str, str] = {}
+        self._search_index = SearchIndex()
+        self.current_thread: Optional["DirectThread"] = None
+        self.messages: List["DirectMessage"] = []
+        self._render_job = None
+        self._fetch_generation = 0
+        self._conv_status = None
+        self._msg_status = None
+
+        # Background work (login, loading, fetching) runs on a small shared pool
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="idm")
+
+        # instagrapi is slow to import and only needed once the user logs in,
+        # so load it in the background while the login screen is shown
+        self._pool.submit(import_module, "instagram_dm_saver.core")
 
         # Create main window
         self.root = ctk.CTk()
         self.root.title("Instagram DM Saver v2.0")
         self.root.geometry("1400x900")
         self.root.minsize(1200, 700)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+
+        # Message view mode, kept when switching conversations
+        self.compact_var = tk.BooleanVar(value=False)
 
         # Main container
         self.main_container = ctk.CTkFrame(self.root, corner_radius=0)
         self.main_container.pack(fill="both", expand=True)
 
+        # Clicks and wheel events on the conversation list are dispatched from
+        # one application-wide binding instead of one per row widget
+        self.conv_canvas: Optional[tk.Canvas] = None
+        self.root.bind_all("<Button-1>", self._on_conversation_click, add="+")
+        for sequence in MOUSE_WHEEL_EVENTS:
+            self.root.bind_all(sequence, self._on_conversation_wheel, add="+")
+
         # Show login screen
         self.show_login_screen()
 
         self.logger.info("GUI application initialized")
 
+    def _purge_container(self, container, collect: bool = False):
+        """
+        Destroy every child of a container.
+
+        Args:
+            container: Widget whose children are removed
+            collect: Also let Tk finish the teardown and run a full garbage
+                collection, so the widgets' reference cycles are freed now
+                rather than whenever the collector next runs
+        """
+        for widget in container.winfo_children():
+            widget.destroy()
+
+        if collect:
+            self.root.update_idletasks()
+            gc.collect()
+
     def show_login_screen(self):
         """Display the login screen."""
         # Clear container
-        for widget in self.main_container.winfo_children():
-            widget.destroy()
+        self._purge_container(self.main_container, collect=True)
 
         # Create centered login frame
         login_frame = ctk.CTkFrame(self.main_container, width=450, height=600)
@@ -131,14 +372,14 @@ class InstagramDMSaverGUI:
         title_label = ctk.CTkLabel(
             login_frame,
             text="Instagram DM Saver",
-            font=ctk.CTkFont(size=36, weight="bold")
+            font=_font(36, "bold")
         )
         title_label.pack(pady=(60, 10))
 
         subtitle_label = ctk.CTkLabel(
             login_frame,
             text="v2.0 - Professional Edition",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             text_color="gray"
         )
         subtitle_label.pack(pady=(0, 10))
@@ -148,7 +389,7 @@ class InstagramDMSaverGUI:
         features_label = ctk.CTkLabel(
             login_frame,
             text=features_text,
-            font=ctk.CTkFont(size=10),
+            font=_font(10),
             text_color="#4CAF50"
         )
         features_label.pack(pady=(0, 40))
@@ -159,7 +400,7 @@ class InstagramDMSaverGUI:
             placeholder_text="Instagram Username",
             width=350,
             height=50,
-            font=ctk.CTkFont(size=14)
+            font=_font(14)
         )
         self.username_entry.pack(pady=10)
 
@@ -170,7 +411,7 @@ class InstagramDMSaverGUI:
             show="•",
             width=350,
             height=50,
-            font=ctk.CTkFont(size=14)
+            font=_font(14)
         )
         self.password_entry.pack(pady=10)
 
@@ -181,7 +422,7 @@ class InstagramDMSaverGUI:
             placeholder_text="2FA Code (6 digits)",
             width=350,
             height=50,
-            font=ctk.CTkFont(size=14)
+            font=_font(14)
         )
         self.twofa_entry.pack()
 
@@ -191,7 +432,7 @@ class InstagramDMSaverGUI:
             login_frame,
             text="Remember credentials (stored securely)",
             variable=self.save_creds_var,
-            font=ctk.CTkFont(size=12)
+            font=_font(12)
         )
         save_creds_check.pack(pady=15)
 
@@ -201,7 +442,7 @@ class InstagramDMSaverGUI:
             text="Login",
             width=350,
             height=50,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=_font(16, "bold"),
             command=self.handle_login
         )
         self.login_button.pack(pady=20)
@@ -213,7 +454,7 @@ class InstagramDMSaverGUI:
         self.load_saved_credentials()
 
         # Bind Enter key
-        self.password_entry.bind("<Return>", lambda e: self.handle_login())
+        self.password_entry.bind("<Return>", self.handle_login)
 
         self.logger.info("Login screen displayed")
 
@@ -228,13 +469,13 @@ class InstagramDMSaverGUI:
         except Exception as e:
             self.logger.debug(f"No saved credentials found: {e}")
 
-    def handle_login(self):
-        """Handle the login button click."""
+    def handle_login(self, event=None):
+        """Handle the login button click (or Enter in the password field)."""
         username = self.username_entry.get().strip()
         password = self.password_entry.get()
 
         if not username or not password:
-            messagebox.showerror("Error", "Please enter both username and password")
+            self._notify("Error", "Please enter both username and password")
             return
 
         # Disable button and show loading
@@ -243,23 +484,21 @@ class InstagramDMSaverGUI:
         self.login_spinner.start()
 
         # Run login in thread
-        thread = threading.Thread(
-            target=self._login_thread,
-            args=(username, password, self.save_creds_var.get())
-        )
-        thread.daemon = True
-        thread.start()
+        self._pool.submit(self._login_thread, username, password, self.save_creds_var.get())
 
     def _login_thread(self, username: str, password: str, save_creds: bool):
         """Login in background thread."""
         try:
-            self.authenticator = InstagramAuthenticator(self.config)
+            from instagram_dm_saver.core import InstagramAuthenticator
+
+            self.authenticator = InstagramAuthenticator(self.config, self.credential_manager)
 
             try:
                 client = self.authenticator.login(
                     username=username,
                     password=password,
-                    save_credentials=save_creds
+                    save_credentials=save_creds,
+                    prompt=False
                 )
                 self.root.after(0, self.login_success)
 
@@ -268,7 +507,7 @@ class InstagramDMSaverGUI:
 
         except Exception as e:
             self.logger.error(f"Login failed: {e}")
-            self.root.after(0, lambda: self.login_error(str(e)))
+            self.root.after(0, self.login_error, str(e))
 
     def show_2fa_input(self):
         """Show 2FA input field."""
@@ -286,7 +525,7 @@ class InstagramDMSaverGUI:
         """Handle 2FA verification."""
         code = self.twofa_entry.get().strip()
         if not code:
-            messagebox.showerror("Error", "Please enter 2FA code")
+            self._notify("Error", "Please enter 2FA code")
             return
 
         username = self.username_entry.get().strip()
@@ -296,12 +535,9 @@ class InstagramDMSaverGUI:
         self.login_spinner.pack(pady=10)
         self.login_spinner.start()
 
-        thread = threading.Thread(
-            target=self._verify_2fa_thread,
-            args=(username, password, code, self.save_creds_var.get())
+        self._pool.submit(
+            self._verify_2fa_thread, username, password, code, self.save_creds_var.get()
         )
-        thread.daemon = True
-        thread.start()
 
     def _verify_2fa_thread(self, username: str, password: str, code: str, save_creds: bool):
         """Verify 2FA in background thread."""
@@ -310,19 +546,20 @@ class InstagramDMSaverGUI:
                 username=username,
                 password=password,
                 verification_code=code,
-                save_credentials=save_creds
+                save_credentials=save_creds,
+                prompt=False
             )
             self.root.after(0, self.login_success)
         except Exception as e:
             self.logger.error(f"2FA verification failed: {e}")
-            self.root.after(0, lambda: self.login_error(str(e)))
+            self.root.after(0, self.login_error, str(e))
 
     def login_error(self, error_msg: str):
         """Handle login error."""
         self.login_spinner.stop()
         self.login_spinner.pack_forget()
         self.login_button.configure(state="normal", text="Login")
-        messagebox.showerror("Login Failed", f"Error: {error_msg}")
+        self._notify("Login Failed", f"Error: {error_msg}")
 
     def login_success(self):
         """Handle successful login."""
@@ -332,8 +569,7 @@ class InstagramDMSaverGUI:
     def show_main_screen(self):
         """Display the main application screen."""
         # Clear container
-        for widget in self.main_container.winfo_children():
-            widget.destroy()
+        self._purge_container(self.main_container, collect=True)
 
         # Create header
         header = ctk.CTkFrame(self.main_container, height=70, corner_radius=0, fg_color="#1f538d")
@@ -344,7 +580,7 @@ class InstagramDMSaverGUI:
         header_label = ctk.CTkLabel(
             header,
             text="📱 Instagram DM Saver v2.0",
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=_font(24, "bold"),
             text_color="white"
         )
         header_label.pack(side="left", padx=30, pady=20)
@@ -395,10 +631,11 @@ class InstagramDMSaverGUI:
             search_frame,
             placeholder_text="🔍 Search conversations...",
             height=45,
-            font=ctk.CTkFont(size=14)
+            font=_font(14)
         )
         self.search_entry.pack(fill="x", pady=5)
-        self.search_entry.bind("<KeyRelease>", self.filter_conversations)
+        self.search_entry.bind("<KeyRelease>", self._on_search_key)
+        self._search_after_id = None
 
         # Conversations list header
         list_header = ctk.CTkFrame(self.left_panel, height=50, fg_color="#2b2b2b")
@@ -408,7 +645,7 @@ class InstagramDMSaverGUI:
         list_label = ctk.CTkLabel(
             list_header,
             text="Conversations",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(18, "bold")
         )
         list_label.pack(side="left", padx=20, pady=10)
 
@@ -418,13 +655,32 @@ class InstagramDMSaverGUI:
             width=40,
             height=30,
             command=self.load_conversations,
-            font=ctk.CTkFont(size=16)
+            font=_font(16)
         )
         refresh_btn.pack(side="right", padx=10)
 
-        # Scrollable frame for conversations
-        self.conv_scroll = ctk.CTkScrollableFrame(self.left_panel)
-        self.conv_scroll.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        # Conversation list: a canvas holding widgets only for the rows in view
+        conv_list = ctk.CTkFrame(self.left_panel, fg_color="transparent")
+        conv_list.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+
+        conv_scrollbar = ctk.CTkScrollbar(conv_list, command=self._scroll_conversations)
+        conv_scrollbar.pack(side="right", fill="y")
+
+        self.conv_canvas = tk.Canvas(
+            conv_list,
+            highlightthickness=0,
+            bd=0,
+            bg="#2b2b2b",
+            yscrollcommand=conv_scrollbar.set,
+            yscrollincrement=CONVERSATION_ROW_HEIGHT // 2
+        )
+        self.conv_canvas.pack(side="left", fill="both", expand=True)
+        self.conv_canvas.bind("<Configure>", self._render_visible)
+
+        self._conv_rows = []
+        self._conv_row_width = 0
+        self._visible_threads: List["DirectThread"] = []
+        self._conv_status = None
 
         # Right panel - Messages view
         self.right_panel = ctk.CTkFrame(content_frame, corner_radius=0)
@@ -434,7 +690,7 @@ class InstagramDMSaverGUI:
         welcome_label = ctk.CTkLabel(
             self.right_panel,
             text="Select a conversation to view messages",
-            font=ctk.CTkFont(size=16),
+            font=_font(16),
             text_color="gray"
         )
         welcome_label.place(relx=0.5, rely=0.5, anchor="center")
@@ -447,16 +703,12 @@ class InstagramDMSaverGUI:
     def load_conversations(self):
         """Load conversations in background."""
         # Show loading spinner
-        for widget in self.conv_scroll.winfo_children():
-            widget.destroy()
-
-        spinner = LoadingSpinner(self.conv_scroll, text="Loading conversations...")
-        spinner.pack(pady=50)
+        self._show_conversations([])
+        spinner = LoadingSpinner(self.conv_canvas, text="Loading conversations...")
+        self._set_conversation_status(spinner)
         spinner.start()
 
-        thread = threading.Thread(target=self._load_conversations_thread)
-        thread.daemon = True
-        thread.start()
+        self._pool.submit(self._load_conversations_thread)
 
     def _load_conversations_thread(self):
         """Load conversations in background thread."""
@@ -465,123 +717,167 @@ class InstagramDMSaverGUI:
             if not client:
                 raise AuthenticationError("Not authenticated")
 
+            from instagram_dm_saver.core import MessageManager
+
             self.message_manager = MessageManager(client)
-            self.threads = self.message_manager.get_conversations()
+            threads = self.message_manager.get_conversations()
+            self._index_conversations(threads)
+            self.threads = threads
 
             self.logger.info(f"Loaded {len(self.threads)} conversations")
             self.root.after(0, self.display_conversations)
 
         except Exception as e:
             self.logger.error(f"Failed to load conversations: {e}")
-            self.root.after(0, lambda: messagebox.showerror(
-                "Error",
-                f"Failed to load conversations: {str(e)}"
-            ))
+            self.root.after(
+                0, self._notify, "Error", f"Failed to load conversations: {str(e)}"
+            )
+
+    def _index_conversations(self, threads: List["DirectThread"]):
+        """
+        Precompute the participant strings and previews used for display and search.
+
+        Args:
+            threads: Freshly loaded threads
+        """
+        self._users_display = {
+            thread.id: ", ".join([user.username for user in thread.users]) for thread in threads
+        }
+        self._previews = {thread.id: _conversation_preview(thread) for thread in threads}
+        self._search_index = SearchIndex(
+            (thread, " ".join([user.username for user in thread.users])) for thread in threads
+        )
 
     def display_conversations(self):
         """Display loaded conversations."""
-        # Clear loading
-        for widget in self.conv_scroll.winfo_children():
-            widget.destroy()
-
-        if not self.threads:
-            no_conv_label = ctk.CTkLabel(
-                self.conv_scroll,
-                text="No conversations found",
-                font=ctk.CTkFont(size=14),
+        self._show_conversations(self.threads, "No conversations found")
+
+    def _show_conversations(self, threads: List["DirectThread"], empty_text: Optional[str] = None):
+        """
+        Point the conversation list at a new set of threads.
+
+        Args:
+            threads: Threads to list, in display order
+            empty_text: Placeholder shown when threads is empty
+        """
+        self._visible_threads = threads
+        self.conv_canvas.configure(
+            scrollregion=(0, 0, 0, len(threads) * CONVERSATION_ROW_HEIGHT)
+        )
+        self.conv_canvas.yview_moveto(0)
+
+        status = None
+        if empty_text and not threads:
+            status = ctk.CTkLabel(
+                self.conv_canvas,
+                text=empty_text,
+                font=_font(14),
                 text_color="gray"
             )
-            no_conv_label.pack(pady=50)
-            return
-
-        # Display each conversation
-        for thread in self.threads:
-            self.create_conversation_item(thread)
-
-    def create_conversation_item(self, thread: DirectThread):
-        """Create a conversation item widget."""
-        # Frame for each conversation
-        conv_frame = ctk.CTkFrame(
-            self.conv_scroll,
-            height=90,
-            cursor="hand2",
-            fg_color="#2b2b2b",
-            border_width=2,
-            border_color="#3b3b3b"
+        self._set_conversation_status(status)
+        self._render_visible()
+
+    def _set_conversation_status(self, widget=None):
+        """Replace the placeholder (spinner or message) shown over the conversation list."""
+        if self._conv_status is not None:
+            if isinstance(self._conv_status, LoadingSpinner):
+                self._conv_status.stop()
+            self._conv_status.destroy()
+
+        self._conv_status = widget
+        if widget is not None:
+            widget.place(relx=0.5, y=50, anchor="n")
+
+    def _render_visible(self, event=None):
+        """Bind pooled rows to the threads inside the viewport and hide the rest."""
+        canvas = self.conv_canvas
+        top = int(canvas.canvasy(0))
+        first = max(top // CONVERSATION_ROW_HEIGHT - CONVERSATION_OVERSCAN, 0)
+        last = min(
+            (top + canvas.winfo_height()) // CONVERSATION_ROW_HEIGHT + 1 + CONVERSATION_OVERSCAN,
+            len(self._visible_threads)
         )
-        conv_frame.pack(fill="x", padx=5, pady=5)
-        conv_frame.pack_propagate(False)
 
-        # Username
-        users = ", ".join([user.username for user in thread.users])
-        name_label = ctk.CTkLabel(
-            conv_frame,
-            text=users,
-            font=ctk.CTkFont(size=16, weight="bold"),
-            anchor="w"
-        )
-        name_label.pack(padx=20, pady=(20, 5), anchor="w")
-
-        # Last message preview
-        last_msg = "[No messages]"
-        try:
-            if thread.messages and thread.messages[0].text:
-                last_msg = thread.messages[0].text
-                if len(last_msg) > 60:
-                    last_msg = last_msg[:57] + "..."
-        except:
-            pass
-
-        msg_label = ctk.CTkLabel(
-            conv_frame,
-            text=last_msg,
-            font=ctk.CTkFont(size=12),
-            text_color="gray",
-            anchor="w"
-        )
-        msg_label.pack(padx=20, pady=(0, 20), anchor="w")
+        # Only touch the window width when the canvas was resized, so scrolling
+        # doesn't make Tk re-measure every pooled row
+        width = max(canvas.winfo_width() - 10, 1)
+        if width != self._conv_row_width:
+            self._conv_row_width = width
+            for _, window in self._conv_rows:
+                canvas.itemconfigure(window, width=width)
+
+        while len(self._conv_rows) < last - first:
+            row = ConversationRow(canvas)
+            window = canvas.create_window(
+                0, 0, anchor="nw", window=row, width=width, height=CONVERSATION_ROW_HEIGHT - 10
+            )
+            self._conv_rows.append((row, window))
+
+        for slot, (row, window) in enumerate(self._conv_rows):
+            index = first + slot
+            if index >= last:
+                canvas.itemconfigure(window, state="hidden")
+                continue
+
+            thread = self._visible_threads[index]
+            if row.thread is not thread:
+                row.show(thread, self._users_display[thread.id], self._previews[thread.id])
+            canvas.coords(window, 5, index * CONVERSATION_ROW_HEIGHT + 5)
+            canvas.itemconfigure(window, state="normal")
+
+    def _scroll_conversations(self, *args):
+        """Scrollbar callback for the conversation list."""
+        self.conv_canvas.yview(*args)
+        self._render_visible()
+
+    def _in_conversation_list(self, event) -> bool:
+        """Check whether an event happened on the conversation list or one of its rows."""
+        canvas = self.conv_canvas
+        if canvas is None or not canvas.winfo_exists():
+            return False
+        widget, path = str(event.widget), str(canvas)
+        return widget == path or widget.startswith(path + ".")
+
+    def _on_conversation_click(self, event):
+        """Open the conversation whose row is under the pointer."""
+        if not self._in_conversation_list(event):
+            return
 
-        # Click handler
-        conv_frame.bind("<Button-1>", lambda e: self.select_conversation(thread))
-        name_label.bind("<Button-1>", lambda e: self.select_conversation(thread))
-        msg_label.bind("<Button-1>", lambda e: self.select_conversation(thread))
+        canvas = self.conv_canvas
+        y = int(canvas.canvasy(event.y_root - canvas.winfo_rooty()))
+        index, offset = divmod(y, CONVERSATION_ROW_HEIGHT)
+        # Rows are drawn 5px below their slot top and are 10px shorter than the slot
+        if index < len(self._visible_threads) and 5 <= offset < CONVERSATION_ROW_HEIGHT - 5:
+            self.select_conversation(self._visible_threads[index])
 
-        # Hover effect
-        def on_enter(e):
-            conv_frame.configure(border_color="#1f538d")
+    def _on_conversation_wheel(self, event):
+        """Scroll the conversation list with the mouse wheel."""
+        if not self._in_conversation_list(event):
+            return
 
-        def on_leave(e):
-            conv_frame.configure(border_color="#3b3b3b")
+        # Button-4 / positive delta scroll up; Button-5 / negative delta scroll down
+        units = -1 if event.num == 4 or event.delta > 0 else 1
+        self.conv_canvas.yview_scroll(units, "units")
+        self._render_visible()
 
-        conv_frame.bind("<Enter>", on_enter)
-        conv_frame.bind("<Leave>", on_leave)
+    def _on_search_key(self, event):
+        """Restart the search delay so a burst of keystrokes filters only once."""
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self.filter_conversations)
 
-    def filter_conversations(self, event):
+    def filter_conversations(self, event=None):
         """Filter conversations based on search."""
+        self._search_after_id = None
         search_term = self.search_entry.get().lower()
 
-        # Clear current display
-        for widget in self.conv_scroll.winfo_children():
-            widget.destroy()
-
-        # Display filtered conversations
-        filtered_count = 0
-        for thread in self.threads:
-            users_str = " ".join([user.username.lower() for user in thread.users])
-            if search_term in users_str:
-                self.create_conversation_item(thread)
-                filtered_count += 1
-
-        if filtered_count == 0 and search_term:
-            no_results_label = ctk.CTkLabel(
-                self.conv_scroll,
-                text=f"No conversations found for '{search_term}'",
-                font=ctk.CTkFont(size=14),
-                text_color="gray"
-            )
-            no_results_label.pack(pady=50)
+        filtered = self._search_index.search(search_term)
+        self._show_conversations(
+            filtered,
+            f"No conversations found for '{search_term}'" if search_term else None
+        )
 
-    def select_conversation(self, thread: DirectThread):
+    def select_conversation(self, thread: "DirectThread"):
         """Handle conversation selection."""
         self.current_thread = thread
         self.logger.info(f"Selected conversation: {[u.username for u in thread.users]}")
@@ -589,20 +885,25 @@ class InstagramDMSaverGUI:
 
     def show_messages_view(self):
         """Display messages interface for selected conversation."""
-        # Clear right panel
-        for widget in self.right_panel.winfo_children():
-            widget.destroy()
+        self._cancel_message_render()
+        self._fetch_generation += 1
+
+        # Clear right panel; the previous conversation's widgets and
+        # messages are dropped before the new view is built
+        self._bubble_pool = {}
+        self.messages = []
+        self._purge_container(self.right_panel)
 
         # Header with conversation info
         msg_header = ctk.CTkFrame(self.right_panel, height=90, fg_color="#2b5278")
         msg_header.pack(fill="x", padx=0, pady=0)
         msg_header.pack_propagate(False)
 
-        users = ", ".join([user.username for user in self.current_thread.users])
+        users = self._users_display[self.current_thread.id]
         conv_label = ctk.CTkLabel(
             msg_header,
             text=f"💬 {users}",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=_font(20, "bold"),
             text_color="white"
         )
         conv_label.pack(side="left", padx=30, pady=25)
@@ -615,7 +916,7 @@ class InstagramDMSaverGUI:
         count_label = ctk.CTkLabel(
             button_frame,
             text="Messages:",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color="white"
         )
         count_label.pack(side="left", padx=5)
@@ -655,18 +956,42 @@ class InstagramDMSaverGUI:
         )
         self.save_btn.pack(side="left", padx=5)
 
-        # Messages area
-        self.msg_scroll = ctk.CTkScrollableFrame(self.right_panel)
-        self.msg_scroll.pack(fill="both", expand=True, padx=20, pady=20)
+        # Compact view toggle
+        self.compact_switch = ctk.CTkSwitch(
+            button_frame,
+            text="Compact",
+            variable=self.compact_var,
+            command=self._on_view_mode_change,
+            text_color="white"
+        )
+        self.compact_switch.pack(side="left", padx=5)
+
+        # Messages area: bubbles in a scrollable frame, or one text widget in compact mode
+        self.msg_area = ctk.CTkFrame(self.right_panel, fg_color="transparent")
+        self.msg_area.pack(fill="both", expand=True, padx=20, pady=20)
+
+        self.msg_scroll = ctk.CTkScrollableFrame(self.msg_area)
+        self._build_message_text()
+
+        # Message widgets are pooled per kind and reused across fetches
+        self._bubble_pool = {"me": [], "them": [], "date": []}
+        self._bubble_used = dict.fromkeys(self._bubble_pool, 0)
+        self._msg_status = None
+        # (date, separator) of the first day shown, where older pages are inserted
+        self._msg_top = None
+        # First day shown in the compact view
+        self._text_top_date = None
+
+        self._show_message_view()
 
         # Info label
         info_label = ctk.CTkLabel(
-            self.msg_scroll,
+            self.msg_area,
             text="Click 'Fetch Messages' to load conversation history",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             text_color="gray"
         )
-        info_label.pack(pady=100)
+        self._set_message_status(info_label)
 
     def fetch_messages(self):
         """Fetch messages for current conversation."""
@@ -676,128 +1001,349 @@ class InstagramDMSaverGUI:
             count = self.config.default_message_count
 
         # Show loading
-        for widget in self.msg_scroll.winfo_children():
-            widget.destroy()
-
-        spinner = LoadingSpinner(self.msg_scroll, text=f"Fetching {count} messages...")
-        spinner.pack(pady=100)
+        self._cancel_message_render()
+        self._clear_messages()
+        self.messages = []
+        self.save_btn.configure(state="disabled")
+        self.compact_switch.configure(state="disabled")
+        spinner = LoadingSpinner(self.msg_area, text=f"Fetching {count} messages...")
+        self._set_message_status(spinner)
         spinner.start()
 
-        thread = threading.Thread(target=self._fetch_messages_thread, args=(count,))
-        thread.daemon = True
-        thread.start()
+        self._fetch_generation += 1
+        user_id = self.authenticator.get_client().user_id
+        self._pool.submit(
+            self._fetch_messages_thread, self.current_thread, count, user_id, self._fetch_generation
+        )
 
-    def _fetch_messages_thread(self, count: int):
-        """Fetch messages in background thread."""
+    def _fetch_messages_thread(
+        self,
+        conversation: "DirectThread",
+        count: int,
+        user_id,
+        generation: int
+    ):
+        """Fetch messages in background thread, handing each page to the UI as it arrives."""
+        pages = []
         try:
-            self.messages = self.message_manager.fetch_messages(
-                self.current_thread,
-                count
-            )
-            self.logger.info(f"Fetched {len(self.messages)} messages")
-            self.root.after(0, self.display_messages)
+            for batch in self.message_manager.iter_message_batches(conversation, count):
+                # Stop if the user has started another fetch or opened another conversation
+                if generation != self._fetch_generation:
+                    return
+                pages.append(batch)
+                self.root.after(0, self._prepend_message_batch, generation, batch, user_id)
+
+            # Build the sorted list here rather than on the Tk thread
+            self.root.after(0, self._finish_message_stream, generation, _merge_pages(pages))
 
         except Exception as e:
             self.logger.error(f"Failed to fetch messages: {e}")
-            self.root.after(0, lambda: messagebox.showerror(
+            self.root.after(0, self._on_fetch_error, generation, str(e), _merge_pages(pages))
+
+    def _on_fetch_error(self, generation: int, error: str, messages: List["DirectMessage"]):
+        """
+        Report a failed fetch of the conversation still being shown.
+
+        Pages that arrived before the error are already on screen, so they are
+        kept and can still be saved.
+
+        Args:
+            generation: Fetch that failed
+            error: Error description
+            messages: Messages fetched before the error, oldest first
+        """
+        if generation != self._fetch_generation:
+            return
+
+        self._set_message_status(None)
+        self.messages = messages
+        self.compact_switch.configure(state="normal")
+
+        if messages:
+            self.save_btn.configure(state="normal")
+            self._notify(
                 "Error",
-                f"Failed to fetch messages: {str(e)}"
-            ))
+                f"Failed to fetch messages: {error}\n\n"
+                f"Kept the {len(messages)} messages fetched before the error."
+            )
+        else:
+            self._notify("Error", f"Failed to fetch messages: {error}")
+
+    def _prepend_message_batch(self, generation: int, batch: List["DirectMessage"], user_id):
+        """
+        Show a page of messages above the ones already displayed.
+
+        Args:
+            generation: Fetch the page belongs to
+            batch: Messages sorted oldest first, all older than those shown
+            user_id: ID of the logged-in account
+        """
+        if generation != self._fetch_generation or not batch:
+            return
 
-    def display_messages(self):
-        """Display fetched messages."""
-        # Clear loading
-        for widget in self.msg_scroll.winfo_children():
-            widget.destroy()
+        self._set_message_status(None)
+        if self.compact_var.get():
+            self._prepend_text_batch(batch, user_id)
+            return
+
+        top_date, top_separator = self._msg_top or (None, None)
+        for _ in self._render_message_batches(batch, user_id, before=top_separator):
+            pass
+
+        # The previous top day continues from this page, so its heading moves up
+        if top_separator is not None and batch[-1].timestamp.date() == top_date:
+            top_separator.pack_forget()
+
+    def _finish_message_stream(self, generation: int, messages: List["DirectMessage"]):
+        """
+        Keep the streamed messages once the fetch has completed.
+
+        Args:
+            generation: Fetch the messages belong to
+            messages: All fetched messages, oldest first
+        """
+        if generation != self._fetch_generation:
+            return
+
+        self.messages = messages
+        self.logger.info(f"Fetched {len(self.messages)} messages")
+        self.compact_switch.configure(state="normal")
 
         if not self.messages:
             no_msg_label = ctk.CTkLabel(
-                self.msg_scroll,
+                self.msg_area,
                 text="No messages found",
-                font=ctk.CTkFont(size=14),
+                font=_font(14),
                 text_color="gray"
             )
-            no_msg_label.pack(pady=100)
+            self._set_message_status(no_msg_label)
             return
 
         # Enable save button
         self.save_btn.configure(state="normal")
 
-        # Sort messages by timestamp
-        sorted_messages = sorted(self.messages, key=lambda m: m.timestamp)
+    def _set_message_status(self, widget=None):
+        """Replace the placeholder (spinner or message) shown in the messages area."""
+        if self._msg_status is not None:
+            if isinstance(self._msg_status, LoadingSpinner):
+                self._msg_status.stop()
+            self._msg_status.destroy()
+
+        self._msg_status = widget
+        if widget is not None:
+            widget.place(relx=0.5, y=100, anchor="n")
+            widget.lift()
+
+    def _acquire_bubble(self, kind: str):
+        """
+        Take the next unused message widget of a kind from the pool.
+
+        Args:
+            kind: "me" or "them" for message bubbles, "date" for date separators
+
+        Returns:
+            Unpacked widget, built only when the pool has run out
+        """
+        pool = self._bubble_pool[kind]
+        used = self._bubble_used[kind]
+        if used == len(pool):
+            if kind == "date":
+                pool.append(DateSeparator(self.msg_scroll))
+            else:
+                pool.append(MessageBubble(self.msg_scroll, is_me=kind == "me"))
+        self._bubble_used[kind] = used + 1
+        return pool[used]
+
+    def _release_all_bubbles(self):
+        """Unpack every pooled message widget so the next render can reuse it."""
+        for kind, pool in self._bubble_pool.items():
+            for widget in pool[:self._bubble_used[kind]]:
+                widget.pack_forget()
+            self._bubble_used[kind] = 0
+        self._msg_top = None
+
+    def _clear_messages(self):
+        """Remove displayed messages from both views."""
+        self._release_all_bubbles()
+        self.msg_text.configure(state="normal")
+        self.msg_text.delete("1.0", "end")
+        self.msg_text.configure(state="disabled")
+        self._text_top_date = None
 
-        # Display messages
-        current_date = None
-        client = self.authenticator.get_client()
+    def display_messages(self):
+        """Display all fetched messages from scratch."""
+        self._cancel_message_render()
+        self._clear_messages()
 
-        for msg in sorted_messages:
-            # Date separator
-            msg_date = msg.timestamp.date()
-            if current_date != msg_date:
-                date_frame = ctk.CTkFrame(
-                    self.msg_scroll,
-                    height=40,
-                    fg_color="transparent"
-                )
-                date_frame.pack(fill="x", pady=20)
+        if not self.messages:
+            no_msg_label = ctk.CTkLabel(
+                self.msg_area,
+                text="No messages found",
+                font=_font(14),
+                text_color="gray"
+            )
+            self._set_message_status(no_msg_label)
+            return
 
-                date_label = ctk.CTkLabel(
-                    date_frame,
-                    text=msg_date.strftime("%B %d, %Y"),
-                    font=ctk.CTkFont(size=12, weight="bold"),
-                    text_color="gray"
-                )
-                date_label.pack()
-                current_date = msg_date
+        # Clear loading
+        self._set_message_status(None)
 
-            # Message bubble
-            is_me = msg.user_id == client.user_id
+        # Enable save button
+        self.save_btn.configure(state="normal")
 
-            bubble_container = ctk.CTkFrame(self.msg_scroll, fg_color="transparent")
-            bubble_container.pack(fill="x", padx=20, pady=5)
+        # Already sorted oldest first by the fetch worker
+        sorted_messages = self.messages
 
-            bubble = ctk.CTkFrame(
-                bubble_container,
-                corner_radius=15,
-                fg_color="#1f538d" if is_me else "#3b3b3b"
-            )
+        self.logger.info(f"Displaying {len(sorted_messages)} messages")
+        client = self.authenticator.get_client()
+        if self.compact_var.get():
+            self._prepend_text_batch(sorted_messages, client.user_id)
+            return
 
-            if is_me:
-                bubble.pack(side="right", padx=10, fill="x")
-            else:
-                bubble.pack(side="left", padx=10, fill="x")
-
-            # Message content
-            msg_text = msg.text if msg.text else "[Media]"
-            msg_label = ctk.CTkLabel(
-                bubble,
-                text=msg_text,
-                font=ctk.CTkFont(size=14),
-                wraplength=500,
-                anchor="w",
-                justify="left"
-            )
-            msg_label.pack(padx=15, pady=(12, 5), anchor="w")
+        # Render in batches so the main loop can repaint and handle input in between
+        self._display_messages_chunk(self._render_message_batches(sorted_messages, client.user_id))
 
-            # Timestamp
-            time_label = ctk.CTkLabel(
-                bubble,
-                text=msg.timestamp.strftime("%H:%M"),
-                font=ctk.CTkFont(size=10),
-                text_color="gray"
-            )
+    def _build_message_text(self):
+        """Create the single text widget used by the compact view."""
+        self.msg_text_frame = ctk.CTkFrame(self.msg_area)
 
-            if is_me:
-                time_label.pack(padx=15, pady=(0, 10), anchor="e")
-            else:
-                time_label.pack(padx=15, pady=(0, 10), anchor="w")
+        scrollbar = ctk.CTkScrollbar(self.msg_text_frame)
+        scrollbar.pack(side="right", fill="y")
 
-        self.logger.info(f"Displayed {len(sorted_messages)} messages")
+        self.msg_text = tk.Text(
+            self.msg_text_frame,
+            wrap="word",
+            state="disabled",
+            cursor="arrow",
+            bd=0,
+            highlightthickness=0,
+            bg="#2b2b2b",
+            fg="white",
+            font=_font(14),
+            padx=15,
+            pady=10,
+            spacing1=4,
+            spacing3=4,
+            yscrollcommand=scrollbar.set
+        )
+        self.msg_text.pack(side="left", fill="both", expand=True)
+        scrollbar.configure(command=self.msg_text.yview)
+
+        # Tags stand in for the bubble colours and date headings
+        self.msg_text.tag_configure(
+            "me", background="#1f538d", justify="right", lmargin1=200, lmargin2=200, rmargin=10
+        )
+        self.msg_text.tag_configure("them", background="#3b3b3b", rmargin=200)
+        self.msg_text.tag_configure(
+            "date", foreground="gray", justify="center", font=_font(12, "bold"), spacing1=20
+        )
+
+    def _show_message_view(self):
+        """Show the bubble view or the compact text view, whichever is selected."""
+        if self.compact_var.get():
+            self.msg_scroll.pack_forget()
+            self.msg_text_frame.pack(fill="both", expand=True)
+        else:
+            self.msg_text_frame.pack_forget()
+            self.msg_scroll.pack(fill="both", expand=True)
+
+        if self._msg_status is not None:
+            self._msg_status.lift()
+
+    def _on_view_mode_change(self):
+        """Redisplay the fetched messages in the newly selected view."""
+        self._show_message_view()
+        if self.messages:
+            self.display_messages()
+
+    def _prepend_text_batch(self, sorted_messages: List["DirectMessage"], user_id):
+        """
+        Insert messages at the top of the compact view in a single call.
+
+        Args:
+            sorted_messages: Messages, oldest first, all older than those shown
+            user_id: ID of the logged-in account
+        """
+        segments = []
+        for msg_date, day in groupby(sorted_messages, key=_message_date):
+            segments += (format_date(msg_date, DATE_SEPARATOR_FORMAT) + "\n", "date")
+            for msg in day:
+                segments += (
+                    f"{format_time(msg.timestamp, False)}  {msg.text or '[Media]'}\n",
+                    "me" if msg.user_id == user_id else "them",
+                )
+
+        text = self.msg_text
+        text.configure(state="normal")
+        # The previous top day continues from this page, so its heading moves up
+        if self._text_top_date == sorted_messages[-1].timestamp.date():
+            text.delete("1.0", "2.0")
+        text.insert("1.0", *segments)
+        text.configure(state="disabled")
+        self._text_top_date = sorted_messages[0].timestamp.date()
+
+    def _display_messages_chunk(self, batches):
+        """Render the next batch of messages and schedule the one after it."""
+        try:
+            next(batches)
+        except StopIteration:
+            self._render_job = None
+            return
+        self._render_job = self.root.after(1, self._display_messages_chunk, batches)
+
+    def _cancel_message_render(self):
+        """Stop a message render that is still in progress."""
+        if self._render_job is not None:
+            self.root.after_cancel(self._render_job)
+            self._render_job = None
+
+    def _render_message_batches(
+        self,
+        sorted_messages: List["DirectMessage"],
+        user_id,
+        before=None
+    ):
+        """
+        Pack message widgets, pausing after every MESSAGE_RENDER_BATCH messages.
+
+        Args:
+            sorted_messages: Messages, oldest first
+            user_id: ID of the logged-in account
+            before: Widget to insert the messages above; appended at the end if None
+
+        Yields:
+            None after each batch
+        """
+        # Read every field the loop needs in one pass, as parallel lists
+        timestamps = list(map(attrgetter("timestamp"), sorted_messages))
+        dates = [timestamp.date() for timestamp in timestamps]
+        times = [format_time(timestamp, False) for timestamp in timestamps]
+        texts = [msg.text or "[Media]" for msg in sorted_messages]
+        kinds = ["me" if msg.user_id == user_id else "them" for msg in sorted_messages]
+
+        count = 0
+        for msg_date, day in groupby(zip(dates, kinds, texts, times), key=itemgetter(0)):
+            # Date separator
+            separator = self._acquire_bubble("date")
+            separator.show(format_date(msg_date, DATE_SEPARATOR_FORMAT))
+            separator.pack(fill="x", pady=20, before=before)
+            if count == 0:
+                self._msg_top = (msg_date, separator)
+
+            for _, kind, text, time_text in day:
+                # Message bubble
+                bubble = self._acquire_bubble(kind)
+                bubble.show(text, time_text)
+                bubble.pack(fill="x", padx=20, pady=5, before=before)
+
+                count += 1
+                if count % MESSAGE_RENDER_BATCH == 0:
+                    yield
 
     def save_messages(self):
         """Save messages to file."""
         if not self.messages:
-            messagebox.showwarning("Warning", "No messages to save")
+            self._notify("Warning", "No messages to save")
             return
 
         # Create format selection window
@@ -817,7 +1363,7 @@ class InstagramDMSaverGUI:
         title_label = ctk.CTkLabel(
             format_window,
             text="Choose Export Format",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_font(20, "bold")
         )
         title_label.pack(pady=30)
 
@@ -837,7 +1383,7 @@ class InstagramDMSaverGUI:
                 text=text,
                 variable=format_var,
                 value=value,
-                font=ctk.CTkFont(size=14)
+                font=_font(14)
             )
             radio.pack(pady=10, padx=30, anchor="w")
 
@@ -852,34 +1398,38 @@ class InstagramDMSaverGUI:
             command=do_export,
             width=200,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         export_btn.pack(pady=30)
 
     def _save_messages_with_format(self, file_format: str):
-        """Save messages with selected format."""
-        try:
-            client = self.authenticator.get_client()
-            exporter = MessageExporter(self.config.save_dir)
-
-            output_path = exporter.export(
-                self.current_thread,
-                self.messages,
-                format=file_format,
-                current_user_id=client.user_id,
-                current_username=client.username if hasattr(client, 'username') else "You"
-            )
-
-            self.logger.info(f"Exported {len(self.messages)} messages to {output_path}")
-
-            messagebox.showinfo(
-                "Success",
-                f"Messages saved successfully!\n\n{output_path}"
-            )
+        """Save messages with selected format on the background writer thread."""
+        client = self.authenticator.get_client()
+        exporter = MessageExporter(self.config.save_dir)
+
+        future = exporter.export_in_background(
+            self.current_thread,
+            self.messages,
+            format=file_format,
+            current_user_id=client.user_id,
+            current_username=self.message_manager.get_current_username(client)
+        )
+        # Tk widgets may only be touched from the main loop
+        message_count = len(self.messages)
+        future.add_done_callback(partial(self.root.after, 0, self._on_export_done, message_count))
 
+    def _on_export_done(self, message_count: int, future):
+        """Report the result of a background export."""
+        try:
+            output_path = future.result()
         except Exception as e:
             self.logger.error(f"Failed to save messages: {e}")
-            messagebox.showerror("Error", f"Failed to save messages: {str(e)}")
+            self._notify("Error", f"Failed to save messages: {str(e)}")
+            return
+
+        self.logger.info(f"Exported {message_count} messages to {output_path}")
+
+        self._notify("Success", f"Messages saved successfully!\n\n{output_path}")
 
     def show_settings(self):
         """Show settings window."""
@@ -899,7 +1449,7 @@ class InstagramDMSaverGUI:
         title_label = ctk.CTkLabel(
             settings_window,
             text="⚙️ Settings",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=_font(24, "bold")
         )
         title_label.pack(pady=30)
 
@@ -911,7 +1461,7 @@ class InstagramDMSaverGUI:
         dir_label = ctk.CTkLabel(
             settings_frame,
             text="Save Directory:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         dir_label.pack(anchor="w", padx=20, pady=(20, 5))
 
@@ -941,7 +1491,7 @@ class InstagramDMSaverGUI:
         count_label = ctk.CTkLabel(
             settings_frame,
             text="Default Message Count:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         count_label.pack(anchor="w", padx=20, pady=(20, 5))
 
@@ -957,7 +1507,7 @@ class InstagramDMSaverGUI:
         log_label = ctk.CTkLabel(
             settings_frame,
             text="Log Level:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         log_label.pack(anchor="w", padx=20, pady=(20, 5))
 
@@ -992,27 +1542,137 @@ class InstagramDMSaverGUI:
             command=save_settings,
             width=200,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
         save_btn.pack(pady=30)
 
+    def _dialog(self, title: str, message: str) -> Tuple[ctk.CTkToplevel, ctk.CTkFrame]:
+        """
+        Build a small dialog window centred on screen.
+
+        Args:
+            title: Window title
+            message: Text shown in the dialog
+
+        Returns:
+            Tuple of (dialog window, frame for the dialog's buttons)
+        """
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title(title)
+        dialog.geometry("400x180")
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+
+        # Center window
+        dialog.update_idletasks()
+        x = (dialog.winfo_screenwidth() // 2) - (400 // 2)
+        y = (dialog.winfo_screenheight() // 2) - (180 // 2)
+        dialog.geometry(f"+{x}+{y}")
+
+        message_label = ctk.CTkLabel(
+            dialog,
+            text=message,
+            font=_font(14),
+            wraplength=360,
+            justify="center"
+        )
+        message_label.pack(expand=True, padx=20, pady=(20, 10))
+
+        button_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        button_frame.pack(pady=(0, 20))
+        return dialog, button_frame
+
+    def _notify(self, title: str, message: str):
+        """
+        Show a message without blocking the main loop.
+
+        Unlike tkinter.messagebox this returns immediately, so the window
+        keeps repainting and background callbacks keep running.
+
+        Args:
+            title: Window title
+            message: Text to show
+        """
+        dialog, button_frame = self._dialog(title, message)
+        ok_btn = ctk.CTkButton(button_frame, text="OK", width=100, command=dialog.destroy)
+        ok_btn.pack()
+        ok_btn.focus()
+
+    def _confirm(self, title: str, message: str) -> bool:
+        """
+        Ask a yes/no question in a modal CustomTkinter dialog.
+
+        Args:
+            title: Window title
+            message: Question to ask
+
+        Returns:
+            True if the user chose Yes
+        """
+        answer = tk.BooleanVar(value=False)
+        dialog, button_frame = self._dialog(title, message)
+
+        yes_btn = ctk.CTkButton(
+            button_frame, text="Yes", width=100, command=partial(answer.set, True)
+        )
+        yes_btn.pack(side="left", padx=10)
+        no_btn = ctk.CTkButton(
+            button_frame,
+            text="No",
+            width=100,
+            command=partial(answer.set, False),
+            fg_color="#3b3b3b",
+            hover_color="#4b4b4b"
+        )
+        no_btn.pack(side="left", padx=10)
+        dialog.protocol("WM_DELETE_WINDOW", partial(answer.set, False))
+
+        dialog.grab_set()
+        self.root.wait_variable(answer)
+        dialog.destroy()
+        return answer.get()
+
     def logout(self):
         """Handle logout."""
-        if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
+        if self._confirm("Logout", "Are you sure you want to logout?"):
             try:
+                self._cancel_message_render()
+                self._fetch_generation += 1
+                if self._search_after_id is not None:
+                    self.root.after_cancel(self._search_after_id)
+                    self._search_after_id = None
                 self.authenticator.logout(delete_session=True, delete_credentials=False)
                 self.authenticator = None
                 self.message_manager = None
                 self.threads = []
+                self._users_display = {}
+                self._previews = {}
+                self._search_index = SearchIndex()
                 self.current_thread = None
                 self.messages = []
 
+                # Drop references to the main screen's widgets so purging
+                # the container can free them
+                self._set_conversation_status(None)
+                self._set_message_status(None)
+                self.conv_canvas = None
+                self._conv_rows = []
+                self._visible_threads = []
+                self._bubble_pool = {}
+
                 self.logger.info("User logged out")
                 self.show_login_screen()
 
             except Exception as e:
                 self.logger.error(f"Error during logout: {e}")
-                messagebox.showerror("Error", f"Error during logout: {str(e)}")
+                self._notify("Error", f"Error during logout: {str(e)}")
+
+    def close(self):
+        """Stop background work and close the window."""
+        # Makes a running message fetch stop after its current page
+        self._fetch_generation += 1
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
 
     def run(self):
         """Run the GUI application."""
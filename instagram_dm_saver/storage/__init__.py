@@ -1,7 +1,7 @@
 """Storage modules for configuration, credentials, and exports."""
 
 from .config import AppConfig, get_config, reload_config
-from .credentials import CredentialManager
+from .credentials import CredentialManager, clear_credentials_cache
 from .exporters import MessageExporter
 
 __all__ = [
@@ -9,5 +9,6 @@ __all__ = [
     "get_config",
     "reload_config",
     "CredentialManager",
+    "clear_credentials_cache",
     "MessageExporter",
 ]
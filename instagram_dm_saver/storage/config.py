@@ -1,22 +1,31 @@
 """Configuration management with validation."""
 
-import json
+import os
 from pathlib import Path
 from typing import Literal, Optional
 from pydantic import BaseModel, Field, field_validator
 
 from ..utils.exceptions import ConfigurationError
 from ..utils.logger import get_logger
+from ..utils.serialization import dumps, loads
 
 logger = get_logger(__name__)
 
+# Directory under the user's home holding the config, session and logs
+CONFIG_DIR_NAME = ".instagram_dm_fetcher"
+
+
+def _default_config_file() -> Path:
+    """Config file used when none is given, and the one get_config() caches."""
+    return Path.home() / CONFIG_DIR_NAME / "config.json"
+
 
 class AppConfig(BaseModel):
     """Application configuration with validation."""
 
     # Directories
     config_dir: Path = Field(
-        default=Path.home() / ".instagram_dm_fetcher",
+        default=Path.home() / CONFIG_DIR_NAME,
         description="Directory for configuration files"
     )
     save_dir: Path = Field(
@@ -100,7 +109,7 @@ class AppConfig(BaseModel):
     def set_log_dir_default(cls, v: Optional[Path], info) -> Path:
         """Set log_dir default based on config_dir."""
         if v is None:
-            config_dir = info.data.get("config_dir", Path.home() / ".instagram_dm_fetcher")
+            config_dir = info.data.get("config_dir", Path.home() / CONFIG_DIR_NAME)
             v = config_dir / "logs"
         try:
             v.mkdir(parents=True, exist_ok=True)
@@ -115,6 +124,8 @@ class AppConfig(BaseModel):
         Args:
             config_file: Path to config file. If None, uses config_dir/config.json
         """
+        global _config
+
         if config_file is None:
             config_file = self.config_dir / "config.json"
 
@@ -125,10 +136,33 @@ class AppConfig(BaseModel):
             config_dict['save_dir'] = str(self.save_dir)
             config_dict['log_dir'] = str(self.log_dir)
 
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_dict, f, indent=2)
-
-            logger.info(f"Configuration saved to {config_file}")
+            data = dumps(config_dict, indent=True)
+
+            # Skip the write when nothing changed on disk
+            try:
+                unchanged = config_file.read_bytes() == data
+            except FileNotFoundError:
+                unchanged = False
+
+            if unchanged:
+                logger.debug(f"Configuration unchanged, not rewriting {config_file}")
+            else:
+                config_file.parent.mkdir(parents=True, exist_ok=True)
+                # Write a sibling file and swap it in, so an interrupted save
+                # never leaves a truncated config behind
+                tmp_file = config_file.with_name(config_file.name + ".tmp")
+                try:
+                    tmp_file.write_bytes(data)
+                    os.replace(tmp_file, config_file)
+                except BaseException:
+                    tmp_file.unlink(missing_ok=True)
+                    raise
+                logger.info(f"Configuration saved to {config_file}")
+
+            # Keep the process-wide cache in sync so get_config() never has
+            # to re-read what was just written
+            if config_file == _default_config_file():
+                _config = self
 
         except Exception as e:
             raise ConfigurationError(f"Failed to save configuration: {e}")
@@ -145,15 +179,10 @@ class AppConfig(BaseModel):
             AppConfig instance
         """
         if config_file is None:
-            config_file = Path.home() / ".instagram_dm_fetcher" / "config.json"
-
-        if not config_file.exists():
-            logger.info("No config file found, using defaults")
-            return cls()
+            config_file = _default_config_file()
 
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            config_data = loads(config_file.read_bytes())
 
             # Convert string paths back to Path objects
             if 'config_dir' in config_data:
@@ -166,6 +195,10 @@ class AppConfig(BaseModel):
             logger.info(f"Configuration loaded from {config_file}")
             return cls(**config_data)
 
+        except FileNotFoundError:
+            logger.info("No config file found, using defaults")
+            return cls()
+
         except Exception as e:
             logger.error(f"Failed to load configuration: {e}")
             logger.info("Using default configuration")
@@ -188,6 +221,9 @@ def get_config() -> AppConfig:
     """
     Get global configuration instance.
 
+    The config file is read once per process; later calls return the cached
+    instance, which AppConfig.save() updates when writing the default file.
+
     Returns:
         AppConfig instance
     """
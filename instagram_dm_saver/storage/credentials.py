@@ -1,10 +1,10 @@
 """Secure credential storage with multiple backend support."""
 
-import json
 import os
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from cryptography.fernet import Fernet
+from dotenv import find_dotenv, load_dotenv
 
 try:
     import keyring
@@ -12,13 +12,51 @@ try:
 except ImportError:
     KEYRING_AVAILABLE = False
 
+if KEYRING_AVAILABLE:
+    # Resolve the backend once instead of going through keyring's lookup on
+    # every call; fall back to the module-level API if probing fails
+    try:
+        _KEYRING = keyring.get_keyring()
+    except Exception:
+        _KEYRING = keyring
+
+from .config import get_config
 from ..utils.exceptions import CredentialError
 from ..utils.logger import get_logger
+from ..utils.serialization import dumps, loads
 
 logger = get_logger(__name__)
 
 KEYRING_SERVICE = "instagram_dm_fetcher"
 
+# Name of the encryption key file kept next to the credentials file when the
+# system keyring cannot hold the key
+CREDENTIALS_KEY_FILE = "credentials.key"
+
+# Read a .env file from the working directory once per process so
+# IG_USERNAME/IG_PASSWORD can live there; callers that need to pick up edits
+# can call reload_env()
+load_dotenv(find_dotenv(usecwd=True))
+
+
+def reload_env() -> bool:
+    """
+    Re-read the .env file, replacing values loaded earlier.
+
+    Returns:
+        True if a .env file was found and loaded
+    """
+    return load_dotenv(find_dotenv(usecwd=True), override=True)
+
+# Credentials loaded from keyring/file, shared by all managers so that a save or
+# delete through one instance is never masked by a stale entry in another
+_credentials_cache: Dict[Tuple[str, Optional[Path]], Dict[str, str]] = {}
+
+
+def clear_credentials_cache() -> None:
+    """Drop all cached credentials so the next load reads from storage."""
+    _credentials_cache.clear()
+
 
 class CredentialManager:
     """
@@ -45,35 +83,65 @@ class CredentialManager:
             logger.warning("Keyring not available, falling back to file storage")
             self.storage_method = "file"
 
-    def _get_cipher(self) -> Fernet:
-        """Get or create Fernet cipher for encryption."""
+    def _get_cipher(self, key_file: Optional[Path] = None) -> Fernet:
+        """
+        Get or create Fernet cipher for encryption.
+
+        The key is kept in the system keyring. If the keyring is unavailable
+        or refuses the key, it is written to key_file (readable only by the
+        current user) so the credentials can still be decrypted next run.
+
+        Args:
+            key_file: Fallback location for the encryption key
+        """
         if self._cipher is not None:
             return self._cipher
 
         # Try to get encryption key from keyring
         if KEYRING_AVAILABLE:
             try:
-                key_str = keyring.get_password(KEYRING_SERVICE, "encryption_key")
+                key_str = _KEYRING.get_password(KEYRING_SERVICE, "encryption_key")
                 if key_str:
                     self._cipher = Fernet(key_str.encode())
                     return self._cipher
             except Exception as e:
                 logger.debug(f"Could not retrieve encryption key from keyring: {e}")
 
+        if key_file is not None:
+            try:
+                self._cipher = Fernet(key_file.read_bytes())
+                return self._cipher
+            except FileNotFoundError:
+                pass
+
         # Generate new key
         key = Fernet.generate_key()
 
         # Try to save to keyring
+        key_saved = False
         if KEYRING_AVAILABLE:
             try:
-                keyring.set_password(KEYRING_SERVICE, "encryption_key", key.decode())
+                _KEYRING.set_password(KEYRING_SERVICE, "encryption_key", key.decode())
+                key_saved = True
                 logger.info("Encryption key saved to system keyring")
             except Exception as e:
                 logger.warning(f"Could not save encryption key to keyring: {e}")
 
+        if not key_saved and key_file is not None:
+            key_file.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(key)
+            logger.info(f"Encryption key saved to {key_file}")
+
         self._cipher = Fernet(key)
         return self._cipher
 
+    @staticmethod
+    def _key_file_for(file_path: Path) -> Path:
+        """Fallback encryption key location for a credentials file."""
+        return file_path.with_name(CREDENTIALS_KEY_FILE)
+
     def save_credentials(
         self,
         username: str,
@@ -91,6 +159,8 @@ class CredentialManager:
         Returns:
             True if successful, False otherwise
         """
+        clear_credentials_cache()
+
         try:
             if self.storage_method == "keyring":
                 return self._save_to_keyring(username, password)
@@ -122,20 +192,27 @@ class CredentialManager:
         """
         try:
             # First check environment variables
-            username = os.getenv("IG_USERNAME")
-            password = os.getenv("IG_PASSWORD")
-            if username and password:
+            if (username := os.getenv("IG_USERNAME")) and (password := os.getenv("IG_PASSWORD")):
                 logger.info("Loaded credentials from environment variables")
                 return {"username": username, "password": password}
 
+            cache_key = (self.storage_method, file_path)
+            cached = _credentials_cache.get(cache_key)
+            if cached is not None:
+                return dict(cached)
+
             # Try configured storage method
             if self.storage_method == "keyring":
-                return self._load_from_keyring()
+                creds = self._load_from_keyring()
             elif self.storage_method == "file":
-                return self._load_from_file(file_path)
+                creds = self._load_from_file(file_path)
             else:
                 return None
 
+            if creds:
+                _credentials_cache[cache_key] = dict(creds)
+            return creds
+
         except Exception as e:
             logger.error(f"Failed to load credentials: {e}")
             return None
@@ -155,6 +232,8 @@ class CredentialManager:
         Returns:
             True if successful, False otherwise
         """
+        clear_credentials_cache()
+
         try:
             if self.storage_method == "keyring":
                 if not username:
@@ -177,9 +256,9 @@ class CredentialManager:
             raise CredentialError("Keyring not available")
 
         try:
-            keyring.set_password(KEYRING_SERVICE, username, password)
+            _KEYRING.set_password(KEYRING_SERVICE, username, password)
             # Also save username reference
-            keyring.set_password(KEYRING_SERVICE, "last_username", username)
+            _KEYRING.set_password(KEYRING_SERVICE, "last_username", username)
             logger.info(f"Credentials saved to keyring for {username}")
             return True
         except Exception as e:
@@ -193,12 +272,10 @@ class CredentialManager:
 
         try:
             # Get last used username
-            username = keyring.get_password(KEYRING_SERVICE, "last_username")
-            if not username:
+            if not (username := _KEYRING.get_password(KEYRING_SERVICE, "last_username")):
                 return None
 
-            password = keyring.get_password(KEYRING_SERVICE, username)
-            if password:
+            if password := _KEYRING.get_password(KEYRING_SERVICE, username):
                 logger.info(f"Loaded credentials from keyring for {username}")
                 return {"username": username, "password": password}
             return None
@@ -213,11 +290,11 @@ class CredentialManager:
             return False
 
         try:
-            keyring.delete_password(KEYRING_SERVICE, username)
+            _KEYRING.delete_password(KEYRING_SERVICE, username)
             # Clear last username if it matches
-            last_username = keyring.get_password(KEYRING_SERVICE, "last_username")
+            last_username = _KEYRING.get_password(KEYRING_SERVICE, "last_username")
             if last_username == username:
-                keyring.delete_password(KEYRING_SERVICE, "last_username")
+                _KEYRING.delete_password(KEYRING_SERVICE, "last_username")
             logger.info(f"Credentials deleted from keyring for {username}")
             return True
         except Exception as e:
@@ -233,13 +310,12 @@ class CredentialManager:
     ) -> bool:
         """Save encrypted credentials to file."""
         if file_path is None:
-            from .config import get_config
             file_path = get_config().get_credentials_file()
 
         try:
-            cipher = self._get_cipher()
-            data = json.dumps({"username": username, "password": password})
-            encrypted = cipher.encrypt(data.encode())
+            cipher = self._get_cipher(self._key_file_for(file_path))
+            data = dumps({"username": username, "password": password})
+            encrypted = cipher.encrypt(data)
 
             file_path.parent.mkdir(parents=True, exist_ok=True)
             file_path.write_bytes(encrypted)
@@ -254,17 +330,17 @@ class CredentialManager:
     def _load_from_file(self, file_path: Optional[Path] = None) -> Optional[Dict[str, str]]:
         """Load encrypted credentials from file."""
         if file_path is None:
-            from .config import get_config
             file_path = get_config().get_credentials_file()
 
-        if not file_path.exists():
+        try:
+            encrypted = file_path.read_bytes()
+        except FileNotFoundError:
             return None
 
         try:
-            cipher = self._get_cipher()
-            encrypted = file_path.read_bytes()
+            cipher = self._get_cipher(self._key_file_for(file_path))
             decrypted = cipher.decrypt(encrypted)
-            data = json.loads(decrypted.decode())
+            data = loads(decrypted)
 
             logger.info(f"Loaded credentials from {file_path}")
             return data
@@ -276,13 +352,13 @@ class CredentialManager:
     def _delete_from_file(self, file_path: Optional[Path] = None) -> bool:
         """Delete credentials file."""
         if file_path is None:
-            from .config import get_config
             file_path = get_config().get_credentials_file()
 
         try:
-            if file_path.exists():
-                file_path.unlink()
-                logger.info(f"Deleted credentials file: {file_path}")
+            file_path.unlink()
+            logger.info(f"Deleted credentials file: {file_path}")
+            return True
+        except FileNotFoundError:
             return True
         except Exception as e:
             logger.error(f"Failed to delete file: {e}")
@@ -1,19 +1,68 @@
 """Export messages to different file formats."""
 
-import json
+from __future__ import annotations
+
 import csv
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from typing import TYPE_CHECKING, Any, List, Dict, Optional
 from datetime import datetime
 import re
 
-from instagrapi.types import DirectThread, DirectMessage
-
 from ..utils.exceptions import ExportError
+from ..utils.formatting import (
+    build_username_map, format_date, format_time, media_info, media_label, media_url,
+    MEDIA_TYPE_IMAGE, MEDIA_TYPE_VIDEO, MEDIA_TYPE_NAMES
+)
 from ..utils.logger import get_logger
+from ..utils.serialization import dumps
+
+if TYPE_CHECKING:
+    # Only needed for annotations; keeps instagrapi off the import path of
+    # callers that never export
+    from instagrapi.types import DirectThread, DirectMessage
 
 logger = get_logger(__name__)
 
+# Userspace write buffer for streamed exports, so large files are written in
+# a few large chunks instead of many 8 KiB ones
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Characters not allowed in file names on common filesystems
+INVALID_FILENAME_CHARS_RE = re.compile(r'[\\/*?:"<>|]')
+
+# Timestamp part of export file names
+FILENAME_TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S"
+
+# Single background writer shared by all exporters so file I/O never blocks
+# the caller; exports run one at a time in submission order
+_export_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="export")
+
+# Media type names used in JSON exports
+JSON_MEDIA_TYPES = {MEDIA_TYPE_IMAGE: "image", MEDIA_TYPE_VIDEO: "video"}
+
+# Day heading used between date groups in TXT exports
+TXT_DATE_HEADER_FORMAT = "%A, %B %d, %Y"
+
+
+def _json_default(obj: Any) -> str:
+    """
+    Serialize values the JSON encoder does not handle natively.
+
+    orjson already writes datetimes as ISO-8601; this keeps the stdlib
+    fallback producing the same output and stringifies anything else
+    (e.g. URL objects).
+
+    Args:
+        obj: Value to serialize
+
+    Returns:
+        String representation
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
 
 class MessageExporter:
     """Export messages to various file formats."""
@@ -38,7 +87,7 @@ class MessageExporter:
         Returns:
             Safe filename string
         """
-        return re.sub(r'[\\/*?:"<>|]', "_", name)
+        return INVALID_FILENAME_CHARS_RE.sub("_", name)
 
     def _get_output_path(
         self,
@@ -58,8 +107,7 @@ class MessageExporter:
             Path to output file
         """
         # Get primary username
-        usernames = [user.username for user in thread.users]
-        primary_username = usernames[0] if usernames else "unknown"
+        primary_username = thread.users[0].username if thread.users else "unknown"
         safe_username = self._sanitize_filename(primary_username)
 
         # Create user-specific folder
@@ -67,7 +115,7 @@ class MessageExporter:
         user_folder.mkdir(parents=True, exist_ok=True)
 
         # Generate filename with timestamp
-        time_str = timestamp.strftime("%Y-%m-%d_%H-%M-%S")
+        time_str = timestamp.strftime(FILENAME_TIMESTAMP_FORMAT)
         filename = f"{safe_username}_{time_str}.{format}"
 
         return user_folder / filename
@@ -78,17 +126,20 @@ class MessageExporter:
         messages: List[DirectMessage],
         format: str = "txt",
         current_user_id: int = None,
-        current_username: str = "You"
+        current_username: str = "You",
+        username_map: Optional[Dict] = None
     ) -> Path:
         """
         Export messages to file.
 
         Args:
             thread: Direct message thread
-            messages: List of messages to export
+            messages: Messages to export, in chronological order
             format: Export format (txt, json, csv)
             current_user_id: ID of current user
             current_username: Username of current user
+            username_map: Prebuilt user ID to username mapping (e.g. shared
+                with display_messages); built from the thread if not given
 
         Returns:
             Path to exported file
@@ -97,20 +148,23 @@ class MessageExporter:
             ExportError: If export fails
         """
         try:
-            # Get timestamp from first message or use current time
+            # Get timestamp from the newest message or use current time
             if messages:
-                timestamp = messages[0].timestamp
+                timestamp = messages[-1].timestamp
             else:
                 timestamp = datetime.now()
 
             output_path = self._get_output_path(thread, format, timestamp)
 
+            if username_map is None:
+                username_map = build_username_map(thread.users, current_user_id, current_username)
+
             if format == "txt":
-                self._export_txt(thread, messages, output_path, current_user_id, current_username)
+                self._export_txt(thread, messages, output_path, username_map)
             elif format == "json":
-                self._export_json(thread, messages, output_path, current_user_id, current_username)
+                self._export_json(thread, messages, output_path, username_map)
             elif format == "csv":
-                self._export_csv(thread, messages, output_path, current_user_id, current_username)
+                self._export_csv(thread, messages, output_path, username_map)
             else:
                 raise ExportError(f"Unsupported format: {format}")
 
@@ -121,138 +175,164 @@ class MessageExporter:
             logger.error(f"Failed to export messages: {e}")
             raise ExportError(f"Failed to export messages: {e}")
 
+    def export_in_background(
+        self,
+        thread: DirectThread,
+        messages: List[DirectMessage],
+        format: str = "txt",
+        current_user_id: int = None,
+        current_username: str = "You",
+        username_map: Optional[Dict] = None
+    ) -> "Future[Path]":
+        """
+        Queue an export on the background writer thread and return immediately.
+
+        Takes the same arguments as export(). The message list is copied, so
+        the caller may reuse it once this returns.
+
+        Returns:
+            Future resolving to the exported file path, or raising ExportError
+        """
+        return _export_executor.submit(
+            self.export,
+            thread,
+            list(messages),
+            format=format,
+            current_user_id=current_user_id,
+            current_username=current_username,
+            username_map=username_map
+        )
+
     def _export_txt(
         self,
         thread: DirectThread,
         messages: List[DirectMessage],
         output_path: Path,
-        current_user_id: int,
-        current_username: str
+        username_map: Dict
     ) -> None:
         """Export messages as plain text file."""
-        # Create username mapping
-        username_map = {user.pk: user.username for user in thread.users}
-        if current_user_id:
-            username_map[current_user_id] = current_username
-
-        # Sort messages by timestamp
-        sorted_messages = sorted(messages, key=lambda m: m.timestamp)
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            # Header
-            usernames = [user.username for user in thread.users]
-            f.write(f"Conversation with {', '.join(usernames)}\n")
-            f.write("=" * 70 + "\n\n")
-
-            current_date = None
-
-            for msg in sorted_messages:
-                # Date separator
-                msg_date = msg.timestamp.date()
-                if current_date != msg_date:
-                    if current_date is not None:
-                        f.write("\n")
 
-                    date_str = msg_date.strftime("%A, %B %d, %Y")
-                    f.write(f"\n{'―' * 25} {date_str} {'―' * 25}\n\n")
-                    current_date = msg_date
-
-                # Message
-                sender = username_map.get(msg.user_id, f"Unknown ({msg.user_id})")
-                timestamp = msg.timestamp.strftime("%H:%M:%S")
-                text = msg.text if msg.text is not None else "[No text content]"
-
-                f.write(f"{timestamp} - {sender}: {text}\n")
-
-                # Media info
-                try:
-                    if hasattr(msg, 'media') and msg.media and hasattr(msg.media, 'media_type'):
-                        if msg.media.media_type == 1:  # Image
-                            url = getattr(msg.media, 'thumbnail_url', 'No URL')
-                            f.write(f"  [Image: {url}]\n")
-                        elif msg.media.media_type == 2:  # Video
-                            url = getattr(msg.media, 'video_url', 'No URL')
-                            f.write(f"  [Video: {url}]\n")
-                except Exception as e:
-                    logger.debug(f"Could not write media info: {e}")
+        # Collect the whole document and write it in one call
+        usernames = [user.username for user in thread.users]
+        parts = [f"Conversation with {', '.join(usernames)}\n", "=" * 70 + "\n\n"]
+
+        current_date = None
+        get_sender = username_map.get
+
+        for msg in messages:
+            timestamp = msg.timestamp
+            user_id = msg.user_id
+            text = msg.text
+
+            # Date separator
+            msg_date = timestamp.date()
+            if current_date != msg_date:
+                date_str = format_date(msg_date, TXT_DATE_HEADER_FORMAT)
+                lead = "\n\n" if current_date is not None else "\n"
+                parts.append(f"{lead}{'―' * 25} {date_str} {'―' * 25}\n\n")
+                current_date = msg_date
+
+            # Message, with its media line if any, as a single chunk
+            sender = get_sender(user_id)
+            if sender is None:
+                sender = f"Unknown ({user_id})"
+            if text is None:
+                text = "[No text content]"
+            time_str = format_time(timestamp)
+            label = media_label(media_info(msg))
+
+            if label:
+                parts.append(f"{time_str} - {sender}: {text}\n  {label}\n\n")
+            else:
+                parts.append(f"{time_str} - {sender}: {text}\n\n")
 
-                f.write("\n")
+        output_path.write_bytes("".join(parts).encode('utf-8'))
 
     def _export_json(
         self,
         thread: DirectThread,
         messages: List[DirectMessage],
         output_path: Path,
-        current_user_id: int,
-        current_username: str
+        username_map: Dict
     ) -> None:
         """Export messages as JSON file."""
-        # Create username mapping
-        username_map = {user.pk: user.username for user in thread.users}
-        if current_user_id:
-            username_map[current_user_id] = current_username
-
-        # Sort messages
-        sorted_messages = sorted(messages, key=lambda m: m.timestamp)
-
-        # Build JSON structure
-        data = {
-            "conversation_info": {
-                "participants": [user.username for user in thread.users],
-                "thread_id": thread.id,
-                "export_time": datetime.now().isoformat(),
-                "message_count": len(sorted_messages)
-            },
-            "messages": []
+
+        conversation_info = {
+            "participants": [user.username for user in thread.users],
+            "thread_id": thread.id,
+            "export_time": datetime.now().isoformat(),
+            "message_count": len(messages)
         }
 
-        for msg in sorted_messages:
-            sender = username_map.get(msg.user_id, f"Unknown ({msg.user_id})")
-
-            message_data = {
-                "timestamp": msg.timestamp.isoformat(),
-                "sender": sender,
-                "sender_id": msg.user_id,
-                "text": msg.text,
-                "message_id": getattr(msg, 'id', None)
-            }
-
-            # Add media info
-            try:
-                if hasattr(msg, 'media') and msg.media and hasattr(msg.media, 'media_type'):
-                    media_type = "image" if msg.media.media_type == 1 else "video" if msg.media.media_type == 2 else "other"
+        # Stream one message object per line instead of building the whole
+        # document in memory first
+        with open(output_path, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+            f.write(b'{\n  "conversation_info": ')
+            f.write(dumps(conversation_info, default=_json_default))
+            f.write(b',\n  "messages": [')
+
+            separator = b"\n    "
+            for msg in messages:
+                sender = username_map.get(msg.user_id, f"Unknown ({msg.user_id})")
+
+                message_data = {
+                    "timestamp": msg.timestamp,
+                    "sender": sender,
+                    "sender_id": msg.user_id,
+                    "text": msg.text,
+                    "message_id": getattr(msg, 'id', None)
+                }
+
+                # Add media info
+                media = media_info(msg)
+                if media is not None:
+                    media_type, thumbnail_url, video_url = media
                     message_data["media"] = {
-                        "type": media_type,
-                        "thumbnail_url": getattr(msg.media, 'thumbnail_url', None),
-                        "video_url": getattr(msg.media, 'video_url', None) if msg.media.media_type == 2 else None
+                        "type": JSON_MEDIA_TYPES.get(media_type, "other"),
+                        "thumbnail_url": thumbnail_url,
+                        "video_url": video_url if media_type == MEDIA_TYPE_VIDEO else None
                     }
-            except Exception as e:
-                logger.debug(f"Could not add media info: {e}")
 
-            data["messages"].append(message_data)
+                f.write(separator)
+                f.write(dumps(message_data, default=_json_default))
+                separator = b",\n    "
 
-        # Write JSON
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            f.write(b"\n  ]\n}\n" if messages else b"]\n}\n")
 
     def _export_csv(
         self,
         thread: DirectThread,
         messages: List[DirectMessage],
         output_path: Path,
-        current_user_id: int,
-        current_username: str
+        username_map: Dict
     ) -> None:
         """Export messages as CSV file."""
-        # Create username mapping
-        username_map = {user.pk: user.username for user in thread.users}
-        if current_user_id:
-            username_map[current_user_id] = current_username
 
-        # Sort messages
-        sorted_messages = sorted(messages, key=lambda m: m.timestamp)
+        def rows():
+            get_sender = username_map.get
+            for msg in messages:
+                user_id = msg.user_id
+                sender = get_sender(user_id)
+                if sender is None:
+                    sender = f"Unknown ({user_id})"
+
+                media = media_info(msg)
+                media_type = MEDIA_TYPE_NAMES.get(media[0], "") if media is not None else ""
+                url = (media_url(media) or "") if media_type else ""
+
+                timestamp = msg.timestamp
+                yield (
+                    timestamp.isoformat(),
+                    format_date(timestamp.date()),
+                    format_time(timestamp),
+                    sender,
+                    user_id,
+                    msg.text or "[No text content]",
+                    media_type,
+                    url
+                )
 
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
             writer = csv.writer(f)
 
             # Header
@@ -268,30 +348,4 @@ class MessageExporter:
             ])
 
             # Messages
-            for msg in sorted_messages:
-                sender = username_map.get(msg.user_id, f"Unknown ({msg.user_id})")
-
-                media_type = ""
-                media_url = ""
-
-                try:
-                    if hasattr(msg, 'media') and msg.media and hasattr(msg.media, 'media_type'):
-                        if msg.media.media_type == 1:
-                            media_type = "Image"
-                            media_url = getattr(msg.media, 'thumbnail_url', "")
-                        elif msg.media.media_type == 2:
-                            media_type = "Video"
-                            media_url = getattr(msg.media, 'video_url', "")
-                except Exception as e:
-                    logger.debug(f"Could not extract media info: {e}")
-
-                writer.writerow([
-                    msg.timestamp.isoformat(),
-                    msg.timestamp.strftime("%Y-%m-%d"),
-                    msg.timestamp.strftime("%H:%M:%S"),
-                    sender,
-                    msg.user_id,
-                    msg.text or "[No text content]",
-                    media_type,
-                    media_url
-                ])
+            writer.writerows(rows())
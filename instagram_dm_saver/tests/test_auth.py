@@ -0,0 +1,174 @@
+"""Tests for authentication and session persistence."""
+
+import pytest
+from instagrapi import Client
+
+from instagram_dm_saver.core import auth
+from instagram_dm_saver.core.auth import InstagramAuthenticator
+
+
+@pytest.mark.parametrize("mmap_threshold", [64 * 1024, 0])
+def test_session_save_and_load(mocker, test_config, mmap_threshold):
+    """Test that saved session settings round-trip into a fresh client."""
+    mocker.patch("instagram_dm_saver.core.auth.SESSION_MMAP_THRESHOLD", mmap_threshold)
+    session_file = test_config.get_session_file()
+
+    authenticator = InstagramAuthenticator(test_config)
+    authenticator.client = Client()
+    authenticator._save_session(session_file)
+    saved_uuids = authenticator.client.get_settings()["uuids"]
+
+    auth._SESSION_CACHE.clear()
+    authenticator.client = Client()
+    authenticator._load_session(session_file)
+
+    assert authenticator.client.get_settings()["uuids"] == saved_uuids
+
+
+def test_session_load_reuses_settings_until_file_changes(mocker, test_config):
+    """Test that an unchanged session file is parsed once and a rewritten one again."""
+    session_file = test_config.get_session_file()
+    session_file.write_bytes(b'{"uuids": {"uuid": "one"}}')
+    parse = mocker.spy(auth, "loads")
+
+    authenticator = InstagramAuthenticator(test_config)
+    authenticator.client = mocker.Mock()
+    authenticator._load_session(session_file)
+    authenticator._load_session(session_file)
+    assert parse.call_count == 1
+
+    session_file.write_bytes(b'{"uuids": {"uuid": "two", "phone_id": "x"}}')
+    authenticator._load_session(session_file)
+    assert parse.call_count == 2
+    authenticator.client.set_settings.assert_called_with(
+        {"uuids": {"uuid": "two", "phone_id": "x"}}
+    )
+
+
+def test_login_skips_probe_for_recently_validated_session(mocker, test_config):
+    """Test that the timeline check runs once and is skipped while fresh."""
+    session_file = test_config.get_session_file()
+    session_file.write_bytes(b"{}")
+
+    client = mocker.Mock()
+    mocker.patch("instagram_dm_saver.core.auth.Client", return_value=client)
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+    authenticator = InstagramAuthenticator(test_config)
+    mocker.patch.object(authenticator.credential_manager, "load_credentials", return_value=None)
+
+    authenticator.login()
+    authenticator.login()
+    client.get_timeline_feed.assert_called_once()
+
+    authenticator.invalidate_session_validation()
+    authenticator.login()
+    assert client.get_timeline_feed.call_count == 2
+
+
+def test_authenticator_uses_injected_credential_manager(mocker, test_config):
+    """Test that a caller's credential manager is reused instead of rebuilt."""
+    manager = mocker.Mock()
+    build = mocker.patch("instagram_dm_saver.core.auth.CredentialManager")
+
+    authenticator = InstagramAuthenticator(test_config, manager)
+
+    assert authenticator.credential_manager is manager
+    build.assert_not_called()
+
+
+def test_login_with_saved_session_uses_stored_credentials(mocker, test_config):
+    """Test that stored credentials looked up alongside the session are used to log in."""
+    test_config.get_session_file().write_bytes(b'{"uuids": {}}')
+
+    client = mocker.Mock()
+    mocker.patch("instagram_dm_saver.core.auth.Client", return_value=client)
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+    manager = mocker.Mock()
+    manager.load_credentials.return_value = {"username": "alice", "password": "secret"}
+
+    assert InstagramAuthenticator(test_config, manager).login() is client
+
+    client.set_settings.assert_called_once_with({"uuids": {}})
+    client.login.assert_called_once_with("alice", "secret")
+    client.get_timeline_feed.assert_not_called()
+
+
+def test_login_with_2fa_repeats_only_the_login_request(mocker, test_config):
+    """Test that the 2FA retry reuses the client instead of running login() again."""
+    client = mocker.Mock()
+    client.login.side_effect = [Exception("Two-factor authentication required"), True]
+    client.get_settings.return_value = {}
+    build_client = mocker.patch("instagram_dm_saver.core.auth.Client", return_value=client)
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+    mocker.patch("instagram_dm_saver.core.auth.Prompt.ask", return_value="123456")
+    confirm = mocker.patch("instagram_dm_saver.core.auth.Confirm.ask", return_value=True)
+    manager = mocker.Mock()
+
+    authenticator = InstagramAuthenticator(test_config, manager)
+    assert authenticator.login_with_2fa("alice", "secret") is client
+
+    build_client.assert_called_once()
+    client.login.assert_called_with("alice", "secret", verification_code="123456")
+    confirm.assert_called_once()
+    manager.save_credentials.assert_called_once_with("alice", "secret")
+
+
+def test_login_without_prompt_raises_two_factor_required(mocker, test_config):
+    """Test that non-interactive callers get TwoFactorRequired instead of a console prompt."""
+    from instagram_dm_saver.utils.exceptions import TwoFactorRequired
+
+    client = mocker.Mock()
+    client.login.side_effect = Exception("Two-factor authentication required")
+    mocker.patch("instagram_dm_saver.core.auth.Client", return_value=client)
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+    ask = mocker.patch("instagram_dm_saver.core.auth.Prompt.ask")
+
+    with pytest.raises(TwoFactorRequired):
+        InstagramAuthenticator(test_config, mocker.Mock()).login("alice", "secret", prompt=False)
+    ask.assert_not_called()
+
+
+def test_failed_session_does_not_look_up_missing_credentials_twice(mocker, test_config):
+    """Test that a miss during session loading is not repeated before prompting."""
+    test_config.get_session_file().write_bytes(b"{}")
+
+    client = mocker.Mock()
+    client.get_timeline_feed.side_effect = Exception("login_required")
+    client.get_settings.return_value = {}
+    mocker.patch("instagram_dm_saver.core.auth.Client", return_value=client)
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+    mocker.patch("instagram_dm_saver.core.auth.Prompt.ask", return_value="alice")
+    mocker.patch("instagram_dm_saver.core.auth.getpass.getpass", return_value="secret")
+    manager = mocker.Mock()
+    manager.load_credentials.return_value = None
+
+    InstagramAuthenticator(test_config, manager).login(save_credentials=False)
+
+    manager.load_credentials.assert_called_once()
+    client.login.assert_called_once_with("alice", "secret")
+
+
+def test_clone_client_shares_session_but_not_state():
+    """Test that a cloned client has the same session settings on a separate instance."""
+    from instagram_dm_saver.core.auth import clone_client
+
+    client = Client()
+    clone = clone_client(client)
+
+    assert clone is not client
+    assert clone.get_settings()["uuids"] == client.get_settings()["uuids"]
+
+
+def test_login_with_2fa_asks_before_saving_without_challenge(mocker, test_config):
+    """Test that the interactive 2FA login still confirms before saving credentials."""
+    client = mocker.Mock()
+    client.get_settings.return_value = {}
+    mocker.patch("instagram_dm_saver.core.auth.Client", return_value=client)
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+    confirm = mocker.patch("instagram_dm_saver.core.auth.Confirm.ask", return_value=False)
+    manager = mocker.Mock()
+
+    InstagramAuthenticator(test_config, manager).login_with_2fa("alice", "secret")
+
+    confirm.assert_called_once()
+    manager.save_credentials.assert_not_called()
@@ -0,0 +1,68 @@
+"""Tests for circuit breaker."""
+
+import pytest
+
+from instagram_dm_saver.utils.circuit_breaker import CircuitBreaker
+from instagram_dm_saver.utils.exceptions import CircuitOpenError
+
+
+def _fail():
+    raise ValueError("boom")
+
+
+def test_circuit_breaker_opens_after_threshold():
+    """Test that repeated failures open the circuit and calls fail fast."""
+    breaker = CircuitBreaker(failure_threshold=3, window=60, sleep_window=60)
+
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            breaker.call(_fail)
+
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: "never called")
+
+
+def test_circuit_breaker_half_open_probe_closes(mocker):
+    """Test that a successful probe after the sleep window closes the circuit."""
+    clock = mocker.patch("instagram_dm_saver.utils.circuit_breaker.time.time", return_value=100.0)
+    breaker = CircuitBreaker(failure_threshold=1, window=60, sleep_window=10)
+
+    with pytest.raises(ValueError):
+        breaker.call(_fail)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.return_value = 111.0
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_circuit_breaker_half_open_failure_reopens(mocker):
+    """Test that a failed probe reopens the circuit."""
+    clock = mocker.patch("instagram_dm_saver.utils.circuit_breaker.time.time", return_value=100.0)
+    breaker = CircuitBreaker(failure_threshold=1, window=60, sleep_window=10)
+
+    with pytest.raises(ValueError):
+        breaker.call(_fail)
+
+    clock.return_value = 111.0
+    with pytest.raises(ValueError):
+        breaker.call(_fail)
+
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_circuit_breaker_ignores_old_failures(mocker):
+    """Test that failures outside the window do not count."""
+    clock = mocker.patch("instagram_dm_saver.utils.circuit_breaker.time.time", return_value=100.0)
+    breaker = CircuitBreaker(failure_threshold=2, window=5, sleep_window=10)
+
+    with pytest.raises(ValueError):
+        breaker.call(_fail)
+
+    clock.return_value = 110.0
+    with pytest.raises(ValueError):
+        breaker.call(_fail)
+
+    assert breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,143 @@
+"""Tests for the command-line entry point."""
+
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+
+from instagram_dm_saver import cli
+
+
+def test_main_without_command_runs_interactive_menu(mocker):
+    """Test that no arguments fall back to the interactive menu."""
+    app = mocker.patch.object(cli, "InstagramDMCLI").return_value
+
+    cli.main([])
+
+    app.run.assert_called_once()
+    app.fetch_to_file.assert_not_called()
+
+
+def test_main_fetch_skips_menu(mocker):
+    """Test that the fetch subcommand goes straight to fetching and exporting."""
+    app = mocker.patch.object(cli, "InstagramDMCLI").return_value
+
+    cli.main(["fetch", "--thread", "340282", "--count", "25", "--format", "csv", "--output", "out"])
+
+    app.fetch_to_file.assert_called_once_with(["340282"], 25, "csv", Path("out"))
+    app.run.assert_not_called()
+
+
+def test_main_fetch_rejects_bad_count_and_reports_errors(mocker):
+    """Test argument validation and that expected errors exit with status 1."""
+    app = mocker.patch.object(cli, "InstagramDMCLI").return_value
+
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["fetch", "--thread", "1", "--count", "0"])
+    assert exc.value.code == 2
+
+    app.list_conversations.side_effect = cli.AuthenticationError("bad password")
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["conversations"])
+    assert exc.value.code == 1
+
+
+def test_run_dispatches_menu_choices_until_exit(mocker, test_config):
+    """Test that menu choices call their handlers and "7" leaves the loop."""
+    mocker.patch.object(cli, "get_config", return_value=test_config)
+    mocker.patch.object(cli.InstagramDMCLI, "_display_main_menu", side_effect=["6", "2", "7"])
+    view_logs = mocker.patch.object(cli.InstagramDMCLI, "_view_logs")
+    save_dir = mocker.patch.object(cli.InstagramDMCLI, "_configure_save_directory")
+
+    cli.InstagramDMCLI().run()
+
+    view_logs.assert_called_once_with()
+    save_dir.assert_called_once_with()
+
+
+def test_lookup_current_username_uses_cloned_client(mocker):
+    """Test that a username needing a profile request never runs on the shared client."""
+    from instagram_dm_saver.core import MessageManager
+
+    executor = mocker.Mock()
+    client = mocker.Mock(username="alice")
+
+    assert cli.InstagramDMCLI._lookup_current_username(executor, client).result() == "alice"
+    executor.submit.assert_not_called()
+
+    clone = mocker.Mock()
+    mocker.patch("instagram_dm_saver.core.clone_client", return_value=clone)
+    client.username = None
+
+    cli.InstagramDMCLI._lookup_current_username(executor, client)
+
+    executor.submit.assert_called_once_with(MessageManager.get_current_username, clone)
+
+
+def test_fetch_several_threads_fetches_concurrently(mocker, test_config):
+    """Test that repeated --thread options fetch together and save one file each."""
+    mocker.patch.object(cli, "get_config", return_value=test_config)
+    mocker.patch.object(cli.InstagramDMCLI, "_login_non_interactive", return_value=mocker.Mock(
+        user_id=1, username="me"
+    ))
+    manager = mocker.patch("instagram_dm_saver.core.MessageManager").return_value
+    manager.get_conversation.side_effect = lambda thread_id: mocker.Mock(id=thread_id)
+    manager.fetch_messages_for_threads.return_value = {"a": ["m1"], "b": ["m2"]}
+    exporter = mocker.patch.object(cli, "MessageExporter").return_value
+    exporter.export.side_effect = lambda thread, *args, **kwargs: Path(f"{thread.id}.txt")
+
+    paths = cli.InstagramDMCLI().fetch_to_file(["a", "b"])
+
+    assert paths == [Path("a.txt"), Path("b.txt")]
+    manager.fetch_messages.assert_not_called()
+    assert [t.id for t in manager.fetch_messages_for_threads.call_args.args[0]] == ["a", "b"]
+
+
+def test_fetch_several_threads_reports_failures(mocker, test_config):
+    """Test that conversations that failed don't stop the others from being saved."""
+    mocker.patch.object(cli, "get_config", return_value=test_config)
+    mocker.patch.object(cli.InstagramDMCLI, "_login_non_interactive", return_value=mocker.Mock(
+        user_id=1, username="me"
+    ))
+    manager = mocker.patch("instagram_dm_saver.core.MessageManager").return_value
+    manager.get_conversation.side_effect = lambda thread_id: mocker.Mock(id=thread_id)
+    manager.fetch_messages_for_threads.return_value = {"b": ["m2"]}
+    exporter = mocker.patch.object(cli, "MessageExporter").return_value
+
+    with pytest.raises(cli.MessageFetchError, match="1 of 2"):
+        cli.InstagramDMCLI().fetch_to_file(["a", "b"])
+    exporter.export.assert_called_once()
+
+
+def test_scripted_login_never_prompts_for_2fa(mocker, test_config):
+    """Test that a 2FA challenge in a subcommand exits with status 1 instead of prompting."""
+    mocker.patch.object(cli, "get_config", return_value=test_config)
+    authenticator = mocker.patch("instagram_dm_saver.core.InstagramAuthenticator").return_value
+    authenticator.login.side_effect = cli.TwoFactorRequired("challenge")
+
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["conversations"])
+
+    assert exc.value.code == 1
+    authenticator.login.assert_called_once_with(save_credentials=False, prompt=False)
+
+
+def test_background_exports_are_reported_from_the_menu_loop(mocker, test_config):
+    """Test that export results print before the next menu, never from the export thread."""
+    mocker.patch.object(cli, "get_config", return_value=test_config)
+    report = mocker.patch.object(cli.InstagramDMCLI, "_report_export")
+    app = cli.InstagramDMCLI()
+    finished, running = Future(), Future()
+    finished.set_result(Path("done.txt"))
+    app._pending_exports = [(3, finished), (5, running)]
+    mocker.patch.object(cli.InstagramDMCLI, "_display_main_menu", side_effect=["7"])
+
+    app._report_finished_exports()
+
+    report.assert_called_once_with(3, finished)
+    assert app._pending_exports == [(5, running)]
+
+    running.set_result(Path("later.txt"))
+    app.run()
+    report.assert_called_with(5, running)
+    assert app._pending_exports == []
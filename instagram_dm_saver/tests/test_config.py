@@ -3,7 +3,7 @@
 import pytest
 from pathlib import Path
 
-from instagram_dm_saver.storage import AppConfig
+from instagram_dm_saver.storage import AppConfig, get_config
 from instagram_dm_saver.utils.exceptions import ConfigurationError
 
 
@@ -45,6 +45,63 @@ def test_config_save_and_load(temp_config_dir):
     assert config2.credential_storage == "file"
 
 
+def test_config_save_skips_identical_write(mocker, temp_config_dir):
+    """Test that saving an unchanged config does not rewrite the file."""
+    config = AppConfig(config_dir=temp_config_dir, default_message_count=500)
+    config.save()
+
+    write_bytes = mocker.spy(Path, "write_bytes")
+    config.save()
+    write_bytes.assert_not_called()
+
+    config.default_message_count = 600
+    config.save()
+    write_bytes.assert_called_once()
+
+
+def test_config_save_failure_keeps_previous_file(mocker, temp_config_dir):
+    """Test that a failed save leaves the existing config file untouched."""
+    config = AppConfig(config_dir=temp_config_dir, default_message_count=500)
+    config.save()
+    config_file = temp_config_dir / "config.json"
+    original = config_file.read_bytes()
+
+    mocker.patch("instagram_dm_saver.storage.config.os.replace", side_effect=OSError("disk full"))
+    config.default_message_count = 600
+    with pytest.raises(ConfigurationError):
+        config.save()
+
+    assert config_file.read_bytes() == original
+    assert list(temp_config_dir.glob("*.tmp")) == []
+
+
+def test_get_config_cached_and_updated_on_save(mocker, temp_config_dir):
+    """Test that get_config reads once and picks up saved changes."""
+    config_dir = temp_config_dir / ".instagram_dm_fetcher"
+    mocker.patch("instagram_dm_saver.storage.config.Path.home", return_value=temp_config_dir)
+    AppConfig(config_dir=config_dir, save_dir=temp_config_dir / "saved").save()
+    mocker.patch("instagram_dm_saver.storage.config._config", None)
+    load = mocker.spy(AppConfig, "load")
+
+    config = get_config()
+    assert get_config() is config
+    assert load.call_count == 1
+
+    updated = config.model_copy(update={"default_message_count": 42})
+    updated.save()
+
+    assert get_config() is updated
+    assert load.call_count == 1
+
+
+def test_config_load_missing_file(temp_config_dir):
+    """Test that a missing config file falls back to defaults."""
+    config = AppConfig.load(temp_config_dir / "missing.json")
+
+    assert config.default_message_count == 1000
+    assert not (temp_config_dir / "missing.json").exists()
+
+
 def test_config_validation():
     """Test configuration validation."""
     with pytest.raises(ValueError):
@@ -1,9 +1,12 @@
 """Tests for credential management."""
 
+import os
+
 import pytest
 from pathlib import Path
 
 from instagram_dm_saver.storage import CredentialManager
+from instagram_dm_saver.storage.credentials import clear_credentials_cache
 from instagram_dm_saver.utils.exceptions import CredentialError
 
 
@@ -78,3 +81,64 @@ def test_storage_method_none():
     # Should return None
     loaded = manager.load_credentials()
     assert loaded is None
+
+
+def test_load_credentials_cached(temp_config_dir):
+    """Test that loaded credentials are served from cache."""
+    manager = CredentialManager(storage_method="file")
+    creds_file = temp_config_dir / "credentials.enc"
+
+    manager.save_credentials("test_user", "test_pass", creds_file)
+    assert manager.load_credentials(creds_file)["username"] == "test_user"
+
+    # Removing the file behind the manager's back does not affect the cache
+    creds_file.unlink()
+    assert manager.load_credentials(creds_file)["username"] == "test_user"
+
+
+def test_credentials_cache_invalidated_across_managers(temp_config_dir):
+    """Test that saving or deleting through one manager invalidates the cache."""
+    reader = CredentialManager(storage_method="file")
+    writer = CredentialManager(storage_method="file")
+    creds_file = temp_config_dir / "credentials.enc"
+
+    # Share the encryption key in case no system keyring is available
+    reader._cipher = writer._get_cipher()
+
+    writer.save_credentials("old_user", "old_pass", creds_file)
+    assert reader.load_credentials(creds_file)["username"] == "old_user"
+
+    writer.save_credentials("new_user", "new_pass", creds_file)
+    assert reader.load_credentials(creds_file)["username"] == "new_user"
+
+    writer.delete_credentials(file_path=creds_file)
+    assert reader.load_credentials(creds_file) is None
+
+
+def test_file_credentials_survive_restart_without_keyring(mocker, temp_config_dir):
+    """Test that the encryption key is kept in a private file when there is no keyring."""
+    mocker.patch("instagram_dm_saver.storage.credentials.KEYRING_AVAILABLE", False)
+    creds_file = temp_config_dir / "credentials.enc"
+
+    CredentialManager(storage_method="file").save_credentials("test_user", "test_pass", creds_file)
+    clear_credentials_cache()
+
+    # A new manager stands in for the next run of the application
+    loaded = CredentialManager(storage_method="file").load_credentials(creds_file)
+    assert loaded == {"username": "test_user", "password": "test_pass"}
+
+    key_file = temp_config_dir / "credentials.key"
+    if os.name == "posix":
+        assert key_file.stat().st_mode & 0o777 == 0o600
+
+
+def test_reload_env_reads_working_directory(monkeypatch, temp_config_dir):
+    """Test that reload_env picks up edits to .env in the working directory."""
+    from instagram_dm_saver.storage.credentials import reload_env
+
+    monkeypatch.chdir(temp_config_dir)
+    monkeypatch.setenv("IG_USERNAME", "old_user")
+    (temp_config_dir / ".env").write_text("IG_USERNAME=new_user\n", encoding="utf-8")
+
+    assert reload_env()
+    assert os.environ["IG_USERNAME"] == "new_user"
@@ -48,6 +48,21 @@ def test_export_txt(temp_config_dir, mock_thread, sample_messages, mock_client):
     assert "Test message" in content
 
 
+def test_export_uses_given_username_map(temp_config_dir, mock_thread, sample_messages):
+    """Test that a prebuilt username map is used as-is."""
+    exporter = MessageExporter(temp_config_dir)
+    username_map = {sample_messages[0].user_id: "shared_name"}
+
+    output_path = exporter.export(
+        mock_thread,
+        sample_messages,
+        format="txt",
+        username_map=username_map
+    )
+
+    assert "shared_name:" in output_path.read_text(encoding='utf-8')
+
+
 def test_export_json(temp_config_dir, mock_thread, sample_messages, mock_client):
     """Test exporting messages to JSON format."""
     exporter = MessageExporter(temp_config_dir)
@@ -71,6 +86,7 @@ def test_export_json(temp_config_dir, mock_thread, sample_messages, mock_client)
     assert "messages" in data
     assert len(data["messages"]) == len(sample_messages)
     assert data["messages"][0]["text"] is not None
+    assert data["messages"][0]["timestamp"] == sample_messages[0].timestamp.isoformat()
 
 
 def test_export_csv(temp_config_dir, mock_thread, sample_messages, mock_client):
@@ -99,6 +115,23 @@ def test_export_csv(temp_config_dir, mock_thread, sample_messages, mock_client):
     assert "Message" in reader.fieldnames
 
 
+def test_export_in_background(temp_config_dir, mock_thread, sample_messages, mock_client):
+    """Test that background exports resolve to the written file."""
+    exporter = MessageExporter(temp_config_dir)
+
+    future = exporter.export_in_background(
+        mock_thread,
+        sample_messages,
+        format="txt",
+        current_user_id=mock_client.user_id
+    )
+    sample_messages.clear()
+
+    output_path = future.result(timeout=10)
+    assert output_path.exists()
+    assert "Test message 9" in output_path.read_text(encoding='utf-8')
+
+
 def test_export_creates_user_folder(temp_config_dir, mock_thread, sample_messages, mock_client):
     """Test that export creates user-specific folder."""
     exporter = MessageExporter(temp_config_dir)
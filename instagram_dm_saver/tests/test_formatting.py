@@ -0,0 +1,59 @@
+"""Tests for formatting helpers."""
+
+from datetime import datetime
+
+from instagram_dm_saver.utils.formatting import (
+    build_username_map, format_date, format_time, format_datetime, media_info, media_label,
+    media_url
+)
+
+
+def test_format_helpers_match_strftime():
+    """Test that the helpers produce the same strings as strftime."""
+    timestamp = datetime(2024, 3, 5, 7, 8, 9)
+
+    assert format_date(timestamp.date()) == timestamp.strftime("%Y-%m-%d")
+    assert format_date(timestamp.date(), "%A, %B %d, %Y") == timestamp.strftime("%A, %B %d, %Y")
+    assert format_time(timestamp) == timestamp.strftime("%H:%M:%S")
+    assert format_time(timestamp, seconds=False) == timestamp.strftime("%H:%M")
+    assert format_datetime(timestamp) == timestamp.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def test_format_date_is_cached():
+    """Test that repeated dates are served from the cache."""
+    format_date.cache_clear()
+    day = datetime(2024, 3, 5).date()
+
+    format_date(day)
+    format_date(day)
+
+    assert format_date.cache_info().hits == 1
+
+
+def test_media_info_and_label(mocker, mock_message):
+    """Test media extraction for plain, image and video messages."""
+    assert media_info(mock_message) is None
+    assert media_label(None) == ""
+
+    mock_message.media = mocker.Mock(media_type=1, thumbnail_url="https://example.com/i.jpg")
+    info = media_info(mock_message)
+    assert info[:2] == (1, "https://example.com/i.jpg")
+    assert media_label(info) == "[Image: https://example.com/i.jpg]"
+
+    mock_message.media = mocker.Mock(media_type=2, video_url="https://example.com/v.mp4")
+    assert media_label(media_info(mock_message)) == "[Video: https://example.com/v.mp4]"
+
+
+def test_build_username_map(mocker):
+    """Test mapping participants and the logged-in account to usernames."""
+    users = [mocker.Mock(pk=1, username="alice"), mocker.Mock(pk=2, username="bob")]
+
+    assert build_username_map(users) == {1: "alice", 2: "bob"}
+    assert build_username_map(users, 99, "me") == {1: "alice", 2: "bob", 99: "me"}
+
+
+def test_media_url_picks_video_url_for_videos():
+    """Test that videos use the video URL and other media the thumbnail."""
+    assert media_url((1, "thumb", None)) == "thumb"
+    assert media_url((2, "thumb", "video")) == "video"
+    assert media_label((8, "thumb", None)) == ""
@@ -0,0 +1,70 @@
+"""Tests for GUI widgets."""
+
+import tkinter as tk
+
+import pytest
+
+ctk = pytest.importorskip("customtkinter")
+
+from instagram_dm_saver import gui  # noqa: E402
+
+
+@pytest.fixture
+def root():
+    """Create a hidden CustomTkinter root window, skipping without a display."""
+    try:
+        window = ctk.CTk()
+    except tk.TclError as e:
+        pytest.skip(f"No display available: {e}")
+    window.withdraw()
+    yield window
+    window.destroy()
+
+
+def test_conversation_row_builds(root, mock_thread):
+    """Test that a pooled conversation row can be created and bound to a thread."""
+    row = gui.ConversationRow(root)
+    row.show(mock_thread, "user1", "Test message")
+
+    assert row.thread is mock_thread
+    assert row.name_label.cget("text") == "user1"
+
+
+def test_conversation_row_places_labels_without_size(mocker):
+    """Test that row labels never pass width/height to place(), which CTk rejects."""
+    mocker.patch.object(ctk.CTkFrame, "__init__", return_value=None)
+    mocker.patch.object(gui.ConversationRow, "pack_propagate")
+    mocker.patch.object(gui.ConversationRow, "bind")
+    mocker.patch.object(gui, "_font")
+    label = mocker.patch.object(gui.ctk, "CTkLabel")
+
+    gui.ConversationRow(mocker.Mock())
+
+    place_calls = label.return_value.place.call_args_list
+    assert len(place_calls) == 2
+    for call in place_calls:
+        assert not {"width", "height"} & call.kwargs.keys()
+
+
+def test_fetch_error_keeps_pages_already_shown(mocker):
+    """Test that a fetch failing part-way clears the spinner and keeps the fetched pages."""
+    app = mocker.Mock(_fetch_generation=3, messages=[])
+    partial = ["older", "newer"]
+
+    gui.InstagramDMSaverGUI._on_fetch_error(app, 3, "boom", partial)
+
+    app._set_message_status.assert_called_once_with(None)
+    assert app.messages == partial
+    app.save_btn.configure.assert_called_once_with(state="normal")
+    assert "2 messages" in app._notify.call_args.args[1]
+
+
+def test_stale_fetch_error_is_ignored(mocker):
+    """Test that an error from a superseded fetch leaves the current view alone."""
+    app = mocker.Mock(_fetch_generation=4, messages=[])
+
+    gui.InstagramDMSaverGUI._on_fetch_error(app, 3, "boom", ["old"])
+
+    app._set_message_status.assert_not_called()
+    app._notify.assert_not_called()
+    assert app.messages == []
@@ -0,0 +1,46 @@
+"""Tests for logging helpers."""
+
+import logging
+
+import pytest
+
+from instagram_dm_saver.utils.logger import LOG_LEVELS, setup_logger, tail_log
+
+
+@pytest.mark.parametrize("block_size", [8192, 7])
+def test_tail_log_returns_last_lines(mocker, tmp_path, block_size):
+    """Test that the tail matches the end of the file for any block size."""
+    mocker.patch("instagram_dm_saver.utils.logger.TAIL_BLOCK_SIZE", block_size)
+    log_file = tmp_path / "app.log"
+    lines = [f"2024-01-01 - INFO - line {i} é" for i in range(200)]
+    log_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    assert tail_log(log_file, 5) == lines[-5:]
+    assert tail_log(log_file, 500) == lines
+    assert tail_log(log_file, 0) == []
+
+
+def test_tail_log_without_trailing_newline(tmp_path):
+    """Test files that don't end with a newline and empty files."""
+    log_file = tmp_path / "app.log"
+    log_file.write_bytes(b"first\nsecond\nthird")
+    assert tail_log(log_file, 2) == ["second", "third"]
+
+    log_file.write_bytes(b"")
+    assert tail_log(log_file, 3) == []
+
+
+def test_setup_logger_attaches_handlers_once(tmp_path):
+    """Test that setting up the same logger again only updates its level."""
+    logger = setup_logger("idm_test_setup", LOG_LEVELS["INFO"], tmp_path, console_output=False)
+    try:
+        handlers = list(logger.handlers)
+        again = setup_logger("idm_test_setup", LOG_LEVELS["DEBUG"], tmp_path, console_output=False)
+
+        assert again is logger
+        assert logger.handlers == handlers
+        assert logger.level == logging.DEBUG
+    finally:
+        for handler in logger.handlers[:]:
+            handler.close()
+            logger.removeHandler(handler)
@@ -0,0 +1,692 @@
+"""Tests for message management."""
+
+import pytest
+import threading
+from types import SimpleNamespace
+
+from instagram_dm_saver.core import MessageManager
+from instagram_dm_saver.core.messages import (
+    BACKOFF_BASE, BACKOFF_CAP, THROTTLED_BACKOFF_CAP, _backoff_delay, console as messages_console
+)
+
+
+def _message(text, timestamp=0):
+    """Build a minimal message that compares equal by value."""
+    return SimpleNamespace(text=text, timestamp=timestamp)
+
+
+@pytest.fixture
+def clip_item():
+    """Create raw message item with broken clip metadata."""
+    return {
+        "item_id": "item_1",
+        "user_id": 67890,
+        "timestamp": 1700000000000000,
+        "item_type": "clip",
+        "clip": {
+            "clip": {
+                "clips_metadata": {
+                    "original_sound_info": None,
+                    "music_info": None,
+                }
+            }
+        },
+    }
+
+
+def test_clean_media_item_fixes_sound_info(clip_item):
+    """Test that missing original_sound_info is replaced with defaults."""
+    cleaned = MessageManager._clean_media_item(clip_item)
+
+    metadata = cleaned["clip"]["clip"]["clips_metadata"]
+    assert metadata["original_sound_info"]["audio_id"] == ""
+    assert metadata["original_sound_info"]["ig_artist"] == {"username": "", "pk": 0}
+    assert "music_info" not in metadata
+
+
+def test_clean_media_item_fills_partial_sound_info(clip_item):
+    """Test that partial original_sound_info keeps existing values."""
+    metadata = clip_item["clip"]["clip"]["clips_metadata"]
+    metadata["original_sound_info"] = {"audio_id": "123", "ig_artist": {"pk": 5}}
+
+    cleaned = MessageManager._clean_media_item(clip_item)
+
+    sound_info = cleaned["clip"]["clip"]["clips_metadata"]["original_sound_info"]
+    assert sound_info["audio_id"] == "123"
+    assert sound_info["duration_in_ms"] == 0
+    assert sound_info["ig_artist"] == {"username": "", "pk": 5}
+
+
+def test_clean_media_item_unnested_clip(clip_item):
+    """Test cleaning when clips_metadata sits directly under the clip key."""
+    clip_item["clip"] = clip_item["clip"]["clip"]
+
+    cleaned = MessageManager._clean_media_item(clip_item)
+
+    assert cleaned["clip"]["clips_metadata"]["original_sound_info"]["is_explicit"] is False
+
+
+def test_clean_media_item_normalizes_timestamp(clip_item):
+    """Test that microsecond timestamps are converted to seconds."""
+    cleaned = MessageManager._clean_media_item(clip_item)
+
+    assert cleaned["timestamp"] == 1700000000
+
+
+def test_clean_media_item_in_place(clip_item):
+    """Test that cleaning modifies the item in place."""
+    cleaned = MessageManager._clean_media_item(clip_item)
+
+    assert cleaned is clip_item
+
+
+def test_clean_media_item_non_dict():
+    """Test that non-dict items are returned unchanged."""
+    assert MessageManager._clean_media_item(None) is None
+    assert MessageManager._clean_media_item("text") == "text"
+
+
+def test_clean_media_item_skips_text_items():
+    """Test that items without media keys are returned untouched."""
+    item = {"item_id": "item_1", "item_type": "text", "text": "hi", "timestamp": 1700000000123456}
+
+    cleaned = MessageManager._clean_media_item(item)
+
+    assert cleaned is item
+    assert cleaned["timestamp"] == 1700000000123456
+
+
+def test_clean_thread_data_limits_items(clip_item):
+    """Test that thread cleaning keeps at most 20 items."""
+    thread_data = {
+        "thread_id": "thread_123",
+        "items": [dict(clip_item, item_id=f"item_{i}") for i in range(30)],
+    }
+
+    cleaned = MessageManager._clean_thread_data(thread_data)
+
+    assert len(cleaned["items"]) == 20
+    assert cleaned["items"][0]["item_id"] == "item_0"
+
+
+def test_clean_thread_data_custom_limit(clip_item):
+    """Test that thread cleaning honours a custom limit and skips non-dict items."""
+    items = [dict(clip_item, item_id=f"item_{i}") for i in range(5)]
+    thread_data = {"thread_id": "thread_123", "items": [None] + items}
+
+    cleaned = MessageManager._clean_thread_data(thread_data, limit=3)
+
+    assert [item["item_id"] for item in cleaned["items"]] == ["item_0", "item_1"]
+
+
+def test_extract_message_fast_path_matches_extractor():
+    """Test that text items built directly match instagrapi's extractor."""
+    from instagrapi.extractors import extract_direct_message
+
+    item = {
+        "item_id": "item_1",
+        "user_id": 42,
+        "thread_id": "340282366841710300949128",
+        "timestamp": 1700000000123456,
+        "item_type": "text",
+        "text": "Hello",
+        "is_sent_by_viewer": True,
+    }
+
+    expected = extract_direct_message(dict(item))
+    message = MessageManager._extract_message(dict(item))
+
+    assert message.model_dump() == expected.model_dump()
+
+
+def test_extract_message_uses_extractor_for_media(mocker):
+    """Test that non-text items still go through instagrapi's extractor."""
+    extract = mocker.patch("instagram_dm_saver.core.messages.extract_direct_message")
+    item = {"item_id": "item_1", "item_type": "media", "timestamp": 1700000000123456}
+
+    MessageManager._extract_message(item)
+
+    extract.assert_called_once_with(item)
+
+
+def test_select_conversation_by_username(mocker, mock_thread):
+    """Test selecting a conversation by searching a username."""
+    other_user = mocker.Mock(username="Another_Person")
+    other_thread = mocker.Mock(id="thread_456", users=[other_user], messages=[])
+
+    mocker.patch.object(MessageManager, "display_conversations")
+    mocker.patch("instagram_dm_saver.core.messages.Prompt.ask", return_value="another")
+
+    selected = MessageManager.select_conversation([mock_thread, other_thread])
+
+    assert selected is other_thread
+
+
+def test_select_conversation_prefers_exact_username(mocker, mock_thread):
+    """Test that an exact username wins over longer usernames containing it."""
+    exact_thread = mocker.Mock(id="thread_456", users=[mocker.Mock(username="Sam")], messages=[])
+    longer_thread = mocker.Mock(id="thread_789", users=[mocker.Mock(username="samantha")], messages=[])
+
+    mocker.patch.object(MessageManager, "display_conversations")
+    prompt = mocker.patch("instagram_dm_saver.core.messages.Prompt.ask", return_value="sam")
+
+    selected = MessageManager.select_conversation([mock_thread, longer_thread, exact_thread])
+
+    assert selected is exact_thread
+    prompt.assert_called_once()
+
+
+def test_safe_api_preserves_order_and_skips_bad_threads(mocker, mock_client):
+    """Test that the safe API fallback keeps inbox order and skips failures."""
+    mock_client.private_request = mocker.Mock(return_value={
+        "inbox": {"threads": [{"thread_id": str(i)} for i in range(12)]}
+    })
+
+    def fake_extract(data):
+        if data["thread_id"] == "3":
+            raise ValueError("bad thread")
+        return data["thread_id"]
+
+    mocker.patch("instagram_dm_saver.core.messages.extract_direct_thread", side_effect=fake_extract)
+
+    threads = MessageManager(mock_client)._get_conversations_safe_api()
+
+    assert threads == [str(i) for i in range(12) if i != 3]
+
+
+def _batch_response(ids):
+    """Build a raw thread response with the given item IDs."""
+    return {"thread": {"items": [{"item_id": item_id, "text": item_id} for item_id in ids]}}
+
+
+@pytest.fixture
+def fake_extract_message(mocker):
+    """Patch message extraction to return simple mock messages."""
+    def extract(item):
+        message = mocker.Mock(id=item["item_id"], text=item["text"])
+        message.model_dump.return_value = {"id": item["item_id"], "text": item["text"]}
+        return message
+
+    return mocker.patch(
+        "instagram_dm_saver.core.messages.extract_direct_message", side_effect=extract
+    )
+
+
+def test_iter_messages_safe_batch_pages_with_cursor(mocker, mock_client, fake_extract_message):
+    """Test that batches are fetched with the previous batch's cursor."""
+    mock_client.private_request = mocker.Mock(side_effect=[
+        _batch_response(["a", "b"]),
+        _batch_response(["c", "d"]),
+        _batch_response([]),
+    ])
+
+    manager = MessageManager(mock_client)
+    messages = list(manager.iter_messages_safe_batch("thread_123", count=10, batch_size=5))
+
+    assert [m.id for m in messages] == ["a", "b", "c", "d"]
+    second_call = mock_client.private_request.call_args_list[1]
+    assert second_call.kwargs["params"]["cursor"] == "b"
+
+
+def test_iter_messages_safe_batch_stops_parsing_at_count(mocker, mock_client, fake_extract_message):
+    """Test that items beyond the requested count are never parsed."""
+    mock_client.private_request = mocker.Mock(return_value=_batch_response(["a", "b", "c", "d"]))
+
+    manager = MessageManager(mock_client)
+    messages = list(manager.iter_messages_safe_batch("thread_123", count=2, batch_size=5))
+
+    assert [m.id for m in messages] == ["a", "b"]
+    assert fake_extract_message.call_count == 2
+    mock_client.private_request.assert_called_once()
+
+
+def test_iter_messages_safe_batch_skips_duplicates(mocker, mock_client, fake_extract_message):
+    """Test that messages repeated across overlapping pages are yielded once."""
+    mock_client.private_request = mocker.Mock(side_effect=[
+        _batch_response(["a", "b"]),
+        _batch_response(["b", "c"]),
+        _batch_response([]),
+    ])
+
+    manager = MessageManager(mock_client)
+    messages = list(manager.iter_messages_safe_batch("thread_123", count=10, batch_size=5))
+
+    assert [m.id for m in messages] == ["a", "b", "c"]
+
+
+def test_iter_messages_safe_batch_prefetches_next_page(mocker, mock_client, fake_extract_message):
+    """Test that the next page is requested before the current one is parsed."""
+    second_request_sent = threading.Event()
+    responses = iter([_batch_response(["a", "b"]), _batch_response(["c"]), _batch_response([])])
+
+    def private_request(endpoint, params):
+        if params.get("cursor") == "b":
+            second_request_sent.set()
+        return next(responses)
+
+    mock_client.private_request = mocker.Mock(side_effect=private_request)
+    extract = fake_extract_message.side_effect
+
+    def extract_after_prefetch(item):
+        if item["item_id"] == "a":
+            assert second_request_sent.wait(timeout=5)
+        return extract(item)
+
+    fake_extract_message.side_effect = extract_after_prefetch
+
+    manager = MessageManager(mock_client)
+    messages = list(manager.iter_messages_safe_batch("thread_123", count=10, batch_size=5))
+
+    assert [m.id for m in messages] == ["a", "b", "c"]
+
+
+def test_iter_messages_safe_batch_stops_when_circuit_opens(mocker, mock_client):
+    """Test that batch fetching stops as soon as the circuit breaker opens."""
+    from instagram_dm_saver.utils.circuit_breaker import CircuitBreaker
+
+    mock_client.private_request = mocker.Mock(side_effect=RuntimeError("500 server error"))
+    mocker.patch("instagram_dm_saver.core.messages.time.sleep")
+    manager = MessageManager(mock_client)
+    manager.circuit_breaker = CircuitBreaker(failure_threshold=1, sleep_window=60)
+
+    messages = list(manager.iter_messages_safe_batch("thread_123", count=10, batch_size=5))
+
+    assert messages == []
+    assert mock_client.private_request.call_count == 1
+
+
+def test_iter_messages_safe_batch_backs_off_between_failures(mocker, mock_client, fake_extract_message):
+    """Test that failed batches are retried after a jittered delay."""
+    mock_client.private_request = mocker.Mock(side_effect=[
+        RuntimeError("Please wait a few minutes"),
+        _batch_response(["a"]),
+        _batch_response([]),
+    ])
+    sleep = mocker.patch("instagram_dm_saver.core.messages.time.sleep")
+
+    manager = MessageManager(mock_client)
+    messages = list(manager.iter_messages_safe_batch("thread_123", count=10, batch_size=5))
+
+    assert [m.id for m in messages] == ["a"]
+    sleep.assert_called_once()
+    assert BACKOFF_BASE <= sleep.call_args.args[0] <= THROTTLED_BACKOFF_CAP
+
+
+def test_backoff_delay_respects_caps():
+    """Test that decorrelated jitter stays within its bounds."""
+    delay = BACKOFF_BASE
+    for _ in range(50):
+        delay = _backoff_delay(delay)
+        assert BACKOFF_BASE <= delay <= BACKOFF_CAP
+
+    assert _backoff_delay(THROTTLED_BACKOFF_CAP, throttled=True) <= THROTTLED_BACKOFF_CAP
+
+
+def test_fetch_messages_for_threads(mocker, mock_client):
+    """Test concurrent fetching across several conversations."""
+    threads = [mocker.Mock(id=f"thread_{i}") for i in range(3)]
+
+    def direct_messages(thread_id, count):
+        if thread_id == "thread_1":
+            raise RuntimeError("network down")
+        return [_message(f"{thread_id}_msg")]
+
+    mock_client.direct_messages = mocker.Mock(side_effect=direct_messages)
+    mock_client.private_request = mocker.Mock(side_effect=RuntimeError("network down"))
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+    mocker.patch("instagram_dm_saver.core.messages.time.sleep")
+    mocker.patch("instagram_dm_saver.core.messages.clone_client", side_effect=lambda c: c)
+
+    results = MessageManager(mock_client).fetch_messages_for_threads(threads, count=5)
+
+    assert results == {
+        "thread_0": [_message("thread_0_msg")],
+        "thread_1": [],
+        "thread_2": [_message("thread_2_msg")],
+    }
+
+
+def test_fetch_messages_for_threads_sequential_after_throttle(mocker, mock_client):
+    """Test that a throttled conversation is retried once fetching goes sequential."""
+    from instagrapi.exceptions import PleaseWaitFewMinutes
+
+    threads = [mocker.Mock(id=f"thread_{i}") for i in range(3)]
+    throttled_once = []
+
+    def direct_messages(thread_id, count):
+        if thread_id == "thread_1" and not throttled_once:
+            throttled_once.append(thread_id)
+            raise PleaseWaitFewMinutes("Please wait a few minutes")
+        return [_message(f"{thread_id}_msg")]
+
+    mock_client.direct_messages = mocker.Mock(side_effect=direct_messages)
+    mock_client.private_request = mocker.Mock()
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+    mocker.patch("instagram_dm_saver.core.messages.clone_client", side_effect=lambda c: c)
+
+    results = MessageManager(mock_client).fetch_messages_for_threads(threads, count=5)
+
+    assert results == {f"thread_{i}": [_message(f"thread_{i}_msg")] for i in range(3)}
+    mock_client.private_request.assert_not_called()
+
+
+def test_fetch_messages_for_threads_rate_limits_each_fetch(mocker, mock_client):
+    """Test that every conversation fetch, and nothing else, takes a rate limiter slot."""
+    threads = [mocker.Mock(id=f"thread_{i}") for i in range(5)]
+    mock_client.direct_messages = mocker.Mock(
+        side_effect=lambda thread_id, count: [_message(thread_id)]
+    )
+    mocker.patch("instagram_dm_saver.core.messages.clone_client", side_effect=lambda c: c)
+    acquire = mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+
+    MessageManager(mock_client).fetch_messages_for_threads(threads, count=5, max_concurrency=3)
+
+    assert acquire.call_count == len(threads)
+
+
+def test_fetch_messages_for_threads_never_shares_a_client(mocker, mock_client):
+    """Test that concurrent fetches each use their own client, one request at a time."""
+    import time
+
+    threads = [mocker.Mock(id=f"thread_{i}") for i in range(6)]
+    lock = threading.Lock()
+    in_flight = {}
+    overlaps = []
+    clones = []
+
+    def clone(client):
+        worker = mocker.Mock()
+
+        def direct_messages(thread_id, count):
+            with lock:
+                in_flight[id(worker)] = in_flight.get(id(worker), 0) + 1
+                overlaps.append(in_flight[id(worker)] > 1)
+            time.sleep(0.01)
+            with lock:
+                in_flight[id(worker)] -= 1
+            return [_message(f"{thread_id}_msg")]
+
+        worker.direct_messages = mocker.Mock(side_effect=direct_messages)
+        clones.append(worker)
+        return worker
+
+    mocker.patch("instagram_dm_saver.core.messages.clone_client", side_effect=clone)
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+
+    results = MessageManager(mock_client).fetch_messages_for_threads(
+        threads, count=5, max_concurrency=3
+    )
+
+    assert results == {f"thread_{i}": [_message(f"thread_{i}_msg")] for i in range(6)}
+    assert len(clones) == 3
+    assert not any(overlaps)
+    mock_client.direct_messages.assert_not_called()
+
+
+def test_fetch_messages_for_threads_returns_oldest_first(mocker, mock_client):
+    """Test that each conversation's messages come back in chronological order."""
+    newer, older = _message("new", timestamp=2), _message("old", timestamp=1)
+    mock_client.direct_messages = mocker.Mock(return_value=[newer, older])
+    mocker.patch("instagram_dm_saver.core.messages.clone_client", side_effect=lambda c: c)
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+
+    results = MessageManager(mock_client).fetch_messages_for_threads([mocker.Mock(id="t")])
+
+    assert results == {"t": [older, newer]}
+
+
+def test_get_conversations_media_error_uses_fallback(mocker, mock_client):
+    """Test that media validation errors trigger the fallback methods."""
+    mock_client.direct_threads = mocker.Mock(
+        side_effect=ValueError("1 validation error for ClipsMetadata original_sound_info")
+    )
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+    fallback = mocker.patch.object(
+        MessageManager, "_get_conversations_fallback", return_value=["thread"]
+    )
+
+    assert MessageManager(mock_client).get_conversations() == ["thread"]
+    fallback.assert_called_once()
+
+
+def test_get_conversation_by_id(mocker, mock_client):
+    """Test fetching one conversation by ID and mapping its errors."""
+    from instagram_dm_saver.utils.exceptions import ConversationError
+
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+    mock_client.direct_thread = mocker.Mock(return_value="thread")
+    manager = MessageManager(mock_client)
+
+    assert manager.get_conversation("340282") == "thread"
+    mock_client.direct_thread.assert_called_once_with("340282", amount=1)
+
+    mock_client.direct_thread.side_effect = RuntimeError("not found")
+    with pytest.raises(ConversationError):
+        manager.get_conversation("340282")
+
+
+def test_get_conversations_other_error_raises(mocker, mock_client):
+    """Test that unrelated errors are raised as ConversationError."""
+    from instagram_dm_saver.utils.exceptions import ConversationError
+
+    mock_client.direct_threads = mocker.Mock(side_effect=RuntimeError("connection reset"))
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+
+    with pytest.raises(ConversationError):
+        MessageManager(mock_client).get_conversations()
+
+
+def test_display_conversations_truncates_previews(mocker, mock_thread, mock_message):
+    """Test that long last-message previews are cut to the preview width."""
+    print_mock = mocker.patch("instagram_dm_saver.core.messages.console.print")
+    mock_message.text = "x" * 80
+    mock_thread.messages = [mock_message]
+
+    MessageManager.display_conversations([mock_thread])
+
+    preview = print_mock.call_args.args[0].columns[2]._cells[0]
+    assert preview.plain == "x" * 47 + "..."
+
+
+def test_display_messages_renders_single_table(mocker, mock_client, mock_thread, sample_messages):
+    """Test that messages are rendered as one table after the header panel."""
+    from rich.table import Table
+
+    print_mock = mocker.patch("instagram_dm_saver.core.messages.console.print")
+    mocker.patch.object(
+        type(messages_console), "is_terminal", new_callable=mocker.PropertyMock, return_value=True
+    )
+    mock_client.user_info.return_value = mocker.Mock(username="me")
+
+    MessageManager.display_messages(mock_thread, sample_messages, mock_client)
+
+    assert print_mock.call_count == 2
+    table = print_mock.call_args_list[1].args[0]
+    assert isinstance(table, Table)
+    assert table.row_count == len(sample_messages)
+
+
+def test_display_messages_plain_when_not_a_terminal(mocker, mock_client, mock_thread, sample_messages):
+    """Test that redirected output is written as plain lines in one call."""
+    mocker.patch("instagram_dm_saver.core.messages.console.print")
+    out_mock = mocker.patch("instagram_dm_saver.core.messages.console.out")
+    mocker.patch.object(
+        type(messages_console), "is_terminal", new_callable=mocker.PropertyMock, return_value=False
+    )
+
+    MessageManager.display_messages(mock_thread, sample_messages, mock_client)
+
+    out_mock.assert_called_once()
+    lines = out_mock.call_args.args[0].splitlines()
+    assert len(lines) == len(sample_messages)
+    assert lines[0].endswith(f": {sample_messages[0].text}")
+
+
+def test_fetch_messages_returns_oldest_first(mocker, mock_client, mock_thread, sample_messages):
+    """Test that fetched messages are sorted chronologically in place."""
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+    mock_client.direct_messages.return_value = sample_messages
+
+    messages = MessageManager(mock_client).fetch_messages(mock_thread, count=5)
+
+    assert messages is sample_messages
+    assert [m.timestamp for m in messages] == sorted(m.timestamp for m in sample_messages)
+
+
+def test_sort_oldest_first_reverses_or_sorts(sample_messages):
+    """Test that newest-first input is reversed and other orders are sorted."""
+    from instagram_dm_saver.core.messages import _sort_oldest_first
+
+    newest_first = sorted(sample_messages, key=lambda m: m.timestamp, reverse=True)
+    expected = newest_first[::-1]
+
+    _sort_oldest_first(newest_first)
+    assert newest_first == expected
+
+    shuffled = expected[3:] + expected[:3]
+    _sort_oldest_first(shuffled)
+    assert shuffled == expected
+
+
+def test_get_current_username_uses_login_username(mocker, mock_client):
+    """Test that the stored login username avoids a profile request."""
+    assert MessageManager.get_current_username(mock_client) == "test_user"
+    mock_client.user_info.assert_not_called()
+
+    mock_client.username = None
+    mock_client.user_info.return_value = mocker.Mock(username="looked_up")
+    assert MessageManager.get_current_username(mock_client) == "looked_up"
+
+    mock_client.user_info.side_effect = RuntimeError("network down")
+    assert MessageManager.get_current_username(mock_client) == "You"
+
+
+def test_fetch_messages_small_count_single_request(mocker, mock_client, mock_thread, sample_messages):
+    """Test that small fetches skip the probe request."""
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+    mock_client.direct_messages.return_value = sample_messages
+
+    MessageManager(mock_client).fetch_messages(mock_thread, count=15)
+
+    mock_client.direct_messages.assert_called_once_with("thread_123", 15)
+
+
+def _thread_page(item_ids, oldest_cursor=None):
+    """Build a direct_v2 thread page response with plain text items."""
+    return {"thread": {
+        "items": [
+            {"item_id": item_id, "item_type": "text", "user_id": 1,
+             "timestamp": 1700000000000000 + i, "text": item_id}
+            for i, item_id in enumerate(item_ids)
+        ],
+        "thread_id": "123",
+        "oldest_cursor": oldest_cursor,
+    }}
+
+
+def test_fetch_messages_large_count_probes_then_pages(mocker, mock_client, mock_thread, sample_messages):
+    """Test that large fetches probe first, then page through the thread."""
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+    mock_client.direct_messages.return_value = sample_messages
+    mock_client.private_request = mocker.Mock(side_effect=[
+        _thread_page(["a", "b"], oldest_cursor="c1"),
+        _thread_page(["c", "d"]),
+    ])
+
+    messages = MessageManager(mock_client).fetch_messages(mock_thread, count=500)
+
+    mock_client.direct_messages.assert_called_once_with("thread_123", 10)
+    assert sorted(m.id for m in messages) == ["a", "b", "c", "d"]
+    cursors = [c.kwargs["params"].get("cursor") for c in mock_client.private_request.call_args_list]
+    assert cursors == [None, "c1"]
+
+
+def test_fetch_messages_pipelined_stops_at_count(mocker, mock_client):
+    """Test that paging stops once enough messages have been collected."""
+    mock_client.private_request = mocker.Mock(side_effect=[
+        _thread_page(["a", "b", "c"], oldest_cursor="c1"),
+        _thread_page(["d", "e", "f"], oldest_cursor="c2"),
+    ])
+
+    messages = MessageManager(mock_client)._fetch_messages_pipelined("thread_123", 5)
+
+    assert [m.id for m in messages] == ["a", "b", "c", "d", "e"]
+    assert {m.thread_id for m in messages} == {123}
+    assert mock_client.private_request.call_count == 2
+
+
+def test_iter_message_batches_yields_each_page(mocker, mock_client, mock_thread):
+    """Test that each page is yielded as soon as it is parsed."""
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+    mock_client.private_request = mocker.Mock(side_effect=[
+        _thread_page(["b", "a"], oldest_cursor="c1"),
+        _thread_page(["d", "c"]),
+    ])
+
+    batches = MessageManager(mock_client).iter_message_batches(mock_thread, count=10)
+
+    assert sorted(m.id for m in next(batches)) == ["a", "b"]
+    assert mock_client.private_request.call_count == 2
+    assert sorted(m.id for m in next(batches)) == ["c", "d"]
+    assert next(batches, None) is None
+
+
+def test_iter_message_batches_media_error_skips_yielded(mocker, mock_client, mock_thread):
+    """Test that the safe batch fallback resumes without repeating yielded messages."""
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+    mock_client.private_request = mocker.Mock(side_effect=[
+        _thread_page(["a", "b"], oldest_cursor="c1"),
+        ValueError("validation error for ReplyMessage"),
+    ])
+    # Newest first, as the API returns them
+    safe_messages = [
+        mocker.Mock(id=message_id, timestamp=-i) for i, message_id in enumerate("abcde")
+    ]
+    mocker.patch.object(
+        MessageManager, "iter_messages_safe_batch", return_value=iter(safe_messages)
+    )
+
+    batches = list(
+        MessageManager(mock_client).iter_message_batches(mock_thread, count=4, batch_size=20)
+    )
+
+    assert [m.id for m in batches[1]] == ["d", "c"]
+    assert len(batches) == 2
+
+
+def test_iter_message_batches_tolerates_missing_thread(mocker, mock_client, mock_thread):
+    """Test that a response without thread or items ends the fetch instead of raising."""
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+    mock_client.private_request = mocker.Mock(side_effect=[
+        _thread_page(["a"], oldest_cursor="c1"),
+        {"status": "ok"},
+    ])
+
+    batches = list(MessageManager(mock_client).iter_message_batches(mock_thread, count=10))
+
+    assert [[m.id for m in batch] for batch in batches] == [["a"], []]
+
+
+def test_fetch_messages_media_error_uses_safe_batches(mocker, mock_client, mock_thread, sample_messages):
+    """Test that media validation errors fall back to safe batch fetching."""
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+    mock_client.direct_messages.side_effect = ValueError("2 validation errors for ReplyMessage")
+    safe_batch = mocker.patch.object(
+        MessageManager, "_fetch_messages_safe_batch", return_value=sample_messages
+    )
+
+    messages = MessageManager(mock_client).fetch_messages(mock_thread, count=5)
+
+    assert messages is sample_messages
+    safe_batch.assert_called_once_with("thread_123", 5)
+
+
+def test_fetch_messages_other_error_raises(mocker, mock_client, mock_thread):
+    """Test that unrelated errors are reported as MessageFetchError."""
+    from instagram_dm_saver.utils.exceptions import MessageFetchError
+
+    mocker.patch("instagram_dm_saver.utils.rate_limiter.RateLimiter.wait_if_needed")
+    mock_client.direct_messages.side_effect = RuntimeError("connection reset")
+
+    with pytest.raises(MessageFetchError):
+        MessageManager(mock_client).fetch_messages(mock_thread, count=5)
@@ -0,0 +1,31 @@
+"""Tests for the substring search index."""
+
+from instagram_dm_saver.utils.search import SearchIndex
+
+
+def test_search_index_finds_items_in_order():
+    """Test that matches come back once each, in index order, case-insensitively."""
+    index = SearchIndex([("a", "Alice bob"), ("b", "carol"), ("c", "BOBBY bob"), ("d", "dave")])
+
+    assert index.search("bob") == ["a", "c"]
+    assert index.search("ROL") == ["b"]
+    assert index.search("zed") == []
+    assert len(index) == 4
+
+
+def test_search_index_does_not_match_across_keys():
+    """Test that a term spanning two adjacent keys is not a match."""
+    index = SearchIndex([("a", "ab"), ("b", "cd")])
+
+    assert index.search("bc") == []
+    assert index.search("b\x00c") == []
+
+
+def test_search_index_empty_term_and_unicode():
+    """Test that an empty term returns everything and non-ASCII keys map correctly."""
+    index = SearchIndex([("a", "Zoë"), ("b", "Émile"), ("c", "zoe")])
+
+    assert index.search("") == ["a", "b", "c"]
+    assert index.search("émi") == ["b"]
+    assert index.search("zo") == ["a", "c"]
+    assert SearchIndex().search("x") == []
@@ -0,0 +1,47 @@
+"""Tests for JSON serialization helpers."""
+
+import json
+
+from instagram_dm_saver.utils.serialization import dumps, loads
+
+
+def test_dumps_returns_bytes():
+    """Test that serialized output is UTF-8 bytes."""
+    data = dumps({"username": "test_user"})
+
+    assert isinstance(data, bytes)
+    assert json.loads(data) == {"username": "test_user"}
+
+
+def test_dumps_indent():
+    """Test pretty-printed output."""
+    data = dumps({"a": 1, "b": [1, 2]}, indent=True)
+
+    assert b"\n  " in data
+    assert json.loads(data) == {"a": 1, "b": [1, 2]}
+
+
+def test_round_trip_unicode():
+    """Test round-tripping non-ASCII text."""
+    original = {"text": "héllo 👋", "count": 3, "flag": False, "none": None}
+
+    assert loads(dumps(original)) == original
+
+
+def test_loads_accepts_str():
+    """Test that string input is accepted as well as bytes."""
+    assert loads('{"key": "value"}') == {"key": "value"}
+
+
+def test_loads_accepts_memoryview():
+    """Test that buffer input (e.g. a view over an mmap) is accepted."""
+    assert loads(memoryview(b'{"key": [1, 2]}')) == {"key": [1, 2]}
+
+
+def test_dumps_default_handles_unknown_types():
+    """Test that the default hook is used for non-serializable values."""
+    class Url:
+        def __str__(self):
+            return "https://example.com"
+
+    assert loads(dumps({"url": Url()}, default=str)) == {"url": "https://example.com"}
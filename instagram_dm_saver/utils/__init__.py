@@ -10,11 +10,19 @@ from .exceptions import (
     StorageError,
     ConfigurationError,
     RateLimitError,
+    CircuitOpenError,
     CredentialError,
     ExportError,
 )
-from .logger import setup_logger, get_logger
+from .logger import LOG_LEVELS, setup_logger, get_logger, tail_log
 from .rate_limiter import RateLimiter, instagram_rate_limiter
+from .circuit_breaker import CircuitBreaker
+from .serialization import dumps, loads
+from .formatting import (
+    format_date, format_time, format_datetime, build_username_map, media_info, media_label,
+    media_url,
+)
+from .search import SearchIndex
 
 __all__ = [
     # Exceptions
@@ -27,12 +35,30 @@ __all__ = [
     "StorageError",
     "ConfigurationError",
     "RateLimitError",
+    "CircuitOpenError",
     "CredentialError",
     "ExportError",
     # Logger
+    "LOG_LEVELS",
     "setup_logger",
     "get_logger",
+    "tail_log",
     # Rate limiter
     "RateLimiter",
     "instagram_rate_limiter",
+    # Circuit breaker
+    "CircuitBreaker",
+    # Serialization
+    "dumps",
+    "loads",
+    # Formatting
+    "format_date",
+    "format_time",
+    "format_datetime",
+    "build_username_map",
+    "media_info",
+    "media_label",
+    "media_url",
+    # Search
+    "SearchIndex",
 ]
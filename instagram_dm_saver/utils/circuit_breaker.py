@@ -0,0 +1,156 @@
+"""Circuit breaker for failing Instagram API calls."""
+
+import threading
+import time
+from collections import deque
+from functools import wraps
+from typing import Callable, Any
+
+from .logger import get_logger
+from .exceptions import CircuitOpenError
+
+logger = get_logger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Stop calling an endpoint that keeps failing.
+
+    The breaker starts closed. Once ``failure_threshold`` failures happen
+    within ``window`` seconds it opens and rejects calls immediately. After
+    ``sleep_window`` seconds it goes half-open and lets ``half_open_probes``
+    calls through: a success closes it again, a failure reopens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        window: float = 30.0,
+        sleep_window: float = 10.0,
+        half_open_probes: int = 1
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Failures within the window that open the circuit
+            window: Time window in seconds for counting failures
+            sleep_window: Seconds to stay open before probing again
+            half_open_probes: Calls allowed through while half-open
+        """
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.sleep_window = sleep_window
+        self.half_open_probes = half_open_probes
+        self.failure_times: deque = deque()
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the sleep window passes."""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        """Return the state, applying the open -> half-open timeout. Caller holds the lock."""
+        if self._state == self.OPEN and time.time() - self._opened_at >= self.sleep_window:
+            self._state = self.HALF_OPEN
+            self._probes_in_flight = 0
+            logger.info("Circuit breaker half-open, probing")
+        return self._state
+
+    def _open(self) -> None:
+        """Open the circuit. Caller holds the lock."""
+        self._state = self.OPEN
+        self._opened_at = time.time()
+        self.failure_times.clear()
+        logger.warning(f"Circuit breaker opened, rejecting calls for {self.sleep_window:.0f}s")
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a call may go through, reserving a probe when half-open.
+
+        Returns:
+            True if the call should be made
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and self._probes_in_flight < self.half_open_probes:
+                self._probes_in_flight += 1
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                logger.info("Circuit breaker closed")
+            self._state = self.CLOSED
+            self.failure_times.clear()
+
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._open()
+                return
+
+            current_time = time.time()
+            self.failure_times.append(current_time)
+            while self.failure_times and current_time - self.failure_times[0] > self.window:
+                self.failure_times.popleft()
+
+            if len(self.failure_times) >= self.failure_threshold:
+                self._open()
+
+    def call(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Call a function through the breaker.
+
+        Args:
+            func: Function to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result of func
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if not self.allow_request():
+            raise CircuitOpenError("Circuit breaker is open; skipping call")
+
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+
+        self.record_success()
+        return result
+
+    def __call__(self, func: Callable) -> Callable:
+        """
+        Decorator to route every call of a function through the breaker.
+
+        Args:
+            func: Function to protect
+
+        Returns:
+            Wrapped function
+        """
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return self.call(func, *args, **kwargs)
+
+        return wrapper
@@ -46,6 +46,11 @@ class RateLimitError(InstagramDMError):
     pass
 
 
+class CircuitOpenError(InstagramDMError):
+    """Raised when a call is rejected because the circuit breaker is open."""
+    pass
+
+
 class CredentialError(InstagramDMError):
     """Raised when credential operations fail."""
     pass
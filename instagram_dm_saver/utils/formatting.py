@@ -0,0 +1,142 @@
+"""Formatting helpers for message listings and exports."""
+
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# (media_type, thumbnail_url, video_url) as returned by media_info
+MediaInfo = Tuple[int, Optional[str], Optional[str]]
+
+MEDIA_TYPE_IMAGE = 1
+MEDIA_TYPE_VIDEO = 2
+
+# Display names for the media types that carry a URL worth showing
+MEDIA_TYPE_NAMES = {MEDIA_TYPE_IMAGE: "Image", MEDIA_TYPE_VIDEO: "Video"}
+
+
+@lru_cache(maxsize=4096)
+def format_date(day: date, fmt: str = "%Y-%m-%d") -> str:
+    """
+    Format a calendar date, caching the result.
+
+    Conversations span relatively few distinct days, so nearly every call
+    is a cache hit instead of a trip through strftime.
+
+    Args:
+        day: Date to format
+        fmt: strftime format string
+
+    Returns:
+        Formatted date
+    """
+    return day.strftime(fmt)
+
+
+def format_time(timestamp: datetime, seconds: bool = True) -> str:
+    """
+    Format the time of day as HH:MM:SS (or HH:MM).
+
+    Args:
+        timestamp: Timestamp to format
+        seconds: Whether to include seconds
+
+    Returns:
+        Time string equivalent to ``strftime("%H:%M:%S")`` or ``strftime("%H:%M")``
+    """
+    if not seconds:
+        return f"{timestamp.hour:02d}:{timestamp.minute:02d}"
+    return f"{timestamp.hour:02d}:{timestamp.minute:02d}:{timestamp.second:02d}"
+
+
+def format_datetime(timestamp: datetime) -> str:
+    """
+    Format a timestamp as YYYY-MM-DD HH:MM:SS.
+
+    Args:
+        timestamp: Timestamp to format
+
+    Returns:
+        Datetime string equivalent to ``strftime("%Y-%m-%d %H:%M:%S")``
+    """
+    return f"{format_date(timestamp.date())} {format_time(timestamp)}"
+
+
+def build_username_map(
+    users: Iterable[Any],
+    current_user_id: Any = None,
+    current_username: str = "You"
+) -> Dict[Any, str]:
+    """
+    Map user IDs to usernames for a conversation.
+
+    Args:
+        users: Conversation participants (objects with ``pk`` and ``username``)
+        current_user_id: ID of the logged-in account, if known
+        current_username: Name to show for the logged-in account
+
+    Returns:
+        Dict of user ID to username
+    """
+    usernames = {user.pk: user.username for user in users}
+    if current_user_id:
+        usernames[current_user_id] = current_username
+    return usernames
+
+
+def media_info(msg: Any) -> Optional[MediaInfo]:
+    """
+    Read a message's media fields in one pass.
+
+    Args:
+        msg: DirectMessage (or any object with an optional ``media`` attribute)
+
+    Returns:
+        Tuple of (media_type, thumbnail_url, video_url), or None if the
+        message has no typed media
+    """
+    media = getattr(msg, "media", None)
+    if not media:
+        return None
+
+    media_type = getattr(media, "media_type", None)
+    if media_type is None:
+        return None
+
+    return (
+        media_type,
+        getattr(media, "thumbnail_url", None),
+        getattr(media, "video_url", None),
+    )
+
+
+def media_label(info: Optional[MediaInfo]) -> str:
+    """
+    Describe media as "[Image: url]" or "[Video: url]".
+
+    Args:
+        info: Result of media_info
+
+    Returns:
+        Description, or an empty string for no media or other media types
+    """
+    if info is None:
+        return ""
+
+    name = MEDIA_TYPE_NAMES.get(info[0])
+    if name is None:
+        return ""
+    return f"[{name}: {media_url(info) or 'No URL'}]"
+
+
+def media_url(info: MediaInfo) -> Optional[str]:
+    """
+    Pick the URL that represents a piece of media.
+
+    Args:
+        info: Result of media_info (not None)
+
+    Returns:
+        Video URL for videos, thumbnail URL for everything else
+    """
+    media_type, thumbnail_url, video_url = info
+    return video_url if media_type == MEDIA_TYPE_VIDEO else thumbnail_url
@@ -1,11 +1,24 @@
 """Logging configuration for Instagram DM Fetcher."""
 
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 from logging.handlers import RotatingFileHandler
 
+# Bytes read per step when scanning a log file backwards
+TAIL_BLOCK_SIZE = 8192
+
+# Logging level for each level name accepted in the configuration
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
 
 def setup_logger(
     name: str = "instagram_dm_saver",
@@ -82,6 +95,42 @@ def setup_logger(
     return logger
 
 
+def tail_log(log_file: Path, num_lines: int) -> List[str]:
+    """
+    Read the last lines of a log file without loading the whole file.
+
+    The file is read backwards in TAIL_BLOCK_SIZE blocks until enough
+    newlines have been seen, so the cost depends on the number of lines
+    requested rather than on the size of the log.
+
+    Args:
+        log_file: Path to the log file
+        num_lines: Number of lines to return
+
+    Returns:
+        Up to num_lines lines, oldest first, without line endings
+    """
+    if num_lines <= 0:
+        return []
+
+    blocks = []
+    newlines = 0
+    with open(log_file, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+
+        # One newline more than requested, since the file usually ends with one
+        while position > 0 and newlines <= num_lines:
+            step = min(TAIL_BLOCK_SIZE, position)
+            position -= step
+            f.seek(position)
+            block = f.read(step)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+
+    data = b"".join(reversed(blocks))
+    return data.decode("utf-8", errors="replace").splitlines()[-num_lines:]
+
+
 def get_logger(name: str = "instagram_dm_saver") -> logging.Logger:
     """
     Get existing logger or create new one.
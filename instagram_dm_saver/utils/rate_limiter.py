@@ -1,5 +1,6 @@
 """Rate limiting for Instagram API calls."""
 
+import threading
 import time
 from functools import wraps
 from typing import Callable, Any
@@ -29,6 +30,7 @@ class RateLimiter:
         self.max_calls = max_calls
         self.time_window = time_window
         self.call_times: deque = deque()
+        self._lock = threading.Lock()
         logger.debug(f"RateLimiter initialized: {max_calls} calls per {time_window}s")
 
     def _clean_old_calls(self) -> None:
@@ -67,8 +69,11 @@ class RateLimiter:
         """
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            self.wait_if_needed()
-            self.add_call()
+            # Serialize the check-and-record step so concurrent callers
+            # cannot exceed the limit together
+            with self._lock:
+                self.wait_if_needed()
+                self.add_call()
             return func(*args, **kwargs)
 
         return wrapper
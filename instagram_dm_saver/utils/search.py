@@ -0,0 +1,74 @@
+"""Substring search over a precompiled bytes buffer."""
+
+from array import array
+from bisect import bisect_right
+from typing import Any, Iterable, List, Tuple
+
+# Separates the keys in the buffer; search terms never contain it
+SEPARATOR = b"\x00"
+
+
+class SearchIndex:
+    """
+    Case-insensitive substring index over a list of items.
+
+    Every item's search key is lowercased, encoded and joined into a single
+    bytes buffer, so a query is a handful of C-level ``bytes.find`` calls
+    instead of a Python loop over every key. ``_starts`` records where each
+    key begins, which maps a match offset back to its item with a bisect.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[Any, str]] = ()):
+        """
+        Build the index.
+
+        Args:
+            entries: (item, search key) pairs, in the order results should keep
+        """
+        self._items: List[Any] = []
+        self._starts = array("I")
+        chunks = []
+        offset = 0
+
+        for item, key in entries:
+            encoded = key.lower().encode("utf-8")
+            self._items.append(item)
+            self._starts.append(offset)
+            chunks.append(encoded)
+            offset += len(encoded) + len(SEPARATOR)
+
+        self._blob = SEPARATOR.join(chunks)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def search(self, term: str) -> List[Any]:
+        """
+        Find the items whose key contains a term.
+
+        Args:
+            term: Substring to look for (case-insensitive)
+
+        Returns:
+            Matching items in index order; every item for an empty term
+        """
+        needle = term.lower().encode("utf-8")
+        if not needle:
+            return list(self._items)
+        if SEPARATOR in needle:
+            return []
+
+        blob = self._blob
+        starts = self._starts
+        matches = []
+        position = blob.find(needle)
+        while position >= 0:
+            index = bisect_right(starts, position) - 1
+            matches.append(self._items[index])
+
+            # Skip the rest of this key so an item is reported once
+            if index + 1 == len(starts):
+                break
+            position = blob.find(needle, starts[index + 1])
+
+        return matches
@@ -0,0 +1,58 @@
+"""JSON serialization helpers with optional orjson acceleration."""
+
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+
+def dumps(
+    obj: Any,
+    indent: bool = False,
+    default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON bytes.
+
+    Uses orjson when available and falls back to the standard library.
+
+    Args:
+        obj: Object to serialize
+        indent: Whether to pretty-print with two-space indentation
+        default: Called for objects that are not natively serializable
+
+    Returns:
+        JSON document as bytes
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=default, option=option)
+
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        ensure_ascii=False,
+        default=default,
+    ).encode("utf-8")
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: JSON document as bytes, a buffer (e.g. a view over an mmap) or str
+
+    Returns:
+        Deserialized object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
@@ -54,6 +54,9 @@ setup(
             "customtkinter>=5.0.0",
             "pillow>=10.0.0",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+        ],
     },
     entry_points={
         "console_scripts": [